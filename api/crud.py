@@ -2,13 +2,15 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func
 from .models import (
     Usuario, TipoUsuario, Turma, Cadastro, Materia,
-    Nivel, TipoAjuda, Questao, SelecionarJogo
+    Nivel, TipoAjuda, Questao, SelecionarJogo, Pontuacao
 )
 from .schemas import (
     UsuarioCreate, TipoUsuarioCreate, TurmaCreate, CadastroCreate,
     MateriaCreate, NivelCreate, TipoAjudaCreate, QuestaoCreate,
-    SelecionarJogoCreate, 
+    SelecionarJogoCreate, PontuacaoCreate
 )
+from jogo.question_search import QuestionSearch, SearchIndexError
+from .database import QUIZ_BANCO_DB
 from typing import List, Optional
 from datetime import datetime
 
@@ -135,6 +137,9 @@ class CRUDTipoAjuda:
 # ---- CRUD QUESTÕES ----
 
 class CRUDQuestao:
+    def __init__(self):
+        self.busca = QuestionSearch(QUIZ_BANCO_DB)  # Índice FTS5 do banco de perguntas do jogo
+
     def criar_questao(self, db: Session, questao: QuestaoCreate):
         db_questao = Questao(**questao.dict())
         db.add(db_questao)
@@ -150,6 +155,22 @@ class CRUDQuestao:
                 SelecionarJogo.Nivel_idNivel == nivel_id,
                 SelecionarJogo.Turma_codigoTurma == turma_id
             ).all()
+
+    def buscar_questoes_por_texto(self, texto: str, nivel: Optional[str], materia: Optional[str], pagina: int, por_pagina: int):
+        resultados, tem_proxima = self.busca.search(texto, nivel, materia, pagina, por_pagina)
+        return {
+            "pagina": pagina,
+            "por_pagina": por_pagina,
+            "tem_proxima": tem_proxima,
+            "resultados": [
+                {
+                    "id": r["id"], "enunciado": r["text"], "alternativas": r["answers"],
+                    "respostaCorreta": r["correct_answer"], "dica": r["tip"], "materia": r["subject"],
+                    "nivel": r["level"], "trecho": r["excerpt"], "relevancia": -r["score"],
+                }
+                for r in resultados
+            ],
+        }
     
 
 # ---- CRUD SELECIONAR JOGO ----
@@ -168,4 +189,36 @@ class CRUDSelecionarJogo:
         ).all()
     
     def buscar_selecionar_jogo_por_id(self, db: Session, id_selecionar_jogo: int):
-        return db.query(SelecionarJogo).filter(SelecionarJogo.idSelecionarJogo == id_selecionar_jogo).first()
\ No newline at end of file
+        return db.query(SelecionarJogo).filter(SelecionarJogo.idSelecionarJogo == id_selecionar_jogo).first()
+
+
+# ---- CRUD PONTUAÇÃO ----
+
+class CRUDPontuacao:
+    def criar_pontuacao(self, db: Session, pontuacao: PontuacaoCreate):
+        db_pontuacao = Pontuacao(
+            usuario_id=pontuacao.Usuario_idUsuario,
+            pontos=pontuacao.pontuacao,
+            materia_id=pontuacao.Materia_idMateria,
+            nivel_id=pontuacao.Nivel_idNivel,
+        )
+        db.add(db_pontuacao)
+        db.commit()
+        db.refresh(db_pontuacao)
+        return db_pontuacao
+
+    def listar_ranking(self, db: Session, k: int, nivel_id: Optional[int] = None, materia_id: Optional[int] = None):
+        # Soma e ordena no banco (índice por nível, matéria e usuário): cada requisição, em
+        # qualquer worker da API, vê as pontuações já gravadas, sem placar em memória compartilhado
+        total = func.sum(Pontuacao.pontos).label("total")
+        consulta = db.query(Pontuacao.usuario_id, total)
+        if nivel_id is not None:
+            consulta = consulta.filter(Pontuacao.nivel_id == nivel_id)
+            if materia_id is not None:
+                consulta = consulta.filter(Pontuacao.materia_id == materia_id)
+        linhas = consulta.group_by(Pontuacao.usuario_id).order_by(total.desc(), Pontuacao.usuario_id).limit(k).all()
+        return [
+            # No MySQL, SUM devolve Decimal
+            {"posicao": posicao, "Usuario_idUsuario": usuario_id, "pontuacao": int(pontos)}
+            for posicao, (usuario_id, pontos) in enumerate(linhas, start=1)
+        ]
@@ -9,6 +9,9 @@ load_dotenv()  # Carrega variáveis de ambiente do arquivo .env
 # Conexão com o banco de dados propriamente dita a partir da URL
 DATABASE_URL = os.getenv("DATABASE_URL")
 
+# Banco SQLite de perguntas do jogo (mantido pelo perguntas/criar_banco_sqlite.py), usado na busca textual
+QUIZ_BANCO_DB = os.getenv("QUIZ_BANCO_DB", os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "jogo", "quiz_banco.db"))
+
 # "Engine" gerencia conexões com o banco de dados
 engine = create_engine(
     DATABASE_URL,
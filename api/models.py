@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey, Text, CHAR
+from sqlalchemy import Column, String, Integer, Boolean, DateTime, ForeignKey, Text, CHAR, Index
 from sqlalchemy.orm import relationship, declarative_base
 from datetime import datetime
 
@@ -103,6 +103,9 @@ class Pontuacao(Base):
 
     usuario = relationship("Usuario", back_populates="pontuacoes") # Relacionamento com a tabela Usuario
 
+    # Ranking por nível/matéria (GET /ranking/) soma os pontos de cada usuário só pelo índice
+    __table_args__ = (Index('idx_pontuacao_nivel_materia_usuario', 'nivel_id', 'materia_id', 'usuario_id', 'pontos'),)
+
 # Cadastro dos Usuários
 class Cadastro(Base):
     __tablename__ = 'cadastro_usuario'
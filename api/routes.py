@@ -145,6 +145,18 @@ class QuestaoRoutes:
         @router.get("/questoes/", response_model=list[QuestaoCreate])
         def buscar_questoes(materia_id: int, nivel_id: int, turma_id: int, db: Session = Depends(get_db)):
             return self.crud.buscar_questoes_por_materia_nivel_e_turma(db, materia_id, nivel_id, turma_id)
+
+        @router.get("/questoes/busca", response_model=QuestaoBuscaPagina)
+        def buscar_questoes_por_texto(q: str, nivel: Optional[str] = None, materia: Optional[str] = None, pagina: int = 1, por_pagina: int = 20):
+            if not q.strip():
+                raise HTTPException(status_code=400, detail="q não pode ser vazio")
+            if pagina < 1 or not 1 <= por_pagina <= 100:
+                raise HTTPException(status_code=400, detail="pagina deve ser maior que zero e por_pagina entre 1 e 100")
+            try:
+                return self.crud.buscar_questoes_por_texto(q, nivel, materia, pagina, por_pagina)
+            except SearchIndexError as e:
+                # Banco de perguntas sem o índice: a API não o cria (só o importador escreve no banco)
+                raise HTTPException(status_code=503, detail=f"Busca indisponível: {e}")
         
 
 # ---- ROTAS SELECIONAR JOGO ----
@@ -159,6 +171,25 @@ class SelecionarJogoRoutes:
             return self.crud.listar_jogos_usuario(db, usuario_id)
         
 
+# ---- ROTAS PONTUAÇÃO ----
+
+class PontuacaoRoutes:
+    def __init__(self, crud: CRUDPontuacao):
+        self.crud = crud
+
+    def register_routes(self, router: APIRouter):
+        @router.post("/pontuacoes/")
+        def criar_pontuacao(pontuacao: PontuacaoCreate, db: Session = Depends(get_db)):
+            db_pontuacao = self.crud.criar_pontuacao(db, pontuacao)
+            return {"id": db_pontuacao.id}
+
+        @router.get("/ranking/", response_model=list[RankingEntry])
+        def listar_ranking(k: int = 10, nivel_id: Optional[int] = None, materia_id: Optional[int] = None, db: Session = Depends(get_db)):
+            if k < 1:
+                raise HTTPException(status_code=400, detail="k deve ser maior que zero")
+            return self.crud.listar_ranking(db, k, nivel_id, materia_id)
+        
+
 # ---- FUNÇÂO DE REGISTRO GERAL ----
 
 def registar_todas_rotas():
@@ -170,4 +201,5 @@ def registar_todas_rotas():
     NivelRoutes(CRUDNivel()).register_routes(router)
     TipoAjudaRoutes(CRUDTipoAjuda()).register_routes(router)
     QuestaoRoutes(CRUDQuestao()).register_routes(router)
-    SelecionarJogoRoutes(CRUDSelecionarJogo()).register_routes(router)
\ No newline at end of file
+    SelecionarJogoRoutes(CRUDSelecionarJogo()).register_routes(router)
+    PontuacaoRoutes(CRUDPontuacao()).register_routes(router)
\ No newline at end of file
@@ -132,6 +132,11 @@ class PontuacaoResponse(PontuacaoBase):
     class Config:
         from_attributes = True
 
+class RankingEntry(BaseModel):    # Linha do placar (top-K por nível/matéria)
+    posicao: int                  # Posição no placar (1 = primeiro)
+    Usuario_idUsuario: str        # Usuário
+    pontuacao: int                # Soma dos pontos do usuário no placar
+
 
 # ----QUESTÃO----
 
@@ -152,6 +157,23 @@ class QuestaoResponse(QuestaoBase):    # Resposta inclui ID da questão
     class Config:
         from_attributes = True
 
+class QuestaoBuscaResultado(BaseModel):    # Questão encontrada na busca textual (banco SQLite do jogo)
+    id: int
+    enunciado: str
+    alternativas: dict[str, str]            # Letra -> texto da alternativa
+    respostaCorreta: str
+    dica: Optional[str] = None
+    materia: str
+    nivel: str
+    trecho: str                             # Trecho com os termos buscados entre colchetes
+    relevancia: float                       # Maior é mais relevante
+
+class QuestaoBuscaPagina(BaseModel):    # Uma página da busca, em ordem de relevância
+    pagina: int
+    por_pagina: int
+    tem_proxima: bool
+    resultados: List[QuestaoBuscaResultado]
+
 # ----SELECIONAR JOGO----
 
 class SelecionarJogoBase(BaseModel):
@@ -94,7 +94,7 @@ class LoginApp(ctk.CTk):
 
     def abrir_jogo(self, usuario):
         self.withdraw()
-        jogo = Game()
+        jogo = Game(player_name=usuario)  # Pontos do ranking vão para o usuário logado
         jogo.run()
         self.deiconify()
 
@@ -0,0 +1,135 @@
+# Manifesto declarativo dos assets do jogo e de quais telas usam cada um.
+#
+# As imagens são carregadas sob demanda (no primeiro acesso ao atributo em Assets)
+# ou decodificadas antecipadamente numa thread quando a tela que as usa está
+# prestes a ser aberta (ver SCENE_PREFETCH).
+
+FONT_PATH = "assets/Font.ttf"
+MUSIC_PATH = "assets/mainmenu.mp3"
+
+# Atributo -> especificação da imagem.
+# "scale": escala proporcional; "size": tamanho fixo; "raw": sem redimensionar;
+# "alpha": False usa convert() em vez de convert_alpha() (imagens opacas).
+# Sem "scale", "size" ou "raw", usa o tamanho padrão de botão (225x90).
+IMAGES = {
+    "background": {"path": "images/background.png", "raw": True, "alpha": False},
+    "logo_img": {"path": "images/logo.png", "raw": True},
+    "matematica_img": {"path": "images/matematica.png", "scale": 0.4},
+    "portugues_img": {"path": "images/portugues.png", "scale": 0.4},
+    "ingles_img": {"path": "images/ingles.png", "scale": 0.4},
+    "humanas_img": {"path": "images/humanas.png", "scale": 0.4},
+    "naturais_img": {"path": "images/naturais.png", "scale": 0.4},
+    "start_img": {"path": "images/botao_iniciar.png", "scale": 0.18},
+    "start_disabled_img": {"path": "images/start_disabled.png", "scale": 0.18},
+    "ranking_img": {"path": "images/ranking.png", "scale": 0.18},
+    "back_img": {"path": "images/botao_voltar.png", "scale": 0.18},
+    "options_img": {"path": "images/botao_opcoes.png"},
+    "exit_img": {"path": "images/botao_sair.png"},
+    "music_img": {"path": "images/botao_musica.png"},
+    "sound_img": {"path": "images/botao_som.png"},
+    "fullscreen_img": {"path": "images/botao_tela.png"},
+    "fundamental_img": {"path": "images/fundamental.png", "scale": 0.5},
+    "medio_img": {"path": "images/medio.png", "scale": 0.5},
+    "right_arrow_img": {"path": "images/right_arrow.png", "size": (104, 104)},
+    "left_arrow_img": {"path": "images/left_arrow.png", "size": (104, 104)},
+    "rankingblock_img": {"path": "images/rankingblock.png"},
+    "botao_dica0_img": {"path": "images/botao_dica0.png", "size": (180, 80)},
+    "botao_dica1_img": {"path": "images/botao_dica1.png", "size": (180, 80)},
+    "botao_dica2_img": {"path": "images/botao_dica2.png", "size": (180, 80)},
+    "botao_dica3_img": {"path": "images/botao_dica3.png", "size": (180, 80)},
+    "botao_eliminar0_img": {"path": "images/botao_eliminar0.png", "size": (180, 80)},
+    "botao_eliminar1_img": {"path": "images/botao_eliminar1.png", "size": (180, 80)},
+    "botao_eliminar2_img": {"path": "images/botao_eliminar2.png", "size": (180, 80)},
+    "botao_eliminar3_img": {"path": "images/botao_eliminar3.png", "size": (180, 80)},
+    "botao_pular0_img": {"path": "images/botao_pular0.png", "size": (180, 80)},
+    "botao_pular1_img": {"path": "images/botao_pular1.png", "size": (180, 80)},
+    "botao_pular2_img": {"path": "images/botao_pular2.png", "size": (180, 80)},
+    "botao_pular3_img": {"path": "images/botao_pular3.png", "size": (180, 80)},
+    "jogar_img": {"path": "images/botao_jogar.png"},
+    "answer_a_img": {"path": "images/answer_a.png", "size": (516, 80)},
+    "answer_b_img": {"path": "images/answer_b.png", "size": (516, 80)},
+    "answer_c_img": {"path": "images/answer_c.png", "size": (516, 80)},
+    "answer_d_img": {"path": "images/answer_d.png", "size": (516, 80)},
+    "question_box_img": {"path": "images/question_box.png", "size": (968, 214)},
+    "tip_box_img": {"path": "images/tip_box.png", "size": (461, 346)},
+    "checkbox_on": {"path": "images/checkbox_on.png", "size": (50, 50)},
+    "checkbox_off": {"path": "images/checkbox_off.png", "size": (50, 50)},
+    "parabens_img": {"path": "images/parabens.png", "raw": True, "alpha": False},
+}
+
+# Famílias de imagens empacotadas numa única folha (gerada com "python -m jogo.atlas").
+# Cada imagem continua descrita em IMAGES; em tempo de execução Assets entrega uma
+# subsurface da folha. Se a folha não existir ou estiver desatualizada, a imagem é
+# carregada do arquivo original.
+ATLASES = {
+    "botoes_atlas": {
+        "path": "images/atlas/botoes.png",
+        "layout": "images/atlas/botoes.json",
+        "images": [
+            "botao_pular0_img", "botao_pular1_img", "botao_pular2_img", "botao_pular3_img",
+            "botao_dica0_img", "botao_dica1_img", "botao_dica2_img", "botao_dica3_img",
+            "botao_eliminar0_img", "botao_eliminar1_img", "botao_eliminar2_img", "botao_eliminar3_img",
+            "answer_a_img", "answer_b_img", "answer_c_img", "answer_d_img",
+            "checkbox_on", "checkbox_off", "right_arrow_img", "left_arrow_img",
+        ],
+    },
+}
+
+# Botões de ajuda e suas imagens por vidas restantes: Assets.help_button_images[botão][vidas]
+HELP_BUTTONS = ("pular", "dica", "eliminar")
+HELP_LIVES = 3
+HELP_BUTTON_IMAGES = {
+    button: tuple(f"botao_{button}{lives}_img" for lives in range(HELP_LIVES + 1))
+    for button in HELP_BUTTONS
+}
+
+# Atributo -> tamanho da fonte (todas usam FONT_PATH)
+FONTS = {
+    "font": 74,
+    "volume_font": 48,
+    "small_font": 24,
+    "medium_font": 36,
+    "large_font": 48,
+    "answer_font": 16,
+}
+
+# Atributo -> arquivo de efeito sonoro
+SOUNDS = {
+    "click_sound": "assets/button.mp3",
+}
+
+# Assets que cada tela usa (a tela só é construída quando todos estão prontos)
+SCENE_ASSETS = {
+    "main_menu": ["background", "logo_img", "jogar_img", "options_img", "exit_img"],
+    "options_menu": [
+        "background", "font", "music_img", "sound_img", "fullscreen_img", "back_img",
+        "checkbox_on", "checkbox_off",
+    ],
+    "subjects_menu": [
+        "background", "large_font", "fundamental_img", "medio_img", "matematica_img",
+        "portugues_img", "ingles_img", "naturais_img", "humanas_img", "start_img",
+        "start_disabled_img", "ranking_img", "back_img", "checkbox_on", "checkbox_off",
+    ],
+    "ranking_screen": [
+        "background", "font", "small_font", "large_font", "back_img", "left_arrow_img", "right_arrow_img",
+    ],
+    "game_screen": [
+        "background", "medium_font", "small_font", "answer_font", "question_box_img",
+        "answer_a_img", "answer_b_img", "answer_c_img", "answer_d_img",
+        "botao_pular0_img", "botao_pular1_img", "botao_pular2_img", "botao_pular3_img",
+        "botao_dica0_img", "botao_dica1_img", "botao_dica2_img", "botao_dica3_img",
+        "botao_eliminar0_img", "botao_eliminar1_img", "botao_eliminar2_img", "botao_eliminar3_img",
+        "right_arrow_img", "left_arrow_img", "tip_box_img", "parabens_img",
+    ],
+    "loading_screen": ["background", "small_font"],
+}
+
+# Telas que provavelmente serão abertas a seguir: seus PNGs são decodificados em segundo plano
+SCENE_PREFETCH = {
+    "main_menu": ["subjects_menu", "options_menu"],
+    "subjects_menu": ["game_screen", "ranking_screen"],
+    "options_menu": [],
+    "ranking_screen": [],
+    "game_screen": [],
+    "loading_screen": [],
+}
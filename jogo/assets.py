@@ -1,85 +1,198 @@
+import queue
+import threading
+
 import pygame
-from jogo.button import Button
+from jogo.text_renderer import TextRenderer
+from jogo.glyph_cache import GlyphCache
+from jogo.surface_cache import SurfaceCache
+from jogo import asset_manifest, atlas, config
+
+# Reference surfaces for convert() when there is no display surface (texture backend)
+_ALPHA_FORMAT = pygame.Surface((1, 1), pygame.SRCALPHA, 32)
+_OPAQUE_FORMAT = pygame.Surface((1, 1), 0, 32)
+
+DEFAULT_VOLUME = 0.2  # Initial volume for music and effects (same default as the options menu)
 
 class Assets:
-    # Manages loading/scaling of game assets
+    # Manages lazy loading/scaling of game assets described in asset_manifest.
+    # Images are loaded on first attribute access, or decoded ahead of time on a
+    # worker thread (prefetch); convert()/convert_alpha() always run on the main thread.
+    # Images packed in an atlas (asset_manifest.ATLASES) are subsurfaces of its sheet.
     def __init__(self):
-        self.load_fonts()
-        self.load_images()
-        self.load_sounds()
-        pygame.mixer.music.set_volume(0.1)
-        self.click_sound.set_volume(0.1)
-
-    def load_images(self):
-        # Load background and UI images
-        self.background = pygame.image.load("images/background.png").convert()
-        self.logo_img = pygame.image.load("images/logo.png").convert_alpha()
-        self.matematica_img = self.load_scaled("images/matematica.png", scale=0.4)
-        self.portugues_img = self.load_scaled("images/portugues.png", scale=0.4)
-        self.ingles_img = self.load_scaled("images/ingles.png", scale=0.4)
-        self.humanas_img = self.load_scaled("images/humanas.png", scale=0.4)
-        self.naturais_img = self.load_scaled("images/naturais.png", scale=0.4)
-        self.start_img = self.load_scaled("images/botao_iniciar.png", scale=0.18)
-        self.start_disabled_img = self.load_scaled("images/start_disabled.png", scale=0.18)
-        self.ranking_img = self.load_scaled("images/ranking.png", scale=0.18)
-        self.back_img = self.load_scaled("images/botao_voltar.png", scale=0.18)
-        self.options_img = self.load_scaled("images/botao_opcoes.png")
-        self.exit_img = self.load_scaled("images/botao_sair.png")
-        self.music_img = self.load_scaled("images/botao_musica.png")
-        self.sound_img = self.load_scaled("images/botao_som.png")
-        self.fullscreen_img = self.load_scaled("images/botao_tela.png")
-        self.fundamental_img = self.load_scaled("images/fundamental.png", scale=0.5)
-        self.medio_img = self.load_scaled("images/medio.png", scale=0.5)
-        self.right_arrow_img = self.load_scaled("images/right_arrow.png", width=104, height=104)
-        self.left_arrow_img = self.load_scaled("images/left_arrow.png", width=104, height=104)
-        self.tip_box_img = self.load_scaled("images/tip_box.png")
-        self.rankingblock_img = self.load_scaled("images/rankingblock.png")
-        self.botao_dica0_img = self.load_scaled("images/botao_dica0.png", width=180, height=80)
-        self.botao_dica1_img = self.load_scaled("images/botao_dica1.png", width=180, height=80)
-        self.botao_dica2_img = self.load_scaled("images/botao_dica2.png", width=180, height=80)
-        self.botao_dica3_img = self.load_scaled("images/botao_dica3.png", width=180, height=80)
-        self.botao_eliminar0_img = self.load_scaled("images/botao_eliminar0.png", width=180, height=80)
-        self.botao_eliminar1_img = self.load_scaled("images/botao_eliminar1.png", width=180, height=80)
-        self.botao_eliminar2_img = self.load_scaled("images/botao_eliminar2.png", width=180, height=80)
-        self.botao_eliminar3_img = self.load_scaled("images/botao_eliminar3.png", width=180, height=80)
-        self.botao_pular0_img = self.load_scaled("images/botao_pular0.png", width=180, height=80)
-        self.botao_pular1_img = self.load_scaled("images/botao_pular1.png", width=180, height=80)
-        self.botao_pular2_img = self.load_scaled("images/botao_pular2.png", width=180, height=80)
-        self.botao_pular3_img = self.load_scaled("images/botao_pular3.png", width=180, height=80)
-        self.jogar_img = self.load_scaled("images/botao_jogar.png")
-        self.answer_a_img = self.load_scaled("images/answer_a.png", width=516, height=80)
-        self.answer_b_img = self.load_scaled("images/answer_b.png", width=516, height=80)
-        self.answer_c_img = self.load_scaled("images/answer_c.png", width=516, height=80)
-        self.answer_d_img = self.load_scaled("images/answer_d.png", width=516, height=80)
-        self.question_box_img = self.load_scaled("images/question_box.png", width=968, height=214)
-        self.tip_box_img = self.load_scaled("images/tip_box.png", width=461, height=346)
-        self.checkbox_on = self.load_scaled("images/checkbox_on.png", width=50, height=50)
-        self.checkbox_off = self.load_scaled("images/checkbox_off.png", width=50, height=50)
-        self.parabens_img = pygame.image.load("images/parabens.png").convert()
-
-    def load_sounds(self):
-        # Load music and sound effects
-        pygame.mixer.music.load("assets/mainmenu.mp3")
-        pygame.mixer.music.play(-1)  # loop music
-        self.click_sound = pygame.mixer.Sound("assets/button.mp3")
-
-    def load_fonts(self):
-        # Load fonts
-        self.font = pygame.font.Font("assets/Font.ttf", 74)
-        self.volume_font = pygame.font.Font("assets/Font.ttf", 48)
-        self.small_font = pygame.font.Font("assets/Font.ttf", 24)
-        self.medium_font = pygame.font.Font("assets/Font.ttf", 36)
-        self.large_font = pygame.font.Font("assets/Font.ttf", 48)
-        self.answer_font = pygame.font.Font("assets/Font.ttf", 16)
+        self.text_renderer = TextRenderer()  # Layout/renderização de texto com cache, compartilhado pelas telas
+        self.glyph_cache = GlyphCache()  # Glifos de dígitos/separadores para compor números sem font.render
+        self._decoded = {}  # Attribute -> decoded surface waiting for convert() on the main thread
+        self._pending = set()  # Attributes queued or being decoded by the worker
+        self._condition = threading.Condition()
+        self._queue = queue.Queue()
+        self._worker = None
+        # Scaled surfaces saved as raw pixels on disk (skips PNG decode + resample on later launches)
+        self.surface_cache = SurfaceCache(config.SURFACE_CACHE_DIR) if config.SURFACE_CACHE else None
+        self._atlas_entries = atlas.load_layouts()  # Image attribute -> (atlas name, rect in the sheet)
+        self._music_loaded = False  # pygame.mixer.music.load() already called (see start_music)
+
+    def __getattr__(self, name):
+        # Called only for attributes not loaded yet: load the asset on demand
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if name in self._atlas_entries:
+            atlas_name, rect = self._atlas_entries[name]
+            self.__dict__[name] = getattr(self, atlas_name).subsurface(rect)
+        elif name in asset_manifest.IMAGES or name in asset_manifest.ATLASES:
+            self.__dict__[name] = self._finish_image(name)
+        elif name == "help_button_images":
+            # Typed lookup: help_button_images[button][lives remaining]
+            self.__dict__[name] = {
+                button: tuple(getattr(self, image) for image in images)
+                for button, images in asset_manifest.HELP_BUTTON_IMAGES.items()
+            }
+        elif name in asset_manifest.FONTS:
+            self.__dict__[name] = pygame.font.Font(asset_manifest.FONT_PATH, asset_manifest.FONTS[name])
+        elif name in asset_manifest.SOUNDS:
+            self.__dict__[name] = self._load_sound(name)
+        else:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        return self.__dict__[name]
+
+    def start_music(self, volume=DEFAULT_VOLUME):
+        # Start background music (after the first frame, so it doesn't delay it); the file is
+        # loaded on the first call, which may come from the options menu when JOGO_MUSIC=0.
+        # Returns False if the music can't be played (missing file, no mixer)
+        try:
+            if not self._music_loaded:
+                pygame.mixer.music.load(asset_manifest.MUSIC_PATH)
+                self._music_loaded = True
+            pygame.mixer.music.set_volume(volume)
+            pygame.mixer.music.play(-1)  # loop music
+        except pygame.error as e:
+            print(f"Assets: não foi possível tocar {asset_manifest.MUSIC_PATH} ({e})")
+            return False
+        return True
+
+    def is_loaded(self, name):
+        return name in self.__dict__
+
+    def is_ready(self, scene_name):
+        # True if every image of the scene is loaded or already decoded by the worker
+        with self._condition:
+            return all(
+                name in self.__dict__ or self._source(name) in self.__dict__ or self._source(name) in self._decoded
+                for name in asset_manifest.SCENE_ASSETS[scene_name]
+                if name in asset_manifest.IMAGES
+            )
+
+    def load_scene(self, scene_name):
+        # Make sure every asset used by the scene is loaded (blocks if still decoding)
+        for name in asset_manifest.SCENE_ASSETS[scene_name]:
+            getattr(self, name)
+
+    def prefetch(self, scene_name):
+        # Queue the scene's images to be decoded and scaled on the worker thread
+        with self._condition:
+            for name in asset_manifest.SCENE_ASSETS[scene_name]:
+                if name not in asset_manifest.IMAGES:
+                    continue
+                name = self._source(name)  # Atlas images: decode the whole sheet once
+                if name in self.__dict__ or name in self._decoded or name in self._pending:
+                    continue
+                self._pending.add(name)
+                self._queue.put(name)
+        if self._worker is None:
+            self._worker = threading.Thread(target=self._decode_worker, name="asset-decoder", daemon=True)
+            self._worker.start()
+
+    def _decode_worker(self):
+        # Worker thread: only decodes PNGs and resamples (no display-dependent calls)
+        while True:
+            name = self._queue.get()
+            try:
+                surface = self.decode_image(self._spec(name), self.surface_cache)
+            except Exception as e:
+                print(f"Assets: falha ao decodificar '{name}' em segundo plano: {e}")
+                surface = None
+            with self._condition:
+                if surface is not None:
+                    self._decoded[name] = surface
+                self._pending.discard(name)
+                self._condition.notify_all()
+
+    def _finish_image(self, name):
+        # Main thread: take the worker's result (waiting if it's in progress) or decode now
+        with self._condition:
+            while name in self._pending:
+                self._condition.wait()
+            surface = self._decoded.pop(name, None)
+        spec = self._spec(name)
+        if surface is None:
+            surface = self.decode_image(spec, self.surface_cache)
+        return self.convert(surface, spec.get("alpha", True))
+
+    @staticmethod
+    def convert(surface, alpha=True):
+        # Convert to the pixel format used for fast blits. The texture backend has no
+        # pygame.display surface, so convert to the canvas' 32-bit format instead
+        if pygame.display.get_surface() is not None:
+            return surface.convert_alpha() if alpha else surface.convert()
+        return surface.convert(_ALPHA_FORMAT if alpha else _OPAQUE_FORMAT)
+
+    def _source(self, name):
+        # Name of what has to be decoded to get this image (its atlas, or the image itself)
+        entry = self._atlas_entries.get(name)
+        return entry[0] if entry else name
+
+    @staticmethod
+    def _spec(name):
+        if name in asset_manifest.ATLASES:
+            return {"path": asset_manifest.ATLASES[name]["path"], "raw": True}
+        return asset_manifest.IMAGES[name]
+
+    @staticmethod
+    def decode_image(spec, cache=None):
+        # Decode the image file and scale it as described in the manifest,
+        # reusing the on-disk cache when the source file hasn't changed
+        pixel_format = "RGBA" if spec.get("alpha", True) else "RGB"
+        size_key = Assets._size_key(spec)
+        if cache is not None:
+            surface = cache.load(spec["path"], size_key, pixel_format)
+            if surface is not None:
+                return surface
+
+        img = pygame.image.load(spec["path"])
+        if not spec.get("raw"):
+            img = Assets._scale(img, spec.get("size"), spec.get("scale"))
+        if cache is not None:
+            cache.store(spec["path"], size_key, pixel_format, img)
+        return img
+
+    @staticmethod
+    def _size_key(spec):
+        # Target size part of the cache key (final size depends on the source only when scaling by a factor)
+        if spec.get("raw"):
+            return ("raw",)
+        if spec.get("scale") is not None:
+            return ("scale", spec["scale"])
+        if spec.get("size") is not None:
+            return ("size",) + tuple(spec["size"])
+        return ("size", 225, 90)
+
+    def _load_sound(self, name):
+        sound = pygame.mixer.Sound(asset_manifest.SOUNDS[name])
+        sound.set_volume(DEFAULT_VOLUME)
+        return sound
 
     def load_scaled(self, path, width=None, height=None, scale=None):
         # Load image and scale (proportional or fixed)
-        img = pygame.image.load(path).convert_alpha()
+        size = (width, height) if width is not None and height is not None else None
+        spec = {"path": path, "size": size, "scale": scale}
+        return self.convert(self.decode_image(spec, self.surface_cache), True)
+
+    @staticmethod
+    def _scale(img, size=None, scale=None):
         if scale is not None:
             width = int(img.get_width() * scale)
             height = int(img.get_height() * scale)
-        elif width is not None and height is not None:
-            pass  # fixed size
+        elif size is not None:
+            width, height = size  # fixed size
         else:
             width, height = 225, 90  # default size
-        return pygame.transform.scale(img, (width, height))
\ No newline at end of file
+        return pygame.transform.scale(img, (width, height))
@@ -0,0 +1,143 @@
+# Atlas de texturas: empacota famílias de imagens do manifesto numa única folha.
+#
+# A folha (PNG) e o layout (JSON com o retângulo de cada imagem) são gerados na
+# instalação, a partir da raiz do projeto:
+#     python -m jogo.atlas
+# Em tempo de execução, Assets carrega só a folha e entrega subsurfaces dela; se uma
+# imagem original ou sua especificação mudou depois disso, o atlas é gerado de novo.
+import argparse
+import hashlib
+import json
+import os
+
+import pygame
+from jogo import asset_manifest
+
+LAYOUT_VERSION = 2
+SHEET_WIDTH = 1024  # Largura máxima da folha (as imagens são organizadas em prateleiras)
+PADDING = 2  # Espaço entre imagens (evita que bordas vizinhas "vazem" ao escalar a folha)
+
+
+def _normalized_spec(spec):
+    # Especificação no formato em que fica no JSON (tuplas viram listas)
+    return json.loads(json.dumps(spec))
+
+
+def _source_stamp(spec):
+    # Tamanho e SHA-1 do arquivo original (o mtime muda a cada checkout; o conteúdo, não)
+    try:
+        with open(spec["path"], "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    return [len(data), hashlib.sha1(data).hexdigest()]
+
+
+def pack(sizes, sheet_width=SHEET_WIDTH, padding=PADDING):
+    """Distribui retângulos em prateleiras. Recebe {nome: (l, a)}, retorna ({nome: Rect}, (l, a))."""
+    width = max([sheet_width] + [w + padding for w, _h in sizes.values()])
+    rects = {}
+    x = y = shelf_height = 0
+    # Mais altas primeiro: cada prateleira desperdiça menos espaço
+    for name, (w, h) in sorted(sizes.items(), key=lambda item: (-item[1][1], -item[1][0], item[0])):
+        if x + w > width:
+            x = 0
+            y += shelf_height + padding
+            shelf_height = 0
+        rects[name] = pygame.Rect(x, y, w, h)
+        x += w + padding
+        shelf_height = max(shelf_height, h)
+    return rects, (width, y + shelf_height)
+
+
+def build_atlas(atlas_name):
+    """Gera a folha e o layout de um atlas do manifesto. Retorna o tamanho da folha."""
+    from jogo.assets import Assets
+
+    atlas = asset_manifest.ATLASES[atlas_name]
+    images = {name: Assets.decode_image(asset_manifest.IMAGES[name]) for name in atlas["images"]}
+    rects, sheet_size = pack({name: img.get_size() for name, img in images.items()})
+
+    sheet = pygame.Surface(sheet_size, pygame.SRCALPHA, 32)
+    sheet.fill((0, 0, 0, 0))
+    for name, img in images.items():
+        sheet.blit(img, rects[name])
+
+    os.makedirs(os.path.dirname(atlas["path"]), exist_ok=True)
+    pygame.image.save(sheet, atlas["path"])
+    layout = {
+        "version": LAYOUT_VERSION,
+        "size": list(sheet_size),
+        "images": {
+            name: {
+                "rect": list(rects[name]),
+                "spec": _normalized_spec(asset_manifest.IMAGES[name]),
+                "source": _source_stamp(asset_manifest.IMAGES[name]),
+            }
+            for name in atlas["images"]
+        },
+    }
+    with open(atlas["layout"], "w", encoding="utf-8") as f:
+        json.dump(layout, f, indent=2, ensure_ascii=False)
+    return sheet_size
+
+
+def _read_layout(atlas):
+    # Layout gerado na versão atual (com a folha no disco), ou None
+    try:
+        with open(atlas["layout"], "r", encoding="utf-8") as f:
+            layout = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if layout.get("version") != LAYOUT_VERSION or not os.path.exists(atlas["path"]):
+        return None
+    return layout
+
+
+def _valid_rects(atlas, layout):
+    # Imagem -> Rect na folha, só para as que não mudaram (especificação e arquivo original)
+    rects = {}
+    for name in atlas["images"]:
+        entry = layout["images"].get(name) if layout is not None else None
+        spec = asset_manifest.IMAGES[name]
+        if entry and entry["spec"] == _normalized_spec(spec) and entry.get("source") == _source_stamp(spec):
+            rects[name] = pygame.Rect(entry["rect"])
+    return rects
+
+
+def load_layouts(rebuild=True):
+    """Lê os layouts gerados. Retorna {imagem: (atlas, Rect)} só para imagens válidas.
+
+    Um atlas ausente ou com imagens desatualizadas (especificação ou arquivo
+    original mudou desde a geração) é gerado de novo. Se não der para gerar
+    (ex.: pasta sem permissão de escrita), essas imagens ficam de fora e são
+    carregadas individualmente.
+    """
+    entries = {}
+    for atlas_name, atlas in asset_manifest.ATLASES.items():
+        rects = _valid_rects(atlas, _read_layout(atlas))
+        if rebuild and len(rects) < len(atlas["images"]):
+            try:
+                build_atlas(atlas_name)
+            except (OSError, pygame.error) as e:
+                print(f"Atlas: não foi possível gerar '{atlas_name}' ({e}); as imagens serão carregadas individualmente")
+            else:
+                rects = _valid_rects(atlas, _read_layout(atlas))
+        for name, rect in rects.items():
+            entries[name] = (atlas_name, rect)
+    return entries
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gera as folhas de atlas das famílias de botões do jogo.")
+    parser.add_argument("atlases", nargs="*", help="atlas a gerar (padrão: todos do manifesto)")
+    args = parser.parse_args()
+
+    for atlas_name in args.atlases or asset_manifest.ATLASES:
+        width, height = build_atlas(atlas_name)
+        count = len(asset_manifest.ATLASES[atlas_name]["images"])
+        print(f"{atlas_name}: {count} imagens em {width}x{height} -> {asset_manifest.ATLASES[atlas_name]['path']}")
+
+
+if __name__ == "__main__":
+    main()
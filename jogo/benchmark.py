@@ -0,0 +1,212 @@
+# Benchmark sem monitor: roda o jogo com os drivers "dummy" do SDL, simula os
+# cliques de um roteiro fixo e mede o tempo de cada frame por tela.
+#
+# Uso (a partir da raiz do projeto):
+#     python -m jogo.benchmark --output antes.json
+#     python -m jogo.benchmark --output depois.json --compare antes.json
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+import pygame
+from jogo.frame_scheduler import FrameScheduler, percentile
+
+# Pontos de clique (dentro dos botões de cada tela)
+JOGAR = (447, 280)
+OPCOES = (447, 430)
+SOM = (447, 400)
+VOLTAR = (30, 670)
+FUNDAMENTAL = (170, 160)
+MATEMATICA = (75, 410)
+PORTUGUES = (425, 410)
+RANKING = (490, 670)
+INICIAR = (930, 670)
+SETA_POPUP = (540, 507)  # Seta do popup de feedback (centralizada abaixo do popup)
+
+# Roteiro: cada passo consome um ou mais frames
+#   ("idle", n)          n frames sem eventos
+#   ("move", [pos...])   um MOUSEMOTION por frame
+#   ("click", pos)       MOUSEBUTTONDOWN + MOUSEBUTTONUP no mesmo frame
+#   ("wait_scene", nome) frames sem eventos até a tela ficar no topo
+#   ("answer", None)     clique na resposta certa da pergunta atual (a partida vai até o fim)
+SCRIPT = [
+    ("wait_scene", "main_menu"), ("idle", 30),
+    ("move", [(x, 300) for x in range(300, 760, 20)]),
+    ("click", OPCOES), ("wait_scene", "options_menu"), ("idle", 15),
+    ("click", SOM), ("idle", 5), ("click", SOM), ("idle", 5),
+    ("click", VOLTAR), ("wait_scene", "main_menu"), ("idle", 10),
+    ("click", JOGAR), ("wait_scene", "subjects_menu"), ("idle", 30),
+    ("click", FUNDAMENTAL), ("idle", 5), ("click", MATEMATICA), ("idle", 5), ("click", PORTUGUES), ("idle", 5),
+    ("click", RANKING), ("wait_scene", "ranking_screen"), ("idle", 60),
+    ("click", VOLTAR), ("wait_scene", "subjects_menu"), ("idle", 10),
+    ("click", INICIAR), ("wait_scene", "game_screen"), ("idle", 30),
+] + [
+    # Partida: responde e segue pela seta do popup (a seta só aceita cliques após 500 ms)
+    step for _round in range(6)
+    for step in (("answer", None), ("idle", 20), ("click", SETA_POPUP), ("idle", 10))
+]
+
+WAIT_SCENE_MAX_FRAMES = 300
+
+
+def _scene_stats(times):
+    times = sorted(times)
+    return {
+        "frames": len(times),
+        "mean_ms": sum(times) / len(times) * 1000,
+        "p50_ms": percentile(times, 50) * 1000,
+        "p95_ms": percentile(times, 95) * 1000,
+        "p99_ms": percentile(times, 99) * 1000,
+        "max_ms": times[-1] * 1000,
+    }
+
+
+class ScriptedScheduler(FrameScheduler):
+    """FrameScheduler que nunca bloqueia: entrega os eventos do roteiro e mede cada frame."""
+
+    def __init__(self, steps, fps, idle_timeout_ms):
+        super().__init__(fps=fps, idle_timeout_ms=idle_timeout_ms)
+        self.game = None  # Definido pelo Game em attach() (para saber a tela do topo)
+        self.frame_times = {}  # Nome da tela -> tempos (s) dos frames desenhados nela
+        self._steps = iter(steps)
+        self._pending_frames = []  # Eventos dos próximos frames do passo atual
+        self._waiting_for = None
+        self._waited = 0
+
+    def attach(self, game):
+        self.game = game
+
+    def wait_events(self, animating=False):
+        now = time.perf_counter()
+        top = self.game.scene_name(self.game.scenes.top)
+        if self._frame_start is not None and top is not None:
+            self.frame_times.setdefault(top, []).append(now - self._frame_start)
+        for event in self._next_frame_events(top):
+            pygame.event.post(event)
+        return super().wait_events(animating=True)
+
+    def _correct_answer_pos(self):
+        # Centro do botão da resposta certa na tela do jogo
+        screen = self.game.scenes.top
+        key = screen.current_question_data["correct_answer"]
+        return screen.answer_buttons[key].rect.center
+
+    def _next_frame_events(self, top):
+        while True:
+            if self._waiting_for is not None:
+                if top == self._waiting_for:
+                    self._waiting_for = None
+                    continue
+                self._waited += 1
+                if self._waited > WAIT_SCENE_MAX_FRAMES:
+                    raise RuntimeError(f"Benchmark: a tela '{self._waiting_for}' não apareceu")
+                return []
+            if self._pending_frames:
+                return self._pending_frames.pop(0)
+            step = next(self._steps, None)
+            if step is None:
+                return [pygame.event.Event(pygame.QUIT)]
+            kind, arg = step
+            if kind == "idle":
+                self._pending_frames = [[] for _ in range(arg)]
+            elif kind == "move":
+                self._pending_frames = [[pygame.event.Event(pygame.MOUSEMOTION, pos=pos, rel=(0, 0), buttons=(0, 0, 0))] for pos in arg]
+            elif kind in ("click", "answer"):
+                pos = self._correct_answer_pos() if kind == "answer" else arg
+                self._pending_frames = [[
+                    pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=1),
+                    pygame.event.Event(pygame.MOUSEBUTTONUP, pos=pos, button=1),
+                ]]
+            elif kind == "wait_scene":
+                self._waiting_for = arg
+                self._waited = 0
+            else:
+                raise ValueError(f"Benchmark: passo desconhecido '{kind}'")
+
+
+def run_benchmark(script=SCRIPT, seed=1234):
+    """Roda o roteiro no jogo real e retorna o relatório (dicionário)."""
+    from jogo import config
+    from jogo.game import Game
+
+    scheduler = ScriptedScheduler(script, fps=config.FPS, idle_timeout_ms=config.IDLE_TIMEOUT_MS)
+    game = Game(scheduler=scheduler, seed=seed)  # Mesmas perguntas sorteadas a cada execução
+    started = time.perf_counter()
+    game.run()
+    elapsed = time.perf_counter() - started
+
+    frame_times = scheduler.frame_times
+    all_times = [t for times in frame_times.values() for t in times]
+    return {
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "pygame": pygame.version.ver,
+        "sdl": ".".join(str(v) for v in pygame.get_sdl_version()),
+        "machine": platform.platform(),
+        "backend": config.RENDER_BACKEND,
+        "dirty_rects": config.DIRTY_RECTS,
+        "fps_limit": config.FPS,
+        "seed": seed,
+        "elapsed_s": elapsed,
+        "all": _scene_stats(all_times) if all_times else None,
+        "scenes": {name: _scene_stats(times) for name, times in sorted(frame_times.items())},
+    }
+
+
+def print_comparison(report, baseline):
+    # Tabela com a variação de média e p95 por tela em relação a um relatório anterior
+    print(f"{'tela':<16}{'média (ms)':>22}{'p95 (ms)':>22}")
+    for name, stats in report["scenes"].items():
+        old = baseline.get("scenes", {}).get(name)
+        if old is None:
+            print(f"{name:<16}{stats['mean_ms']:>22.2f}{stats['p95_ms']:>22.2f}")
+            continue
+        mean = f"{old['mean_ms']:.2f} -> {stats['mean_ms']:.2f}"
+        p95 = f"{old['p95_ms']:.2f} -> {stats['p95_ms']:.2f}"
+        print(f"{name:<16}{mean:>22}{p95:>22}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mede o tempo de frame das telas do jogo sem monitor.")
+    parser.add_argument("--output", default="benchmark_report.json", help="arquivo JSON do relatório")
+    parser.add_argument("--compare", help="relatório anterior para comparar")
+    parser.add_argument("--backend", choices=["surface", "texture"], help="backend de apresentação")
+    parser.add_argument("--seed", type=int, default=1234, help="semente do sorteio das perguntas")
+    parser.add_argument("--no-dirty-rects", action="store_true", help="atualiza a janela inteira a cada frame")
+    args = parser.parse_args()
+
+    # Configuração precisa estar no ambiente antes de importar jogo.config e iniciar o pygame
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+    os.environ["JOGO_MUSIC"] = "0"
+    if args.backend:
+        os.environ["JOGO_RENDER_BACKEND"] = args.backend
+    if args.no_dirty_rects:
+        os.environ["JOGO_DIRTY_RECTS"] = "0"
+
+    # As partidas gravam no ranking e nas estatísticas das perguntas: usa bancos temporários
+    # para não alterar os reais (e sortear as mesmas perguntas a cada execução)
+    from jogo import config
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config.RANKING_DB = os.path.join(tmp_dir, "ranking.db")
+        config.QUESTION_STATS_DB = os.path.join(tmp_dir, "question_stats.db")
+        report = run_benchmark(seed=args.seed)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    for name, stats in report["scenes"].items():
+        print(f"{name:<16} {stats['frames']:>5} frames  média {stats['mean_ms']:.2f} ms  p95 {stats['p95_ms']:.2f} ms  p99 {stats['p99_ms']:.2f} ms")
+    print(f"Relatório salvo em {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            print_comparison(report, json.load(f))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
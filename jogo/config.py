@@ -0,0 +1,73 @@
+# Configurações do jogo, ajustáveis por variáveis de ambiente (útil para testar nas máquinas do laboratório)
+import os
+
+
+def _env_flag(name, default):
+    # Lê uma variável de ambiente booleana ("0", "false", "no" desligam)
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.strip().lower() not in ("0", "false", "no", "off", "")
+
+
+# Envia ao display apenas as regiões que mudaram (dirty rectangles) em vez da janela inteira
+DIRTY_RECTS = _env_flag("JOGO_DIRTY_RECTS", True)
+
+# Backend de apresentação: "surface" (pygame.display) ou "texture" (pygame._sdl2, janela redimensionável)
+RENDER_BACKEND = os.environ.get("JOGO_RENDER_BACKEND", "surface").strip().lower()
+
+# No backend "texture", usa o renderer por software do SDL mesmo se houver GPU
+RENDER_SOFTWARE = _env_flag("JOGO_RENDER_SOFTWARE", False)
+
+# Limite de quadros por segundo de todas as telas
+FPS = int(os.environ.get("JOGO_FPS", "30"))
+
+# Tempo máximo (ms) que uma tela parada espera por eventos antes de redesenhar
+IDLE_TIMEOUT_MS = int(os.environ.get("JOGO_IDLE_TIMEOUT_MS", "500"))
+
+# Toca a música de fundo (desligada pelo benchmark, que roda sem placa de som)
+MUSIC = _env_flag("JOGO_MUSIC", True)
+
+# Banco onde o ranking é gravado (tabela "ranking"; o benchmark usa um banco temporário)
+RANKING_DB = os.environ.get("JOGO_RANKING_DB", os.path.join(os.path.dirname(os.path.abspath(__file__)), "quiz_banco.db"))
+
+# Ranking antigo em JSON, importado para o banco na primeira vez que a tabela estiver vazia
+RANKING_FILE = os.environ.get("JOGO_RANKING_FILE", os.path.join(os.path.dirname(os.path.abspath(__file__)), "ranking_data.json"))
+
+# Origem das perguntas da partida: "memory" (banco inteiro em memória, carregado uma vez
+# por processo), "sqlite" (sorteio direto no arquivo, para máquinas com pouca memória) ou
+# "pack" (pacote binário mapeado com mmap, gerado com "python -m jogo.question_pack")
+QUESTION_BANK = os.environ.get("JOGO_QUESTION_BANK", "memory").strip().lower()
+
+# Pacote de perguntas usado com QUESTION_BANK = "pack" (sem ele, o jogo usa o banco em memória)
+QUESTION_PACK = os.environ.get("JOGO_QUESTION_PACK", os.path.join(os.path.dirname(os.path.abspath(__file__)), "quiz_banco.qpack"))
+
+# Ordena as perguntas da partida pela dificuldade medida (acertos/tentativas de cada
+# pergunta): a tabela de prêmios sobe junto com a dificuldade. Desligado, as perguntas
+# vêm na ordem sorteada. O log de uma sessão gravada guarda as estatísticas do início
+# da sessão, e o replay sorteia com elas (ver session_recorder)
+ADAPTIVE_DIFFICULTY = _env_flag("JOGO_ADAPTIVE_DIFFICULTY", True)
+
+# Banco onde as tentativas e acertos de cada pergunta são gravados (tabela "question_stats")
+QUESTION_STATS_DB = os.environ.get("JOGO_QUESTION_STATS_DB", os.path.join(os.path.dirname(os.path.abspath(__file__)), "quiz_banco.db"))
+
+# Jogador que recebe os pontos quando o jogo não é aberto pela tela de login
+PLAYER_NAME = os.environ.get("JOGO_PLAYER", "guardado")
+
+# Grava a sessão (eventos + semente dos sorteios) neste arquivo JSON Lines (ver session_recorder)
+RECORD_SESSION = os.environ.get("JOGO_RECORD_SESSION") or None
+
+# Profiler por fase do frame com overlay na tela (também liga/desliga com F3 durante o jogo)
+PROFILE = _env_flag("JOGO_PROFILE", False)
+
+# Arquivo onde os últimos frames medidos pelo profiler são salvos ao sair
+PROFILE_OUTPUT = os.environ.get("JOGO_PROFILE_OUTPUT", "jogo_profile.json")
+
+# Mostra no console a taxa de quadros e os percentis de tempo de frame ao sair do jogo
+FRAME_STATS = _env_flag("JOGO_FRAME_STATS", False)
+
+# Cache em disco das imagens já redimensionadas (gerado com "python -m jogo.surface_cache")
+SURFACE_CACHE = _env_flag("JOGO_SURFACE_CACHE", True)
+SURFACE_CACHE_DIR = os.environ.get(
+    "JOGO_SURFACE_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".surface_cache")
+)
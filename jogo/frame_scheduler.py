@@ -0,0 +1,99 @@
+import time
+from collections import deque
+
+import pygame
+
+
+def percentile(sorted_values, p):
+    # Percentil p (0-100) de uma lista já ordenada, pelo valor mais próximo
+    index = min(len(sorted_values) - 1, int(round(p / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+class FrameScheduler:
+    """Relógio único do jogo: limita o FPS e deixa as telas paradas quase sem uso de CPU.
+
+    Cada tela chama wait_events() uma vez por frame no lugar de pygame.event.get().
+    Quando nada está animando e não há eventos pendentes, a espera é feita com
+    pygame.event.wait(timeout), que bloqueia até chegar um evento.
+    """
+
+    def __init__(self, fps=30, idle_timeout_ms=500, history=300):
+        self.fps = fps  # Limite de quadros por segundo
+        self.idle_timeout_ms = idle_timeout_ms  # Espera máxima de uma tela parada
+        self.clock = pygame.time.Clock()
+        self._frame_times = deque(maxlen=history)  # Tempo de trabalho (s) dos últimos frames
+        self._frame_ends = deque(maxlen=history)  # Instante em que cada frame terminou
+        self._frame_start = None  # Início do frame atual (após receber os eventos)
+        self._redraw_requested = True  # Próximo frame não deve bloquear esperando eventos
+        self._frame_ticks = 0  # pygame.time.get_ticks() no início do frame atual
+
+    def attach(self, game):
+        # Chamado pelo Game depois de criado (relógios de gravação/replay/benchmark usam o jogo)
+        pass
+
+    def close(self):
+        # Chamado ao sair do loop principal
+        pass
+
+    def request_frame(self):
+        # Garante que o próximo wait_events() retorne sem bloquear (o Game pede ao trocar de
+        # tela no update e enquanto a tela ainda tem trabalho ocioso)
+        self._redraw_requested = True
+
+    def ticks(self):
+        # Tempo do jogo em ms no início do frame (as telas usam no lugar de pygame.time.get_ticks();
+        # é o valor gravado com os eventos, e o replay o reproduz)
+        return self._frame_ticks
+
+    def frame_time_left(self):
+        # Segundos que ainda restam do orçamento do frame atual (1/fps), para trabalho ocioso
+        if self._frame_start is None:
+            return 0.0
+        return 1.0 / self.fps - (time.perf_counter() - self._frame_start)
+
+    def end_frame(self, fps=None):
+        # Registra o tempo de trabalho do frame que terminou e limita a taxa de quadros
+        # (mesmo clock para todas as telas)
+        now = time.perf_counter()
+        if self._frame_start is not None:
+            self._frame_times.append(now - self._frame_start)
+            self._frame_ends.append(now)
+        self.clock.tick(self.fps if fps is None else fps)
+
+    def begin_frame(self):
+        # Marca o início do trabalho do próximo frame (eventos já recebidos)
+        self._redraw_requested = False
+        self._frame_start = time.perf_counter()
+        self._frame_ticks = pygame.time.get_ticks()
+
+    def wait_events(self, animating=False):
+        """Encerra o frame atual, espera o próximo e retorna a lista de eventos."""
+        self.end_frame()
+
+        if animating or self._redraw_requested or pygame.event.peek():
+            events = pygame.event.get()
+        else:
+            # Nada mudando na tela: dorme até chegar um evento ou estourar o timeout
+            event = pygame.event.wait(self.idle_timeout_ms)
+            events = [] if event.type == pygame.NOEVENT else [event]
+            events.extend(pygame.event.get())
+
+        self.begin_frame()
+        return events
+
+    def stats(self):
+        """Taxa de quadros real e percentis do tempo de frame (em milissegundos)."""
+        times = sorted(self._frame_times)
+        if not times:
+            return {"frames": 0, "fps": 0.0, "frame_ms_mean": 0.0, "frame_ms_p50": 0.0, "frame_ms_p95": 0.0, "frame_ms_p99": 0.0}
+
+        elapsed = self._frame_ends[-1] - self._frame_ends[0] if len(self._frame_ends) > 1 else 0
+        return {
+            "frames": len(times),
+            "fps": (len(self._frame_ends) - 1) / elapsed if elapsed > 0 else 0.0,
+            "frame_ms_mean": sum(times) / len(times) * 1000,
+            "frame_ms_p50": percentile(times, 50) * 1000,
+            "frame_ms_p95": percentile(times, 95) * 1000,
+            "frame_ms_p99": percentile(times, 99) * 1000,
+        }
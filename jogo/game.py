@@ -1,95 +1,210 @@
+import os
+import random
+
 import pygame
 from jogo.menus import MainMenu, OptionsMenu
 from jogo.assets import Assets
 from jogo.subjects_menu import SubjectsMenu  # Tela para escolher nível e matérias
-from jogo.game_screen import GameScreen      # Tela do jogo principal, recebe nível e matérias
+from jogo.game_screen import GameScreen, DB_FILENAME_FOR_GAME  # Tela do jogo principal, recebe nível e matérias
 from jogo.ranking_screen import RankingScreen
+from jogo.loading_screen import LoadingScreen
+from jogo.renderer import create_renderer
+from jogo.frame_scheduler import FrameScheduler
+from jogo.session_recorder import RecordingScheduler
+from jogo.scene_manager import SceneManager
+from jogo.input_dispatcher import InputDispatcher
+from jogo.profiler import FrameProfiler
+from jogo.ranking_store import RankingStore
+from jogo.question_stats import QuestionStats
+from jogo import question_bank
+from jogo.asset_manifest import SCENE_PREFETCH
+from jogo import config
+
+# Nome da tela -> classe (cada tela é construída uma única vez, na primeira vez em que é aberta)
+SCENE_CLASSES = {
+    "main_menu": MainMenu,
+    "options_menu": OptionsMenu,
+    "subjects_menu": SubjectsMenu,
+    "ranking_screen": RankingScreen,
+    "game_screen": GameScreen,  # Recebe nível e matérias ao ser empilhada
+    "loading_screen": LoadingScreen,
+}
+
+# Eventos após os quais o conteúdo da janela precisa ser reenviado por inteiro
+WINDOW_REDRAW_EVENTS = (pygame.VIDEOEXPOSE, pygame.VIDEORESIZE, pygame.WINDOWEXPOSED, pygame.WINDOWSIZECHANGED)
+IDLE_WORK_MARGIN = 0.004  # Folga (s) deixada no fim do frame ao fazer trabalho ocioso
 
 class Game:
     """Controlador principal do jogo, inicializa Pygame, carrega assets, menus e gerencia troca de telas."""
 
-    def __init__(self):
+    def __init__(self, scheduler=None, seed=None, player_name=None, question_stats=None):
         pygame.init()
         pygame.mixer.init()
 
-        # Configura tamanho da janela
+        # Controla quais regiões da janela são enviadas ao display a cada frame
+        # (backend "surface" ou "texture", ver config.RENDER_BACKEND)
+        self.renderer = create_renderer(config.RENDER_BACKEND, enabled=config.DIRTY_RECTS, software=config.RENDER_SOFTWARE)
+
+        # Configura tamanho da janela (tamanho lógico: as telas sempre desenham em 1080x720)
         self.SCREEN_WIDTH = 1080
         self.SCREEN_HEIGHT = 720
-        self.screen = pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
-        pygame.display.set_caption("Code Milionário")
-
-        # Carrega imagens, sons, fontes, etc.
-        self.assets = Assets()
-
-        # Inicializa as telas persistentes (sem parâmetros dinâmicos)
-        self.main_menu = MainMenu(self.screen, self.assets)
-        self.options_menu = OptionsMenu(self.screen, self.assets)
-        self.subjects_menu = SubjectsMenu(self.screen, self.assets)
-        self.ranking_screen = RankingScreen(self.screen, self.assets)
-
-        # GameScreen será criado sob demanda, com nível e matérias selecionados
-        self.running = True  # Flag do loop principal
+        self.screen = self.renderer.open_window((self.SCREEN_WIDTH, self.SCREEN_HEIGHT), "Code Milionário")
 
-    def run(self):
-        """Loop principal do jogo que gerencia exibição e troca de telas."""
-        while self.running:
-            # Desenha fundo e logo a cada frame (antes da tela específica)
-            self.screen.blit(self.assets.background, (0, 0))
-            logo_x = (self.SCREEN_WIDTH - self.assets.logo_img.get_width()) // 2
-            self.screen.blit(self.assets.logo_img, (logo_x, 30))
-
-            # Atualiza o menu principal e verifica se o botão "Jogar" foi clicado
-            if self.main_menu.update():  # Retorna True se "Jogar" foi clicado
-                self.assets.click_sound.play()
-
-                # Mostra tela de seleção de nível e matérias (bloqueante)
-                selected_level, selected_subjects_list = self.subjects_menu.show()
-
-                if selected_level and selected_subjects_list:
-                    # Se seleção válida, instancia GameScreen com os filtros
-                    current_game_instance = GameScreen(self.screen, self.assets, selected_level, selected_subjects_list)
-                    current_game_instance.show()  # Executa o jogo (bloqueante)
+        # Tempo por fase do frame e contagem de renders/blits (overlay com F3)
+        self.profiler = FrameProfiler(enabled=config.PROFILE, output_path=config.PROFILE_OUTPUT)
 
-                    # Após sair do jogo, limpa eventos para evitar cliques acumulados no menu
-                    pygame.event.clear(pygame.MOUSEBUTTONDOWN)
-                    pygame.event.clear(pygame.MOUSEBUTTONUP)
-                # Se usuário cancelou ou voltou, retorna ao menu principal
+        # Imagens, sons e fontes são carregados sob demanda (ver asset_manifest)
+        self.assets = Assets()
+        self.assets.text_renderer.profiler = self.profiler
 
-            elif self.main_menu.options_clicked:
-                self.assets.click_sound.play()
+        # Relógio único de todas as telas (limite de FPS e espera ociosa);
+        # o benchmark e o replay passam um relógio que simula os eventos
+        if scheduler is None and config.RECORD_SESSION:
+            scheduler = RecordingScheduler(config.RECORD_SESSION, fps=config.FPS, idle_timeout_ms=config.IDLE_TIMEOUT_MS)
+        self.scheduler = scheduler or FrameScheduler(fps=config.FPS, idle_timeout_ms=config.IDLE_TIMEOUT_MS)
 
-                # Mostra tela de opções (bloqueante)
-                self.options_menu.show()
+        # Sorteios da partida (ordem das perguntas, ajuda "eliminar") usam este gerador;
+        # com a mesma semente e os mesmos eventos, a sessão se repete (ver session_recorder)
+        self.seed = random.randrange(2 ** 32) if seed is None else seed
+        self.rng = random.Random(self.seed)
 
-                # Ajusta modo fullscreen se foi alterado
-                fullscreen_status_after_options = getattr(self.options_menu, 'is_fullscreen', pygame.display.is_fullscreen())
-                current_flags = self.screen.get_flags()
-                is_currently_fullscreen = bool(current_flags & pygame.FULLSCREEN)
+        # Ranking no banco: os pontos do jogador ficam em memória e são gravados em segundo plano
+        self.player_name = player_name or config.PLAYER_NAME
+        self.ranking = RankingStore(config.RANKING_DB, legacy_json=config.RANKING_FILE)
 
-                if fullscreen_status_after_options and not is_currently_fullscreen:
-                    self.screen = pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT), pygame.FULLSCREEN)
-                elif not fullscreen_status_after_options and is_currently_fullscreen:
-                    self.screen = pygame.display.set_mode((self.SCREEN_WIDTH, self.SCREEN_HEIGHT))
+        # Tentativas e acertos por pergunta (dificuldade usada no sorteio), também gravados em segundo plano;
+        # o replay passa os contadores gravados no log da sessão (question_stats)
+        self.question_stats = QuestionStats(config.QUESTION_STATS_DB, counts=question_stats)
 
-                # Atualiza a referência da tela nas outras telas para a nova janela criada
-                self.main_menu.screen = self.screen
-                self.options_menu.screen = self.screen
-                self.subjects_menu.screen = self.screen
-                self.ranking_screen.screen = self.screen
+        # O gravador de sessão guarda no cabeçalho a semente e os contadores acima
+        self.scheduler.attach(self)
 
-                self.main_menu.options_clicked = False  # Reseta flag após processar
+        # Resolve os cliques pelo índice de áreas da tela do topo (entrega única por clique)
+        self.input = InputDispatcher()
 
-            elif self.main_menu.exit_clicked:
-                self.assets.click_sound.play()
-                self.running = False  # Sai do loop principal e fecha o jogo
+        # Telas já construídas; são reaproveitadas pela pilha de telas
+        self._built_scenes = {}
+        self.scenes = SceneManager(on_change=self.input.reset)  # Trocar de tela esquece o clique pendente
+        self.scenes.push(self.scene("main_menu"))  # Só os assets do menu principal são carregados agora
 
-            # Eventos globais, como fechar a janela principal
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    self.running = False
+        self.running = True  # Flag do loop principal
 
-            pygame.display.update()  # Atualiza a tela a cada frame
+    def scene(self, name):
+        """Retorna a tela pelo nome, construindo-a (e carregando seus assets) na primeira vez."""
+        if name not in self._built_scenes:
+            self.assets.load_scene(name)
+            self._built_scenes[name] = SCENE_CLASSES[name](self)
+        return self._built_scenes[name]
+
+    def scene_name(self, scene):
+        """Nome (em SCENE_CLASSES) de uma tela, ou None."""
+        for name, cls in SCENE_CLASSES.items():
+            if type(scene) is cls:
+                return name
+        return None
+
+    def open_scene(self, name, **kwargs):
+        """Empilha uma tela; se seus assets ainda estão sendo decodificados, mostra a tela de carregamento."""
+        if name in self._built_scenes or self.assets.is_ready(name):
+            self.scenes.push(self.scene(name), **kwargs)
+            self.prefetch_after(name)
+        else:
+            self.assets.prefetch(name)
+            self.scenes.push(self.scene("loading_screen"), target=name, target_kwargs=kwargs)
+
+    def prefetch_after(self, name):
+        # Decodifica em segundo plano os assets das telas que podem ser abertas a partir desta
+        for next_name in SCENE_PREFETCH.get(name, []):
+            if next_name not in self._built_scenes:
+                self.assets.prefetch(next_name)
+
+    def set_fullscreen(self, fullscreen):
+        """Alterna entre janela e tela cheia, recriando a janela se necessário."""
+        if fullscreen == self.renderer.fullscreen:
+            return
+
+        # O backend "surface" recria a janela; o "texture" mantém a mesma tela lógica.
+        # O próximo frame é enviado por inteiro (as telas leem self.game.screen,
+        # então não há referências para atualizar)
+        self.screen = self.renderer.open_window((self.SCREEN_WIDTH, self.SCREEN_HEIGHT), "Code Milionário", fullscreen)
+
+    def quit(self):
+        # Encerra o loop principal ao final do frame atual
+        self.running = False
 
+    def run(self):
+        """Loop principal: uma única fila de eventos alimenta a tela do topo da pilha."""
+        first_frame = True
+        while self.running and self.scenes.top:
+            scene = self.scenes.top
+            profiler = self.profiler
+
+            events = self.scheduler.wait_events(animating=scene.animating or profiler.enabled)
+            profiler.begin_frame(self.scene_name(scene))
+            with profiler.phase("events"):
+                for event in events:
+                    if event.type == pygame.QUIT:
+                        self.running = False
+                    elif event.type in WINDOW_REDRAW_EVENTS:
+                        self.renderer.invalidate()  # Janela exposta ou redimensionada: reenvia tudo
+                    elif event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+                        profiler.toggle()
+                    elif self.scenes.top is scene and not self.input.dispatch(scene, event):
+                        scene.handle_event(event)
+                    # Se a tela mudou no meio do lote, os eventos restantes eram da tela
+                    # anterior e são descartados (evita cliques "vazando" para a nova tela)
+
+            if not self.running or not self.scenes.top:
+                profiler.end_frame()
+                break
+
+            # Atualiza e desenha a tela do topo (pode ser outra após os eventos)
+            scene = self.scenes.top
+            with profiler.phase("update"):
+                scene.update()
+            if self.scenes.top is not scene:
+                # A tela saiu do topo no próprio update (ex.: LoadingScreen abriu a tela de
+                # destino): não desenha mais um frame dela por cima da nova, que é desenhada
+                # já no próximo frame (sem esperar eventos)
+                profiler.end_frame()
+                self.scheduler.request_frame()
+                continue
+            self.renderer.begin_frame(scene)
+            with profiler.phase("draw"):
+                scene.draw()
+            profiler.draw_overlay(self.screen, self.renderer)
+            with profiler.phase("present"):
+                self.renderer.present()  # Envia ao display só o que mudou neste frame
+
+            # Frame já na tela: o tempo que sobra até o próximo adianta trabalho da tela
+            # (pelo menos uma parte por frame, as demais enquanto couberem no orçamento)
+            with profiler.phase("idle"):
+                idle_pending = scene.idle_work()
+                while idle_pending and self.scheduler.frame_time_left() > IDLE_WORK_MARGIN:
+                    idle_pending = scene.idle_work()
+            if idle_pending:
+                self.scheduler.request_frame()  # Ainda há trabalho ocioso: o próximo frame não bloqueia
+            profiler.end_frame()
+
+            if first_frame:
+                # Primeiro frame já está na tela: agora inicia a música e o carregamento antecipado
+                first_frame = False
+                if config.MUSIC:
+                    self.assets.start_music()
+                self.prefetch_after("main_menu")
+                if config.QUESTION_BANK == "memory" or (
+                    config.QUESTION_BANK == "pack" and not os.path.exists(config.QUESTION_PACK)
+                ):
+                    question_bank.preload(DB_FILENAME_FOR_GAME)
+
+        self.scheduler.close()
+        self.ranking.close()  # Grava as pontuações pendentes antes de sair
+        self.question_stats.close()
+        profile_path = self.profiler.dump()
+        if profile_path:
+            print(f"Game: últimos frames do profiler salvos em {profile_path}")
+        if config.FRAME_STATS:
+            print(f"Game: estatísticas de frame ({self.renderer.name}) {self.scheduler.stats()}")
         pygame.quit()  # Encerra Pygame ao sair do loop
 
 # Executa o jogo se for o arquivo principal
@@ -0,0 +1,58 @@
+# Cache de glifos pré-renderizados para números (pontuações, posições no ranking, prêmios).
+#
+# Cada caractere é renderizado uma única vez por fonte e cor; um número qualquer é
+# desenhado blitando os glifos lado a lado, sem chamar font.render a cada frame.
+import pygame
+
+NUMERIC_GLYPHS = "0123456789.,:-/ P$"  # Dígitos, separadores e o prefixo da moeda
+CURRENCY_PREFIX = "P$ "
+
+
+def format_money(value):
+    """Formata um valor como "P$ 1.000.000" (separador de milhar com ponto)."""
+    return CURRENCY_PREFIX + f"{value:,.0f}".replace(",", ".")
+
+
+class GlyphCache:
+    """Glifos renderizados por (fonte, cor), usados para compor textos numéricos."""
+
+    def __init__(self):
+        self._glyphs = {}  # (fonte, cor) -> {caractere: surface}
+        self.renders = 0  # Quantas vezes font.render foi chamado (um por glifo novo)
+
+    def glyphs(self, font, color):
+        # Tabela de glifos da fonte/cor, criada na primeira vez com todos os caracteres numéricos
+        key = (font, color)
+        table = self._glyphs.get(key)
+        if table is None:
+            table = self._glyphs[key] = {}
+            for char in NUMERIC_GLYPHS:
+                self._render_glyph(table, char, font, color)
+        return table
+
+    def _render_glyph(self, table, char, font, color):
+        self.renders += 1
+        table[char] = font.render(char, True, color)
+        return table[char]
+
+    def size(self, text, font, color):
+        """Largura e altura do texto composto pelos glifos."""
+        table = self.glyphs(font, color)
+        width = 0
+        for char in text:
+            glyph = table.get(char) or self._render_glyph(table, char, font, color)
+            width += glyph.get_width()
+        return width, table["0"].get_height()
+
+    def blit(self, surface, text, pos, font, color):
+        """Desenha o texto na surface a partir de pos (canto superior esquerdo); retorna o Rect ocupado."""
+        table = self.glyphs(font, color)
+        x, y = pos
+        blits = []
+        for char in text:
+            # Caracteres fora do conjunto numérico são renderizados uma vez e guardados
+            glyph = table.get(char) or self._render_glyph(table, char, font, color)
+            blits.append((glyph, (x, y)))
+            x += glyph.get_width()
+        surface.blits(blits, doreturn=False)
+        return pygame.Rect(pos[0], y, x - pos[0], table["0"].get_height())
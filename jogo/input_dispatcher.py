@@ -0,0 +1,54 @@
+import pygame
+
+
+class HitTestIndex:
+    """Áreas clicáveis de uma tela, em ordem de desenho (a última fica por cima).
+
+    Cada área tem um nome, um retângulo (o próprio Rect do botão, então acompanha
+    mudanças de posição) e, opcionalmente, uma função que diz se ela está ativa.
+    """
+
+    def __init__(self):
+        self._targets = []  # (nome, rect, enabled) na ordem em que foram registrados
+
+    def add(self, name, rect, enabled=None):
+        # Registra uma área; áreas adicionadas depois ficam por cima das anteriores
+        self._targets.append((name, rect, enabled))
+
+    def hit(self, pos):
+        """Nome da área ativa mais ao topo que contém pos, ou None."""
+        for name, rect, enabled in reversed(self._targets):
+            if rect.collidepoint(pos) and (enabled is None or enabled()):
+                return name
+        return None
+
+
+class InputDispatcher:
+    """Entrega cada clique do botão esquerdo exatamente uma vez ao widget do topo.
+
+    O MOUSEBUTTONDOWN é resolvido pelo índice de áreas da tela e vira uma chamada
+    scene.on_click(nome, event); o MOUSEBUTTONUP correspondente é consumido. Eventos que
+    não atingem nenhuma área seguem para scene.handle_event().
+    """
+
+    def __init__(self):
+        self.pressed = None  # (tela, nome) do widget pressionado e ainda não solto
+
+    def dispatch(self, scene, event):
+        """Trata o evento; retorna True se ele foi consumido por um widget."""
+        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
+            name = scene.hit_index.hit(event.pos)
+            if name is None:
+                return False
+            self.pressed = (scene, name)
+            scene.on_click(name, event)
+            return True
+        if event.type == pygame.MOUSEBUTTONUP and event.button == 1 and self.pressed is not None:
+            # Fim de um clique já entregue: não chega à tela como um novo evento
+            self.pressed = None
+            return True
+        return False
+
+    def reset(self):
+        # A pilha de telas mudou: o widget pressionado era da tela anterior
+        self.pressed = None
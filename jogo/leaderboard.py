@@ -0,0 +1,144 @@
+# Placares ordenados que se atualizam a cada pontuação, sem reordenar tudo.
+#
+# Cada Leaderboard guarda as chaves (-pontos, jogador) numa lista ordenada dividida
+# em blocos de até BUCKET_SIZE itens, com o maior valor de cada bloco num índice
+# à parte. Atualizar uma pontuação é uma busca binária no índice e outra no bloco
+# (O(log n)) mais o deslocamento de no máximo BUCKET_SIZE itens; o top-K e as
+# fatias usadas pela tela de ranking leem só os blocos necessários.
+#
+# LeaderboardIndex mantém um placar geral e um por nível e por (nível, matéria);
+# é alimentado pelo RankingStore do jogo. (A API soma a tabela Pontuacao no próprio
+# banco: com vários workers, um placar em memória ficaria desatualizado.)
+from bisect import bisect_left, insort
+
+BUCKET_SIZE = 256  # Itens por bloco (blocos maiores que 2x isso são divididos)
+
+
+class Leaderboard:
+    """Pontuação por jogador, sempre ordenada da maior para a menor (empate: nome)."""
+
+    def __init__(self):
+        self._scores = {}  # Jogador -> pontuação
+        self._buckets = []  # Blocos ordenados de chaves (-pontos, jogador)
+        self._maxes = []  # Última (maior) chave de cada bloco
+
+    def __len__(self):
+        return len(self._scores)
+
+    def __contains__(self, name):
+        return name in self._scores
+
+    def score(self, name):
+        return self._scores.get(name, 0)
+
+    def add(self, name, points):
+        """Soma pontos ao jogador (cria a entrada se não existir)."""
+        self.set(name, self._scores.get(name, 0) + points)
+
+    def set(self, name, score):
+        # Troca a chave antiga do jogador pela nova na lista ordenada
+        old = self._scores.get(name)
+        if old == score:
+            return
+        if old is not None:
+            self._remove((-old, name))
+        self._scores[name] = score
+        self._insert((-score, name))
+
+    def _insert(self, key):
+        if not self._buckets:
+            self._buckets.append([key])
+            self._maxes.append(key)
+            return
+        i = min(bisect_left(self._maxes, key), len(self._buckets) - 1)
+        bucket = self._buckets[i]
+        insort(bucket, key)
+        self._maxes[i] = bucket[-1]
+        if len(bucket) > 2 * BUCKET_SIZE:
+            # Divide o bloco cheio em dois para manter o deslocamento curto
+            self._buckets[i:i + 1] = [bucket[:BUCKET_SIZE], bucket[BUCKET_SIZE:]]
+            self._maxes[i:i + 1] = [bucket[BUCKET_SIZE - 1], bucket[-1]]
+
+    def _remove(self, key):
+        i = bisect_left(self._maxes, key)
+        bucket = self._buckets[i]
+        del bucket[bisect_left(bucket, key)]
+        if bucket:
+            self._maxes[i] = bucket[-1]
+        else:
+            del self._buckets[i]
+            del self._maxes[i]
+
+    def top(self, k):
+        """Os k primeiros como lista de (jogador, pontuação)."""
+        return self.slice(0, k)
+
+    def slice(self, start, stop):
+        """Entradas da posição start (0 = primeiro) até stop (exclusivo), como (jogador, pontuação)."""
+        result = []
+        position = 0
+        for bucket in self._buckets:
+            if position + len(bucket) <= start:
+                position += len(bucket)
+                continue
+            for neg_score, name in bucket[max(0, start - position):stop - position]:
+                result.append((name, -neg_score))
+            position += len(bucket)
+            if position >= stop:
+                break
+        return result
+
+    def rank(self, name):
+        """Posição do jogador (1 = primeiro) ou None se não estiver no placar."""
+        if name not in self._scores:
+            return None
+        key = (-self._scores[name], name)
+        i = bisect_left(self._maxes, key)
+        return sum(len(bucket) for bucket in self._buckets[:i]) + bisect_left(self._buckets[i], key) + 1
+
+    def items(self):
+        # Todas as entradas em ordem (jogador, pontuação)
+        for bucket in self._buckets:
+            for neg_score, name in bucket:
+                yield name, -neg_score
+
+
+class LeaderboardIndex:
+    """Placar geral e placares por nível e por (nível, matéria).
+
+    board() sem argumentos é o geral; board(nivel) soma todas as matérias do
+    nível; board(nivel, materia) é a combinação escolhida no menu de matérias.
+    """
+
+    def __init__(self):
+        self._boards = {(None, None): Leaderboard()}
+
+    def board(self, level=None, subject=None):
+        # Placar da combinação (criado vazio na primeira consulta)
+        key = (level, subject if level is not None else None)
+        if key not in self._boards:
+            self._boards[key] = Leaderboard()
+        return self._boards[key]
+
+    def boards(self):
+        # Combinações (nível, matéria) com placar
+        return list(self._boards)
+
+    def add(self, name, points, level=None, subject=None):
+        """Registra pontos no placar geral e nos placares do nível e da matéria (se informados)."""
+        self.board().add(name, points)
+        if level is not None:
+            self.board(level).add(name, points)
+            if subject is not None:
+                self.board(level, subject).add(name, points)
+
+    def top(self, k, level=None, subject=None):
+        return self.board(level, subject).top(k)
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Monta o índice a partir de linhas (jogador, pontos, nível, matéria)."""
+        index = cls()
+        for name, points, level, subject in rows:
+            index.add(name, points, level, subject)
+        return index
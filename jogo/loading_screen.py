@@ -0,0 +1,31 @@
+from jogo.scene_manager import Scene
+
+class LoadingScreen(Scene):
+    """Tela mostrada enquanto os assets da próxima tela terminam de ser decodificados."""
+
+    animating = True  # Continua rodando frames para perceber quando o carregamento termina
+
+    def __init__(self, game):
+        super().__init__(game)
+        self.target = None  # Nome da tela que será aberta
+        self.target_kwargs = {}  # Parâmetros repassados para a tela
+        self.dots = 0  # Animação dos pontinhos
+
+    def on_enter(self, target=None, target_kwargs=None, **kwargs):
+        self.target = target
+        self.target_kwargs = target_kwargs or {}
+        self.dots = 0
+
+    def update(self):
+        self.dots = (self.dots + 1) % 90
+        if self.assets.is_ready(self.target):
+            # Assets prontos: troca esta tela pela tela de destino
+            self.game.scenes.pop()
+            self.game.open_scene(self.target, **self.target_kwargs)
+
+    def draw(self):
+        self.screen.blit(self.assets.background, (0, 0))
+        text = self.assets.text_renderer.render("Carregando" + "." * (self.dots // 30 + 1), self.assets.small_font)
+        rect = text.get_rect(center=(self.screen.get_width() // 2, self.screen.get_height() // 2))
+        self.screen.blit(text, rect)
+        self.renderer.track("loading", rect.inflate(60, 0), text)
@@ -1,7 +1,34 @@
 # Ponto de entrada do jogo: inicia o loop principal do jogo.
+#
+#     python -m jogo.main                            joga normalmente
+#     python -m jogo.main --record sessao.jsonl      grava a sessão (eventos + semente)
+#     python -m jogo.main --replay sessao.jsonl      reproduz uma sessão gravada
+#     python -m jogo.main --replay sessao.jsonl --fast   ... o mais rápido possível
+import argparse
 
+from jogo import config
 from jogo.game import Game
+from jogo.session_recorder import RecordingScheduler, replay_session
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Code Milionário")
+    parser.add_argument("--record", metavar="ARQUIVO", help="grava os eventos da sessão neste arquivo")
+    parser.add_argument("--replay", metavar="ARQUIVO", help="reproduz uma sessão gravada")
+    parser.add_argument("--fast", action="store_true", help="no replay, ignora os tempos gravados e o limite de FPS")
+    args = parser.parse_args()
+
+    if args.replay:
+        # Ranking e estatísticas das perguntas em bancos temporários: o replay não altera os reais
+        _game, scheduler = replay_session(args.replay, fast=args.fast)
+        print(f"Replay: {scheduler.total_batches} lotes de eventos em {scheduler.frames} frames; {scheduler.stats()}")
+    elif args.record:
+        game = Game(scheduler=RecordingScheduler(args.record, fps=config.FPS, idle_timeout_ms=config.IDLE_TIMEOUT_MS))
+        game.run()
+    else:
+        game = Game()
+        game.run()
+
 
 if __name__ == "__main__":
-    game = Game()
-    game.run()
\ No newline at end of file
+    main()
@@ -1,44 +1,59 @@
 import pygame
 from jogo.button import Button
+from jogo.scene_manager import Scene
+from jogo.assets import DEFAULT_VOLUME
+from jogo import config
 
 # Tela do menu principal
-class MainMenu:
-    def __init__(self, screen, assets):
-        self.screen = screen
-        self.assets = assets
-        self.options_clicked = False
-        self.exit_clicked = False
+class MainMenu(Scene):
+    def __init__(self, game):
+        super().__init__(game)
+        assets = self.assets
 
         # Botões posicionados na tela principal
         self.jogar_button = Button(427, 260, assets.jogar_img)
         self.options_button = Button(427, 410, assets.options_img)
         self.exit_button = Button(427, 560, assets.exit_img)
 
-    def update(self):
-        # Desenha os botões e detecta cliques (retorna True se clicado)
-        jogar = self.jogar_button.draw(self.screen)
-        options = self.options_button.draw(self.screen)
-        exit_ = self.exit_button.draw(self.screen)
-
-        # Atualiza flags para opções e sair
-        self.options_clicked = options
-        self.exit_clicked = exit_
-
-        # Retorna True se "Jogar" foi clicado
-        return jogar
+        # Áreas clicáveis (o InputDispatcher chama on_click com o nome do botão)
+        self.hit_index.add("jogar", self.jogar_button.rect)
+        self.hit_index.add("options", self.options_button.rect)
+        self.hit_index.add("exit", self.exit_button.rect)
+
+    def on_click(self, name, event):
+        # Cliques nos botões: troca de tela ou sai do jogo
+        self.assets.click_sound.play()
+        if name == "jogar":
+            self.game.open_scene("subjects_menu")  # Tela de seleção de nível e matérias
+        elif name == "options":
+            self.game.open_scene("options_menu")
+        elif name == "exit":
+            self.game.quit()  # Sai do loop principal e fecha o jogo
+
+    def draw(self):
+        # Desenha fundo e logo
+        self.screen.blit(self.assets.background, (0, 0))
+        logo_x = (self.screen.get_width() - self.assets.logo_img.get_width()) // 2
+        self.screen.blit(self.assets.logo_img, (logo_x, 30))
+        self.renderer.track("logo", self.assets.logo_img.get_rect(topleft=(logo_x, 30)), self.assets.logo_img)
+
+        # Desenha os botões
+        self.jogar_button.draw(self.screen, self.renderer)
+        self.options_button.draw(self.screen, self.renderer)
+        self.exit_button.draw(self.screen, self.renderer)
 
 
 # Tela de opções do jogo
-class OptionsMenu:
-    def __init__(self, screen, assets):
-        self.screen = screen
-        self.assets = assets
+class OptionsMenu(Scene):
+    def __init__(self, game):
+        super().__init__(game)
+        assets = self.assets
 
         # Estados iniciais
-        self.music_playing = True
+        self.music_playing = config.MUSIC  # Com JOGO_MUSIC=0 a música não foi iniciada
         self.sound_on = True
         self.is_fullscreen = False  # Se está em tela cheia ou não
-        self.volume = 0.2
+        self.volume = DEFAULT_VOLUME
 
         # Botões para música, som, fullscreen e voltar
         self.music_button = Button(427, 230, assets.music_img)
@@ -50,84 +65,80 @@ class OptionsMenu:
         pygame.mixer.music.set_volume(self.volume)
         self.assets.click_sound.set_volume(self.volume if self.sound_on else 0)
 
+        # Barra de volume: logo abaixo do botão de música (que ocupa y=230 a 320)
+        self.volume_rect = pygame.Rect(340, 330, 400, 16)
+
+        # Áreas clicáveis: botões e a barra de volume
+        self.hit_index.add("music", self.music_button.rect)
+        self.hit_index.add("sound", self.sound_button.rect)
+        self.hit_index.add("fullscreen", self.fullscreen_button.rect)
+        self.hit_index.add("back", self.back_button.rect)
+        self.hit_index.add("volume", self.volume_rect)
+
     def toggle_fullscreen(self):
-        # Alterna o estado de fullscreen
+        # Alterna o estado de fullscreen e aplica imediatamente na janela
         self.is_fullscreen = not self.is_fullscreen
-        print(f"OptionsMenu: Intencao de fullscreen alterada para {self.is_fullscreen}")
-
-    def show(self):
-        """Mostra a tela de opções, bloqueando até o usuário sair."""
-        action_to_return = None
-
-        # Aguarda o botão do mouse ser solto para evitar clique instantâneo
-        while pygame.mouse.get_pressed()[0]:
-            pygame.event.pump()
-            pygame.time.wait(10)
-
-        running = True
-        while running:
-            # Desenha fundo e título
-            self.screen.blit(self.assets.background, (0, 0))
-            text = self.assets.font.render("Opções", True, (0, 227, 197))
-            self.screen.blit(text, (540 - text.get_width() // 2, 50))
-
-            # Desenha checkboxes dos estados (música, som, fullscreen)
-            self._draw_checkbox(self.music_playing, 680, 245)
-            self._draw_checkbox(self.sound_on, 680, 395)
-            self._draw_checkbox(self.is_fullscreen, 680, 545)
-
-            # Detecta cliques nos botões e executa ações correspondentes
-            if self.music_button.draw(self.screen):
-                self.assets.click_sound.play()
-                self.toggle_music()
-
-            if self.sound_button.draw(self.screen):
-                self.assets.click_sound.play()
-                self.toggle_sound()
-
-            if self.fullscreen_button.draw(self.screen):
-                self.assets.click_sound.play()
-                pygame.time.wait(100)  # Pequena pausa para evitar múltiplos cliques rápidos
-                self.toggle_fullscreen()
-                action_to_return = "TOGGLE_FULLSCREEN"  # Informa que fullscreen mudou
-                running = False
-
-            if self.back_button.draw(self.screen):
-                self.assets.click_sound.play()
-                pygame.time.wait(100)
-                action_to_return = None
-                running = False
-
-            # Eventos de sistema e volume
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    action_to_return = "QUIT"
-                    running = False
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    # Se clicar na barra de volume, ajusta o volume proporcionalmente
-                    if 340 < event.pos[0] < 740 and 300 < event.pos[1] < 320:
-                        self.volume = (event.pos[0] - 340) / 400
-                        pygame.mixer.music.set_volume(self.volume)
-                        if self.sound_on:
-                            self.assets.click_sound.set_volume(self.volume)
-
-            pygame.display.update()
-
-        return action_to_return
+        self.game.set_fullscreen(self.is_fullscreen)
+
+    def on_click(self, name, event):
+        # Executa a ação do widget clicado
+        if name == "volume":
+            # Clique na barra de volume ajusta o volume proporcionalmente
+            self.volume = (event.pos[0] - self.volume_rect.x) / self.volume_rect.width
+            pygame.mixer.music.set_volume(self.volume)
+            if self.sound_on:
+                self.assets.click_sound.set_volume(self.volume)
+            return
+
+        self.assets.click_sound.play()
+        if name == "music":
+            self.toggle_music()
+        elif name == "sound":
+            self.toggle_sound()
+        elif name == "fullscreen":
+            self.toggle_fullscreen()
+        elif name == "back":
+            self.game.scenes.pop()
+
+    def draw(self):
+        # Desenha fundo e título
+        self.screen.blit(self.assets.background, (0, 0))
+        text = self.assets.text_renderer.render("Opções", self.assets.font, (0, 227, 197))
+        self.screen.blit(text, (540 - text.get_width() // 2, 50))
+        self.renderer.track("title", text.get_rect(topleft=(540 - text.get_width() // 2, 50)), text)
+
+        # Desenha checkboxes dos estados (música, som, fullscreen)
+        self._draw_checkbox(self.music_playing, 680, 245)
+        self._draw_checkbox(self.sound_on, 680, 395)
+        self._draw_checkbox(self.is_fullscreen, 680, 545)
+
+        # Desenha os botões
+        self.music_button.draw(self.screen, self.renderer)
+        self.sound_button.draw(self.screen, self.renderer)
+        self.fullscreen_button.draw(self.screen, self.renderer)
+        self.back_button.draw(self.screen, self.renderer)
+
+        # Barra de volume, preenchida até o volume atual
+        fill = self.volume_rect.copy()
+        fill.width = round(self.volume * self.volume_rect.width)
+        pygame.draw.rect(self.screen, (40, 40, 60), self.volume_rect, border_radius=8)
+        pygame.draw.rect(self.screen, (0, 227, 197), fill, border_radius=8)
+        self.renderer.track("volume", self.volume_rect, self.volume)
 
     def _draw_checkbox(self, state, x, y):
         # Desenha caixa de seleção ligada ou desligada conforme estado booleano
         img = self.assets.checkbox_on if state else self.assets.checkbox_off
         self.screen.blit(img, (x, y))
+        self.renderer.track(("checkbox", x, y), img.get_rect(topleft=(x, y)), img)
 
     def toggle_music(self):
         # Liga ou desliga a música de fundo
         if self.music_playing:
             pygame.mixer.music.stop()
+            self.music_playing = False
         else:
-            pygame.mixer.music.play(-1)
-            pygame.mixer.music.set_volume(self.volume)
-        self.music_playing = not self.music_playing
+            # Carrega a música se ainda não foi carregada; sem o arquivo, continua desligada
+            self.music_playing = self.assets.start_music(self.volume)
 
     def toggle_sound(self):
         # Liga ou desliga os sons de clique
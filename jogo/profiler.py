@@ -0,0 +1,166 @@
+import json
+import sys
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import pygame
+
+# Métodos do pygame contados por frame ((classe, nome do método) -> contador). O hook confere
+# a classe do objeto: dict.copy, json.load e outros métodos com o mesmo nome não contam
+CALL_COUNTERS = {
+    (pygame.font.Font, "render"): "font_render",
+    (pygame.Surface, "blit"): "blit",
+    (pygame.Surface, "blits"): "blit",
+    (pygame.Surface, "fill"): "fill",
+}
+# Chamadas que criam uma surface nova (alocações): métodos de Surface/Font e funções do pygame
+ALLOCATING_METHODS = {
+    (pygame.font.Font, "render"),
+    (pygame.Surface, "copy"), (pygame.Surface, "convert"), (pygame.Surface, "convert_alpha"), (pygame.Surface, "subsurface"),
+}
+ALLOCATING_CALLS = {
+    pygame.transform.scale, pygame.transform.smoothscale, pygame.transform.rotate,
+    pygame.transform.rotozoom, pygame.transform.flip, pygame.image.frombuffer, pygame.image.load,
+}
+PHASES = ("wait", "events", "update", "draw", "text", "present", "idle")
+OVERLAY_COLOR = (255, 255, 0)
+OVERLAY_BACKGROUND = (0, 0, 0, 170)
+
+
+class FrameProfiler:
+    """Mede o tempo de cada fase do frame e conta chamadas de renderização.
+
+    O Game marca as fases (espera, eventos, update, draw, present, trabalho ocioso) e o TextRenderer
+    marca a fase "text" (quebra e renderização de textos novos, dentro do draw).
+    Enquanto ativo, um hook de sys.setprofile conta font.render, blits e surfaces
+    criadas; isso deixa o frame mais lento, então os tempos servem para comparar
+    fases entre si, não com o jogo sem profiler. Os últimos frames ficam num
+    buffer circular que é salvo em JSON ao sair.
+    """
+
+    def __init__(self, enabled=False, history=600, output_path=None):
+        self.enabled = enabled  # Coletando e mostrando o overlay
+        self.output_path = output_path  # JSON gravado por dump() (None = não grava)
+        self.frames = deque(maxlen=history)  # Buffer circular com os últimos frames
+        self._font = None
+        self._frame = None  # Frame em andamento: {"scene", "ms", "counts"}
+        self._frame_started = None
+        self._last_frame_end = None
+        self._counting = False
+
+    def toggle(self):
+        # Liga/desliga a coleta e o overlay (tecla F3)
+        self.enabled = not self.enabled
+        self._frame = None
+        self._last_frame_end = None
+        self._set_call_hook(False)
+
+    def begin_frame(self, scene_name):
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self._frame = {"scene": scene_name, "ms": dict.fromkeys(PHASES, 0.0), "counts": {}}
+        if self._last_frame_end is not None:
+            self._frame["ms"]["wait"] = (now - self._last_frame_end) * 1000
+        self._frame_started = now
+        self._set_call_hook(True)
+
+    def end_frame(self):
+        if self._frame is None:
+            return
+        self._set_call_hook(False)
+        now = time.perf_counter()
+        self._frame["t"] = now
+        self._frame["total_ms"] = (now - self._frame_started) * 1000
+        self.frames.append(self._frame)
+        self._frame = None
+        self._last_frame_end = now
+
+    @contextmanager
+    def phase(self, name):
+        """Soma ao frame atual o tempo gasto no bloco (fases podem ser aninhadas)."""
+        if self._frame is None:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            if self._frame is not None:
+                self._frame["ms"][name] += (time.perf_counter() - start) * 1000
+
+    def _set_call_hook(self, counting):
+        # sys.setprofile só vale para a thread principal (a decodificação em segundo plano não conta)
+        if counting != self._counting:
+            self._counting = counting
+            sys.setprofile(self._on_call if counting else None)
+
+    def _on_call(self, _frame, event, arg):
+        if event != "c_call":
+            return
+        # Métodos: arg.__self__ é o objeto (uma Surface ou Font); funções: arg é a própria função
+        owner = getattr(arg, "__self__", None)
+        if isinstance(owner, pygame.Surface):
+            key = (pygame.Surface, arg.__name__)
+        elif isinstance(owner, pygame.font.Font):
+            key = (pygame.font.Font, arg.__name__)
+        elif arg in ALLOCATING_CALLS:
+            key = None
+        else:
+            return
+        counts = self._frame["counts"]
+        counter = CALL_COUNTERS.get(key)
+        if counter is not None:
+            counts[counter] = counts.get(counter, 0) + 1
+        if key is None or key in ALLOCATING_METHODS:
+            counts["surface_alloc"] = counts.get("surface_alloc", 0) + 1
+
+    def draw_overlay(self, surface, renderer):
+        """Desenha os números do último frame no canto da tela (sem entrar na contagem)."""
+        if not self.enabled or not self.frames:
+            return
+        counting = self._counting
+        self._set_call_hook(False)
+
+        last = self.frames[-1]
+        recent = list(self.frames)[-30:]
+        fps = (len(recent) - 1) / (recent[-1]["t"] - recent[0]["t"]) if len(recent) > 1 and recent[-1]["t"] > recent[0]["t"] else 0.0
+        counts = last["counts"]
+        lines = [
+            f"{last['scene']}  {fps:.0f} fps  frame {last['total_ms']:.1f} ms",
+            "  ".join(f"{phase} {last['ms'][phase]:.1f}" for phase in PHASES),
+            f"render {counts.get('font_render', 0)}  blit {counts.get('blit', 0)}  "
+            f"fill {counts.get('fill', 0)}  alloc {counts.get('surface_alloc', 0)}",
+        ]
+
+        if self._font is None:
+            self._font = pygame.font.Font(None, 18)  # Fonte padrão do pygame (não depende do sistema)
+        rendered = [self._font.render(line, True, OVERLAY_COLOR) for line in lines]
+        width = max(line.get_width() for line in rendered) + 12
+        height = sum(line.get_height() for line in rendered) + 8
+        panel = pygame.Surface((width, height), pygame.SRCALPHA)
+        panel.fill(OVERLAY_BACKGROUND)
+        y = 4
+        for line in rendered:
+            panel.blit(line, (6, y))
+            y += line.get_height()
+        surface.blit(panel, (0, 0))
+        renderer.track("profiler_overlay", panel.get_rect(), tuple(lines))
+
+        self._set_call_hook(counting)
+
+    def dump(self):
+        """Grava o buffer circular em JSON (para os laboratórios enviarem os traces)."""
+        if not self.output_path or not self.frames:
+            return None
+        data = {
+            "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "pygame": pygame.version.ver,
+            "phases": list(PHASES),
+            # "t" vira segundos desde o primeiro frame do buffer
+            "frames": [dict(frame, t=frame["t"] - self.frames[0]["t"]) for frame in self.frames],
+        }
+        with open(self.output_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        return self.output_path
@@ -0,0 +1,228 @@
+# Banco de perguntas em memória, carregado uma vez por processo.
+#
+# As perguntas ficam em colunas compactas em vez de um dicionário por linha:
+# cada coluna de texto é um único buffer UTF-8 com um array de offsets, o id é um
+# array de inteiros e nível/matéria são códigos para strings internadas. Um
+# índice (nível, matéria) -> posições das linhas é montado na carga, então
+# começar uma partida é só uma consulta no índice mais o sorteio; os dicionários
+# só são criados para as perguntas sorteadas.
+#
+#     python -m jogo.question_bank [caminho/do/quiz_banco.db]   mostra o uso de memória
+import argparse
+import os
+import sqlite3
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+
+from jogo.question_sampler import ensure_questions_version, questions_version, sample_from_groups
+
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "quiz_banco.db")
+TEXT_COLUMNS = ("text", "answer_a", "answer_b", "answer_c", "answer_d", "correct_answer", "tip")
+
+_banks = {}  # Caminho do banco -> QuestionBank (um por processo)
+_banks_lock = threading.Lock()
+
+
+class TextColumn:
+    """Coluna de textos num único buffer UTF-8 (offsets de cada valor num array)."""
+
+    __slots__ = ("buffer", "offsets", "nulls")
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.offsets = array("I", [0])  # Valor i = buffer[offsets[i]:offsets[i + 1]]
+        self.nulls = set()  # Linhas com NULL no banco (raras)
+
+    def append(self, value):
+        if value is None:
+            self.nulls.add(len(self.offsets) - 1)
+        else:
+            self.buffer += value.encode("utf-8")
+        self.offsets.append(len(self.buffer))
+
+    def __getitem__(self, row):
+        if row in self.nulls:
+            return None
+        return self.buffer[self.offsets[row]:self.offsets[row + 1]].decode("utf-8")
+
+    def nbytes(self):
+        return sys.getsizeof(self.buffer) + sys.getsizeof(self.offsets) + sys.getsizeof(self.nulls)
+
+
+class CodeColumn:
+    """Coluna com poucos valores distintos (nível, matéria): códigos para strings internadas."""
+
+    __slots__ = ("values", "codes", "_code_of")
+
+    def __init__(self):
+        self.values = []  # Código -> string internada
+        self.codes = array("H")  # Linha -> código
+        self._code_of = {}
+
+    def append(self, value):
+        code = self._code_of.get(value)
+        if code is None:
+            code = self._code_of[value] = len(self.values)
+            self.values.append(sys.intern(value) if isinstance(value, str) else value)
+        self.codes.append(code)
+
+    def __getitem__(self, row):
+        return self.values[self.codes[row]]
+
+    def nbytes(self):
+        return sys.getsizeof(self.codes) + sum(sys.getsizeof(value) for value in self.values)
+
+
+class QuestionBank:
+    """Todas as perguntas do banco em colunas compactas, com índice por (nível, matéria).
+
+    Tem a mesma interface de sorteio do QuestionSampler (sample/count); com o
+    mesmo gerador, os dois sorteiam as mesmas perguntas.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.loaded_version = None  # questions_version na carga (None: banco sem a tabela de versão)
+        self.load()
+
+    def _reset(self):
+        self.ids = array("q")
+        self.text_columns = {name: TextColumn() for name in TEXT_COLUMNS}
+        self.levels = CodeColumn()
+        self.subjects = CodeColumn()
+        self.index = {}  # (nível, matéria) -> array de posições das linhas (em ordem de id)
+        self._group_ids = {}  # (nível, matéria) -> array de ids (montado no primeiro uso)
+
+    def load(self):
+        """Lê a tabela questions inteira (linha a linha, sem fetchall) para as colunas."""
+        self._reset()
+        conn = sqlite3.connect(self.db_path)
+        try:
+            try:
+                ensure_questions_version(conn)
+            except sqlite3.OperationalError as e:
+                print(f"QuestionBank: banco somente leitura, recarregue com load() ({e})")
+            self.loaded_version = questions_version(conn)
+            rows = conn.execute(f"SELECT id, level, subject, {', '.join(TEXT_COLUMNS)} FROM questions ORDER BY id")
+            for row_id, level, subject, *texts in rows:
+                position = len(self.ids)
+                self.ids.append(row_id)
+                self.levels.append(level)
+                self.subjects.append(subject)
+                for column, value in zip(self.text_columns.values(), texts):
+                    column.append(value)
+                key = (self.levels[position], self.subjects[position])
+                if key not in self.index:
+                    self.index[key] = array("I")
+                self.index[key].append(position)
+        finally:
+            conn.close()
+
+    def is_stale(self):
+        # Perguntas inseridas, editadas ou removidas desde a carga (ex.: o importador rodou):
+        # só lê o contador de questions_version (gatilhos em questions, ver question_sampler),
+        # que não muda com as gravações do ranking no mesmo arquivo. Sem a tabela de versão
+        # (banco somente leitura), só um load() explícito recarrega
+        if self.loaded_version is None:
+            return False
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return questions_version(conn) != self.loaded_version
+        finally:
+            conn.close()
+
+    def __len__(self):
+        return len(self.ids)
+
+    def question(self, position):
+        """Dicionário da pergunta na posição (mesmo formato usado pela GameScreen)."""
+        text = self.text_columns
+        return {
+            "id": self.ids[position], "text": text["text"][position],
+            "answers": {
+                "A": text["answer_a"][position], "B": text["answer_b"][position],
+                "C": text["answer_c"][position], "D": text["answer_d"][position],
+            },
+            "correct_answer": text["correct_answer"][position], "tip": text["tip"][position],
+            "subject": self.subjects[position], "level": self.levels[position],
+        }
+
+    def count(self, level, subjects):
+        """Quantidade de perguntas disponíveis para o nível e as matérias."""
+        return sum(len(self.index.get((level, subject), ())) for subject in subjects)
+
+    def sample(self, level, subjects, k, rng):
+        """Até k perguntas distintas do nível e das matérias, em ordem sorteada."""
+        groups = [self.index.get((level, subject), ()) for subject in dict.fromkeys(subjects)]
+        if not any(groups):
+            return []
+        return [self.question(position) for position in sample_from_groups(groups, k, rng)]
+
+    def group_ids(self, level, subject):
+        """Ids das perguntas do nível e da matéria, em ordem crescente (mesmo array até o próximo load())."""
+        key = (level, subject)
+        if key not in self._group_ids:
+            self._group_ids[key] = array("q", (self.ids[position] for position in self.index.get(key, ())))
+        return self._group_ids[key]
+
+    def questions_by_id(self, level, subject, ids):
+        """Perguntas com esses ids, na ordem dos ids (busca binária: as linhas estão em ordem de id)."""
+        questions = []
+        for question_id in ids:
+            position = bisect_left(self.ids, question_id)
+            if position < len(self.ids) and self.ids[position] == question_id:
+                questions.append(self.question(position))
+        return questions
+
+    def memory_report(self):
+        """Bytes ocupados por coluna e pelo índice (para dimensionar as máquinas do laboratório)."""
+        columns = {"id": sys.getsizeof(self.ids), "level": self.levels.nbytes(), "subject": self.subjects.nbytes()}
+        columns.update((name, column.nbytes()) for name, column in self.text_columns.items())
+        index_bytes = sys.getsizeof(self.index) + sum(
+            sys.getsizeof(key) + sys.getsizeof(positions) for key, positions in self.index.items()
+        )
+        total = sum(columns.values()) + index_bytes
+        return {
+            "rows": len(self),
+            "columns": columns,
+            "index_bytes": index_bytes,
+            "total_bytes": total,
+            "bytes_per_question": total / len(self) if len(self) else 0.0,
+        }
+
+
+def get_question_bank(db_path):
+    """QuestionBank do processo para o banco (carregado na primeira chamada ou se o arquivo mudou)."""
+    with _banks_lock:
+        bank = _banks.get(db_path)
+        if bank is None:
+            bank = _banks[db_path] = QuestionBank(db_path)
+        elif bank.is_stale():
+            bank.load()
+        return bank
+
+
+def preload(db_path):
+    # Carrega o banco numa thread (o jogo chama após o primeiro frame; só usa sqlite3, não o pygame)
+    if os.path.exists(db_path):
+        threading.Thread(target=get_question_bank, args=(db_path,), name="question-bank", daemon=True).start()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mostra o uso de memória do banco de perguntas em memória.")
+    parser.add_argument("db", nargs="?", default=DEFAULT_DB_PATH, help="arquivo SQLite com a tabela questions")
+    args = parser.parse_args()
+
+    bank = get_question_bank(args.db)
+    report = bank.memory_report()
+    print(f"{report['rows']} perguntas, {len(bank.index)} combinações nível/matéria")
+    for name, nbytes in report["columns"].items():
+        print(f"  {name:<16}{nbytes / 1024:>12.1f} KiB")
+    print(f"  {'índice':<16}{report['index_bytes'] / 1024:>12.1f} KiB")
+    print(f"Total: {report['total_bytes'] / 1024 / 1024:.2f} MiB ({report['bytes_per_question']:.0f} bytes por pergunta)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,219 @@
+# Pacote binário de perguntas (.qpack), aberto com mmap.
+#
+# O compilador lê a tabela questions do quiz_banco.db e grava um único arquivo:
+#
+#     cabeçalho      HEADER (magic, versão, quantidades e offsets das seções)
+#     strings        textos UTF-8 concatenados (textos repetidos são gravados uma vez)
+#     registros      RECORD por pergunta, largura fixa: id + (offset, tamanho) de cada texto
+#     grupos         GROUP por (nível, matéria): strings do nível/matéria + faixa de registros
+#
+# Os registros são ordenados por (nível, matéria, id), então cada grupo é uma faixa
+# contínua. O jogo mapeia o arquivo e só decodifica as perguntas sorteadas: abrir
+# é instantâneo e a memória residente fica nas páginas realmente lidas.
+#
+#     python -m jogo.question_pack [--db quiz_banco.db] [--output quiz_banco.qpack]
+import argparse
+import mmap
+import os
+import sqlite3
+import struct
+import threading
+from array import array
+from bisect import bisect_left
+
+from jogo.question_sampler import sample_from_groups
+
+MAGIC = b"JMQP"
+VERSION = 1
+HEADER = struct.Struct("<4sHHIIQQQQ")  # magic, versão, reservado, registros, grupos, offsets/tamanho das seções
+TEXT_FIELDS = ("text", "answer_a", "answer_b", "answer_c", "answer_d", "correct_answer", "tip", "subject", "level")
+RECORD = struct.Struct("<q" + "II" * len(TEXT_FIELDS))  # id + (offset, tamanho) de cada campo
+ID_FIELD = struct.Struct("<q")  # Só o id, no início do registro
+GROUP = struct.Struct("<IIIIII")  # nível (offset, tamanho), matéria (offset, tamanho), primeiro registro, quantidade
+NULL_LENGTH = 0xFFFFFFFF  # Tamanho que marca um NULL do banco
+
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "quiz_banco.db")
+DEFAULT_PACK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "quiz_banco.qpack")
+
+_packs = {}  # Caminho -> (QuestionPack aberto, (mtime, tamanho) do arquivo na abertura)
+_packs_lock = threading.Lock()
+
+
+class _StringTable:
+    # Acumula as strings do pacote, gravando cada texto distinto uma única vez
+    def __init__(self):
+        self.data = bytearray()
+        self._refs = {}
+
+    def ref(self, value):
+        if value is None:
+            return 0, NULL_LENGTH
+        ref = self._refs.get(value)
+        if ref is None:
+            encoded = value.encode("utf-8")
+            ref = self._refs[value] = (len(self.data), len(encoded))
+            self.data += encoded
+        return ref
+
+
+def compile_pack(db_path, pack_path):
+    """Gera o pacote a partir da tabela questions. Retorna (perguntas, grupos)."""
+    strings = _StringTable()
+    records = bytearray()
+    groups = []  # [nível, matéria, primeiro registro, quantidade]
+
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute(f"SELECT id, {', '.join(TEXT_FIELDS)} FROM questions ORDER BY level, subject, id")
+        for count, (row_id, *values) in enumerate(rows):
+            level, subject = values[-1], values[-2]
+            if not groups or groups[-1][0] != level or groups[-1][1] != subject:
+                groups.append([level, subject, count, 0])
+            groups[-1][3] += 1
+            fields = []
+            for value in values:
+                fields.extend(strings.ref(value))
+            records += RECORD.pack(row_id, *fields)
+    finally:
+        conn.close()
+
+    group_data = bytearray()
+    for level, subject, first, count in groups:
+        group_data += GROUP.pack(*strings.ref(level), *strings.ref(subject), first, count)
+
+    n_records = len(records) // RECORD.size
+    strings_offset = HEADER.size
+    records_offset = strings_offset + len(strings.data)
+    groups_offset = records_offset + len(records)
+    header = HEADER.pack(MAGIC, VERSION, 0, n_records, len(groups), strings_offset, len(strings.data), records_offset, groups_offset)
+
+    # Escreve num arquivo temporário e troca no final: um pacote aberto pelo jogo nunca fica pela metade
+    tmp_path = pack_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(strings.data)
+        f.write(records)
+        f.write(group_data)
+    os.replace(tmp_path, pack_path)
+    return n_records, len(groups)
+
+
+class QuestionPack:
+    """Perguntas de um .qpack mapeado em memória, decodificadas sob demanda.
+
+    Tem a mesma interface de sorteio do QuestionBank e do QuestionSampler; com
+    o mesmo gerador, sorteia as mesmas perguntas.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+
+        magic, version, _reserved, n_records, n_groups, strings_offset, _strings_size, records_offset, groups_offset = \
+            HEADER.unpack_from(self._view, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"'{path}' não é um pacote de perguntas v{VERSION}")
+        self._records = n_records
+        self._strings_offset = strings_offset
+        self._records_offset = records_offset
+
+        # Índice (nível, matéria) -> faixa de registros (os grupos são poucos: lidos na abertura)
+        self.index = {}
+        self._group_ids = {}  # (nível, matéria) -> array de ids (lido dos registros no primeiro uso)
+        for i in range(n_groups):
+            level_off, level_len, subject_off, subject_len, first, count = \
+                GROUP.unpack_from(self._view, groups_offset + i * GROUP.size)
+            key = (self._string(level_off, level_len), self._string(subject_off, subject_len))
+            self.index[key] = range(first, first + count)
+
+    def _string(self, offset, length):
+        if length == NULL_LENGTH:
+            return None
+        start = self._strings_offset + offset
+        return str(self._view[start:start + length], "utf-8")  # Decodifica direto do mapa, sem cópia intermediária
+
+    def __len__(self):
+        return self._records
+
+    def question(self, position):
+        """Dicionário da pergunta no registro (mesmo formato usado pela GameScreen)."""
+        row_id, *refs = RECORD.unpack_from(self._view, self._records_offset + position * RECORD.size)
+        text, answer_a, answer_b, answer_c, answer_d, correct_answer, tip, subject, level = (
+            self._string(refs[i], refs[i + 1]) for i in range(0, len(refs), 2)
+        )
+        return {
+            "id": row_id, "text": text,
+            "answers": {"A": answer_a, "B": answer_b, "C": answer_c, "D": answer_d},
+            "correct_answer": correct_answer, "tip": tip, "subject": subject, "level": level,
+        }
+
+    def count(self, level, subjects):
+        """Quantidade de perguntas disponíveis para o nível e as matérias."""
+        return sum(len(self.index.get((level, subject), ())) for subject in subjects)
+
+    def sample(self, level, subjects, k, rng):
+        """Até k perguntas distintas do nível e das matérias, em ordem sorteada."""
+        groups = [self.index.get((level, subject), ()) for subject in dict.fromkeys(subjects)]
+        if not any(groups):
+            return []
+        return [self.question(position) for position in sample_from_groups(groups, k, rng)]
+
+    def group_ids(self, level, subject):
+        """Ids das perguntas do nível e da matéria, em ordem crescente (lidos dos registros no primeiro uso)."""
+        key = (level, subject)
+        if key not in self._group_ids:
+            base = self._records_offset
+            self._group_ids[key] = array("q", (
+                ID_FIELD.unpack_from(self._view, base + position * RECORD.size)[0] for position in self.index.get(key, ())
+            ))
+        return self._group_ids[key]
+
+    def questions_by_id(self, level, subject, ids):
+        """Perguntas do grupo com esses ids, na ordem dos ids (busca binária na faixa do grupo)."""
+        positions = self.index.get((level, subject), range(0))
+        group_ids = self.group_ids(level, subject)
+        questions = []
+        for question_id in ids:
+            i = bisect_left(group_ids, question_id)
+            if i < len(group_ids) and group_ids[i] == question_id:
+                questions.append(self.question(positions[i]))
+        return questions
+
+    def close(self):
+        self._view.release()
+        self._mmap.close()
+
+
+def open_question_pack(path):
+    """QuestionPack do processo para o arquivo (aberto na primeira chamada ou se o arquivo foi trocado)."""
+    with _packs_lock:
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size)
+        pack, opened_signature = _packs.get(path, (None, None))
+        if pack is None or opened_signature != signature:
+            # Fecha o mapa do pacote antigo (no Windows ele prende o arquivo). Quem usa o pacote
+            # o pede a cada sorteio e não guarda referências: as perguntas decodificadas e os
+            # ids de group_ids() são cópias independentes do mapa
+            new_pack = QuestionPack(path)
+            if pack is not None:
+                pack.close()
+            pack = new_pack
+            _packs[path] = (pack, signature)
+        return pack
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compila o banco de perguntas num pacote binário (.qpack).")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help="arquivo SQLite com a tabela questions")
+    parser.add_argument("--output", default=DEFAULT_PACK_PATH, help="arquivo .qpack gerado")
+    args = parser.parse_args()
+
+    records, groups = compile_pack(args.db, args.output)
+    print(f"{records} perguntas em {groups} combinações nível/matéria -> {args.output} ({os.path.getsize(args.output) / 1024:.1f} KiB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+# Sorteio das perguntas da partida direto no banco.
+#
+# Em vez de ler todas as perguntas do nível e das matérias, montar um dicionário
+# para cada uma e embaralhar a lista inteira, o sorteador guarda em memória só os
+# ids de cada (nível, matéria), lidos uma vez pelo índice idx_questions_level_subject.
+# A cada partida sorteia as posições necessárias e busca apenas essas linhas pela
+# chave primária: o custo por partida não cresce com o tamanho do banco.
+#
+# O cache de ids só é descartado quando a tabela questions muda: um contador na tabela
+# questions_version, incrementado por gatilhos a cada INSERT/UPDATE/DELETE (o importador
+# desliga os gatilhos numa importação grande e incrementa uma vez por transação). O
+# PRAGMA data_version não serve: muda com qualquer gravação no arquivo, como as do
+# ranking e das estatísticas das perguntas ao fim de cada partida.
+import sqlite3
+
+CREATE_LEVEL_SUBJECT_INDEX = "CREATE INDEX IF NOT EXISTS idx_questions_level_subject ON questions (level, subject)"
+
+CREATE_VERSION_TABLE = "CREATE TABLE IF NOT EXISTS questions_version (version INTEGER NOT NULL)"
+BUMP_VERSION = "UPDATE questions_version SET version = version + 1"
+VERSION_TRIGGERS = {
+    f"questions_version_{event.lower()}": f"CREATE TRIGGER IF NOT EXISTS questions_version_{event.lower()} "
+                                           f"AFTER {event} ON questions BEGIN {BUMP_VERSION}; END"
+    for event in ("INSERT", "UPDATE", "DELETE")
+}
+
+QUESTION_COLUMNS = "id, text, answer_a, answer_b, answer_c, answer_d, correct_answer, tip, subject, level"
+
+
+def question_from_row(row):
+    # Linha da tabela questions -> dicionário usado pela GameScreen
+    return {
+        "id": row["id"], "text": row["text"],
+        "answers": {"A": row["answer_a"], "B": row["answer_b"], "C": row["answer_c"], "D": row["answer_d"]},
+        "correct_answer": row["correct_answer"], "tip": row["tip"], "subject": row["subject"], "level": row["level"]
+    }
+
+
+def ensure_questions_version(conn):
+    """Cria a tabela questions_version e os gatilhos que faltarem (idempotente)."""
+    with conn:
+        conn.execute(CREATE_VERSION_TABLE)
+        if conn.execute("SELECT count(*) FROM questions_version").fetchone()[0] == 0:
+            conn.execute("INSERT INTO questions_version (version) VALUES (0)")
+        for trigger in VERSION_TRIGGERS.values():
+            conn.execute(trigger)
+
+
+def suspend_questions_version(conn):
+    # Desliga os gatilhos antes de uma importação grande (quem grava chama bump_questions_version
+    # uma vez por transação); ensure_questions_version() os recria
+    with conn:
+        for name in VERSION_TRIGGERS:
+            conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+
+
+def bump_questions_version(conn):
+    # Incrementa a versão dentro da transação atual de quem grava
+    conn.execute(BUMP_VERSION)
+
+
+def questions_version(conn):
+    """Versão atual das perguntas, ou None se o banco não tem a tabela questions_version."""
+    try:
+        row = conn.execute("SELECT version FROM questions_version").fetchone()
+    except sqlite3.OperationalError:
+        return None
+    return None if row is None else row[0]
+
+
+def sample_from_groups(groups, k, rng):
+    """Sorteia até k itens distintos de vários grupos (sequências) como se fossem uma lista só.
+
+    Usado pelo QuestionSampler, pelo QuestionBank e pelo QuestionPack: com o mesmo
+    gerador, os três sorteiam as mesmas perguntas. O sorteio por dificuldade
+    (QuestionStats) usa group_ids()/questions_by_id() das três origens.
+    """
+    total = sum(len(group) for group in groups)
+    chosen = []
+    for position in rng.sample(range(total), min(k, total)):
+        for group in groups:
+            if position < len(group):
+                chosen.append(group[position])
+                break
+            position -= len(group)
+    return chosen
+
+
+class QuestionSampler:
+    """Sorteia perguntas por nível e matérias buscando só as linhas sorteadas.
+
+    Os ids de cada (nível, matéria) ficam em cache enquanto as perguntas não mudam
+    (questions_version); o sorteio usa o gerador recebido (o do jogo, com semente).
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._conn = None
+        self._ids = {}  # (nível, matéria) -> tupla de ids em ordem
+        self._version = None
+
+    def _connect(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path)
+            self._conn.row_factory = sqlite3.Row  # Permite acessar colunas pelo nome
+            try:
+                self._conn.execute(CREATE_LEVEL_SUBJECT_INDEX)
+                self._conn.commit()
+                ensure_questions_version(self._conn)
+            except sqlite3.OperationalError as e:
+                # Banco somente leitura: funciona sem o índice (mais lento em bancos grandes)
+                # e, sem a versão das perguntas, volta ao PRAGMA data_version
+                print(f"QuestionSampler: não foi possível criar o índice ({e})")
+        return self._conn
+
+    def _ids_for(self, level, subject):
+        conn = self._connect()
+        version = questions_version(conn)
+        if version is None:
+            version = ("data_version", conn.execute("PRAGMA data_version").fetchone()[0])
+        if version != self._version:
+            # O importador de perguntas alterou a tabela questions: descarta o cache
+            self._ids.clear()
+            self._version = version
+        key = (level, subject)
+        if key not in self._ids:
+            rows = conn.execute("SELECT id FROM questions WHERE level = ? AND subject = ? ORDER BY id", key)
+            self._ids[key] = tuple(row[0] for row in rows)
+        return self._ids[key]
+
+    def count(self, level, subjects):
+        """Quantidade de perguntas disponíveis para o nível e as matérias."""
+        return sum(len(self._ids_for(level, subject)) for subject in subjects)
+
+    def group_ids(self, level, subject):
+        """Ids das perguntas do nível e da matéria, em ordem crescente (mesma tupla enquanto o banco não muda)."""
+        return self._ids_for(level, subject)
+
+    def questions_by_id(self, level, subject, ids):
+        """Perguntas com esses ids (do grupo nível/matéria), na ordem dos ids."""
+        placeholders = ", ".join("?" * len(ids))
+        rows = self._connect().execute(f"SELECT {QUESTION_COLUMNS} FROM questions WHERE id IN ({placeholders})", list(ids))
+        by_id = {row["id"]: question_from_row(row) for row in rows}
+        return [by_id[question_id] for question_id in ids if question_id in by_id]
+
+    def sample(self, level, subjects, k, rng):
+        """Até k perguntas distintas do nível e das matérias, em ordem sorteada."""
+        groups = [self._ids_for(level, subject) for subject in dict.fromkeys(subjects)]
+        if not any(groups):
+            return []
+        return self.questions_by_id(level, None, sample_from_groups(groups, k, rng))
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,247 @@
+# Busca textual nas perguntas do quiz_banco.db (enunciado, alternativas e dica).
+#
+# O índice é uma tabela FTS5 (questions_fts) com conteúdo externo: guarda só o índice
+# invertido, os textos continuam na tabela questions. Gatilhos mantêm o índice em dia
+# a cada INSERT/UPDATE/DELETE em questions; importações grandes desligam os gatilhos
+# (suspend_search_index) e reconstroem o índice uma vez no fim, o que é bem mais rápido
+# que atualizá-lo linha a linha. O índice é criado (ou reconstruído, se faltar um
+# gatilho) só pelo importador (perguntas/criar_banco_sqlite.py); a busca abre o banco
+# somente para leitura e, sem o índice, levanta SearchIndexError em vez de criá-lo.
+#
+# Nível e matéria também são colunas do índice: os filtros entram na própria expressão
+# MATCH e a ordenação por relevância só lê o índice. As perguntas da página são lidas
+# depois pela chave primária, e o trecho destacado é montado em Python só para elas.
+#
+#     python -m jogo.question_search "fotossíntese" [--db ...] [--nivel medio] [--materia naturais]
+import argparse
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from urllib.parse import quote
+
+from jogo.question_sampler import QUESTION_COLUMNS, question_from_row
+
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "quiz_banco.db")
+SEARCH_COLUMNS = ("text", "answer_a", "answer_b", "answer_c", "answer_d", "tip")
+FILTER_COLUMNS = ("subject", "level")
+INDEX_COLUMNS = SEARCH_COLUMNS + FILTER_COLUMNS
+COLUMN_WEIGHTS = (10.0, 2.0, 2.0, 2.0, 2.0, 1.0, 0.0, 0.0)  # Peso de cada coluna no bm25 (enunciado vale mais)
+MAX_PAGE_SIZE = 100
+
+# remove_diacritics: "fotossintese" encontra "fotossíntese"
+CREATE_SEARCH_TABLE = f"""
+CREATE VIRTUAL TABLE questions_fts USING fts5(
+    {', '.join(INDEX_COLUMNS)},
+    content='questions', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+)
+"""
+SET_RANK = f"INSERT INTO questions_fts (questions_fts, rank) VALUES ('rank', 'bm25({', '.join(map(str, COLUMN_WEIGHTS))})')"
+
+_NEW_VALUES = ", ".join(f"new.{column}" for column in INDEX_COLUMNS)
+_OLD_VALUES = ", ".join(f"old.{column}" for column in INDEX_COLUMNS)
+SEARCH_TRIGGERS = {
+    "questions_fts_insert": f"""CREATE TRIGGER questions_fts_insert AFTER INSERT ON questions BEGIN
+        INSERT INTO questions_fts (rowid, {', '.join(INDEX_COLUMNS)}) VALUES (new.id, {_NEW_VALUES});
+    END""",
+    "questions_fts_delete": f"""CREATE TRIGGER questions_fts_delete AFTER DELETE ON questions BEGIN
+        INSERT INTO questions_fts (questions_fts, rowid, {', '.join(INDEX_COLUMNS)}) VALUES ('delete', old.id, {_OLD_VALUES});
+    END""",
+    "questions_fts_update": f"""CREATE TRIGGER questions_fts_update AFTER UPDATE ON questions BEGIN
+        INSERT INTO questions_fts (questions_fts, rowid, {', '.join(INDEX_COLUMNS)}) VALUES ('delete', old.id, {_OLD_VALUES});
+        INSERT INTO questions_fts (rowid, {', '.join(INDEX_COLUMNS)}) VALUES (new.id, {_NEW_VALUES});
+    END""",
+}
+
+# Passo 1: ids da página, ordenados por relevância (só o índice é lido)
+RANKED_IDS_QUERY = "SELECT rowid, rank FROM questions_fts WHERE questions_fts MATCH ? ORDER BY rank LIMIT ? OFFSET ?"
+
+# Passo 2: as perguntas dessas linhas
+PAGE_QUERY = f"SELECT {QUESTION_COLUMNS} FROM questions WHERE id IN ({{ids}})"
+
+EXCERPT_WORDS = 12  # Palavras no trecho destacado de textos longos
+
+_WORD = re.compile(r"\w+")
+
+
+def _fold(word):
+    # Minúsculas e sem acentos, como o tokenizador do índice
+    return "".join(c for c in unicodedata.normalize("NFKD", word.lower()) if not unicodedata.combining(c))
+
+
+def excerpt(values, words):
+    """Trecho da primeira coluna que contém uma das palavras, com elas entre colchetes.
+
+    Segue a expressão da busca: palavras inteiras, e a última também como prefixo.
+    """
+    exact = {_fold(word) for word in words}
+    prefix = _fold(words[-1])
+    for value in values:
+        if not value:
+            continue
+        tokens = list(_WORD.finditer(value))
+        hits = [i for i, token in enumerate(tokens) if _fold(token.group()) in exact or _fold(token.group()).startswith(prefix)]
+        if not hits:
+            continue
+        first = max(0, min(hits[0] - EXCERPT_WORDS // 3, len(tokens) - EXCERPT_WORDS))
+        window = tokens[first:first + EXCERPT_WORDS]
+        start = 0 if first == 0 else window[0].start()
+        end = len(value) if first + EXCERPT_WORDS >= len(tokens) else window[-1].end()
+        parts, position = [], start
+        for i in hits:
+            token = tokens[i]
+            if start <= token.start() and token.end() <= end:
+                parts += [value[position:token.start()], "[", token.group(), "]"]
+                position = token.end()
+        parts.append(value[position:end])
+        return ("…" if start > 0 else "") + "".join(parts) + ("…" if end < len(value) else "")
+    return values[0]
+
+
+class SearchIndexError(RuntimeError):
+    """O banco não existe ou não tem o índice de busca: é preciso rodar o importador."""
+
+
+def ensure_search_index(conn):
+    """Cria o índice e os gatilhos que faltarem; retorna True se o índice foi reconstruído agora."""
+    existing = {row[0] for row in conn.execute(
+        "SELECT name FROM sqlite_master WHERE name = 'questions_fts' OR (type = 'trigger' AND name LIKE 'questions_fts_%')"
+    )}
+    missing_triggers = [name for name in SEARCH_TRIGGERS if name not in existing]
+    if "questions_fts" in existing and not missing_triggers:
+        return False
+    with conn:
+        if "questions_fts" not in existing:
+            conn.execute(CREATE_SEARCH_TABLE)
+            conn.execute(SET_RANK)
+        for name in missing_triggers:
+            conn.execute(SEARCH_TRIGGERS[name])
+        # Sem algum gatilho, o índice pode ter perdido alterações: reindexa a tabela inteira
+        conn.execute("INSERT INTO questions_fts (questions_fts) VALUES ('rebuild')")
+    return True
+
+
+def suspend_search_index(conn):
+    # Desliga a atualização linha a linha antes de uma importação grande; o próximo
+    # ensure_search_index() reconstrói o índice de uma vez
+    with conn:
+        for name in SEARCH_TRIGGERS:
+            conn.execute(f"DROP TRIGGER IF EXISTS {name}")
+
+
+def _quoted(value):
+    return '"' + value.replace('"', '""') + '"'
+
+
+def match_expression(text, level=None, subject=None):
+    """Texto digitado -> expressão MATCH: todas as palavras (a última também como prefixo).
+
+    Cada palavra vai entre aspas, então aspas, operadores e parênteses digitados
+    não quebram a consulta. As palavras só são procuradas no enunciado, nas
+    alternativas e na dica; nível e matéria viram filtros de coluna.
+    """
+    words = _WORD.findall(text)
+    if not words:
+        return None
+    terms = [_quoted(word) for word in words]
+    terms[-1] += "*"
+    expression = "{" + " ".join(SEARCH_COLUMNS) + "} : (" + " ".join(terms) + ")"
+    if level is not None:
+        expression += f" AND level : {_quoted(level)}"
+    if subject is not None:
+        expression += f" AND subject : {_quoted(subject)}"
+    return expression
+
+
+class QuestionSearch:
+    """Busca paginada e ordenada por relevância (bm25) nas perguntas de um banco.
+
+    Guarda uma conexão por thread (a API atende cada requisição numa thread do pool).
+    """
+
+    def __init__(self, db_path=DEFAULT_DB_PATH):
+        self.db_path = db_path
+        self._local = threading.local()
+
+    def _connect(self):
+        # Somente leitura: a busca nunca altera o banco (nem cria o índice)
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            if not os.path.exists(self.db_path):
+                raise SearchIndexError(f"banco de perguntas '{self.db_path}' não encontrado")
+            conn = sqlite3.connect(f"file:{quote(os.path.abspath(self.db_path))}?mode=ro", uri=True)
+            try:
+                has_index = conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'questions_fts'").fetchone()
+            except sqlite3.Error:
+                conn.close()
+                raise
+            if has_index is None:
+                conn.close()
+                raise SearchIndexError(
+                    f"o banco '{self.db_path}' não tem o índice de busca (questions_fts); "
+                    "gere-o com python perguntas/criar_banco_sqlite.py --banco <arquivo>"
+                )
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+        return conn
+
+    def search(self, text, level=None, subject=None, page=1, page_size=20):
+        """Uma página de resultados: (perguntas, há_próxima_página).
+
+        Cada pergunta vem no formato da GameScreen, com "excerpt" (trecho com os
+        termos entre colchetes) e "score" (bm25: menor é mais relevante).
+        """
+        expression = match_expression(text, level, subject)
+        if expression is None:
+            return [], False
+        page_size = max(1, min(page_size, MAX_PAGE_SIZE))
+        conn = self._connect()
+        # Uma linha a mais que a página só para saber se existe a próxima (sem contar todos os resultados)
+        ranked = conn.execute(RANKED_IDS_QUERY, (expression, page_size + 1, (max(page, 1) - 1) * page_size)).fetchall()
+        scores = {row_id: score for row_id, score in ranked[:page_size]}
+        if not scores:
+            return [], False
+        rows = conn.execute(PAGE_QUERY.format(ids=", ".join("?" * len(scores))), tuple(scores)).fetchall()
+        words = _WORD.findall(text)
+        by_id = {}
+        for row in rows:
+            question = by_id[row["id"]] = question_from_row(row)
+            question["excerpt"] = excerpt([row[column] for column in SEARCH_COLUMNS], words)
+            question["score"] = scores[row["id"]]
+        return [by_id[row_id] for row_id in scores if row_id in by_id], len(ranked) > page_size
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Busca perguntas pelo texto do enunciado, das alternativas e da dica.")
+    parser.add_argument("texto", help="palavras procuradas (todas precisam aparecer; a última vale como prefixo)")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help="arquivo SQLite com a tabela questions")
+    parser.add_argument("--nivel", default=None)
+    parser.add_argument("--materia", default=None)
+    parser.add_argument("--pagina", type=int, default=1)
+    parser.add_argument("--por-pagina", type=int, default=10)
+    args = parser.parse_args()
+
+    search = QuestionSearch(args.db)
+    try:
+        search._connect()  # Abre a conexão e confere o índice fora da medição
+    except SearchIndexError as e:
+        parser.error(str(e))
+    start = time.perf_counter()
+    results, has_next = search.search(args.texto, args.nivel, args.materia, args.pagina, args.por_pagina)
+    elapsed = time.perf_counter() - start
+    for result in results:
+        print(f"[{result['id']}] {result['level']}/{result['subject']}  {result['excerpt']}")
+    print(f"{len(results)} resultado(s) na página {args.pagina}{' (há mais)' if has_next else ''} em {elapsed * 1000:.2f} ms")
+    search.close()
+
+
+if __name__ == "__main__":
+    main()
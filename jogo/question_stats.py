@@ -0,0 +1,276 @@
+# Dificuldade empírica das perguntas e sorteio da partida em ordem de dificuldade.
+#
+# Cada pergunta tem dois contadores (tentativas e acertos), atualizados em O(1) a cada
+# resposta; uma thread os grava em lotes na tabela question_stats, como o RankingStore
+# faz com os pontos. A dificuldade é a taxa de erro suavizada (erros + 1) / (tentativas + 2):
+# uma pergunta nunca respondida vale 0.5 e poucas respostas não a levam aos extremos.
+#
+# Os ids de cada (nível, matéria) ficam separados em BUCKETS faixas de dificuldade. Cada
+# faixa é uma lista com o índice inverso id -> posição, então mudar uma pergunta de faixa
+# (troca com a última e pop) e sortear dentro de uma faixa custam O(1). As faixas de um
+# grupo são montadas uma vez por processo com os ids vindos da origem das perguntas
+# (QuestionSampler, QuestionBank ou QuestionPack) e, quando as perguntas mudam, só
+# recebem os ids novos e perdem os removidos. Na partida, o degrau i da tabela de
+# prêmios sorteia na faixa que contém o quantil (i + 0.5) / k das perguntas disponíveis,
+# e só as perguntas sorteadas são buscadas por id: o banco nunca é percorrido.
+#
+#     python -m jogo.question_stats [--db ...] [--nivel medio]   mostra as faixas de cada grupo
+import argparse
+import os
+import sqlite3
+import threading
+from bisect import bisect_right
+from itertools import accumulate
+
+FLUSH_INTERVAL_S = 5.0  # Intervalo máximo entre gravações dos contadores pendentes
+BUCKETS = 10  # Faixas de dificuldade (0 = mais fácil)
+
+CREATE_STATS_TABLE = """
+CREATE TABLE IF NOT EXISTS question_stats (
+    question_id INTEGER PRIMARY KEY,
+    attempts INTEGER NOT NULL,
+    correct INTEGER NOT NULL
+)
+"""
+
+UPSERT_STATS = """
+INSERT INTO question_stats (question_id, attempts, correct) VALUES (?, ?, ?)
+ON CONFLICT (question_id) DO UPDATE SET attempts = attempts + excluded.attempts, correct = correct + excluded.correct
+"""
+
+
+def difficulty(attempts, correct):
+    """Taxa de erro suavizada, entre 0 (fácil) e 1 (difícil); 0.5 sem respostas."""
+    return (attempts - correct + 1) / (attempts + 2)
+
+
+def bucket_of(attempts, correct):
+    return min(int(difficulty(attempts, correct) * BUCKETS), BUCKETS - 1)
+
+
+class DifficultyBuckets:
+    """Ids de um grupo (nível, matéria) separados por faixa de dificuldade."""
+
+    __slots__ = ("buckets", "positions")
+
+    def __init__(self):
+        self.buckets = [[] for _ in range(BUCKETS)]
+        self.positions = {}  # id -> posição na lista da sua faixa
+
+    def __len__(self):
+        return len(self.positions)
+
+    def __contains__(self, question_id):
+        return question_id in self.positions
+
+    def add(self, question_id, bucket):
+        items = self.buckets[bucket]
+        self.positions[question_id] = len(items)
+        items.append(question_id)
+
+    def remove(self, question_id, bucket):
+        # Troca com o último da faixa e remove do fim: O(1), a ordem dentro da faixa não importa
+        items = self.buckets[bucket]
+        position = self.positions.pop(question_id)
+        last = items.pop()
+        if last != question_id:
+            items[position] = last
+            self.positions[last] = position
+
+    def sizes(self):
+        return [len(items) for items in self.buckets]
+
+
+class QuestionStats:
+    """Contadores de tentativas e acertos por pergunta, lidos do banco uma vez e gravados em lotes.
+
+    record() só altera a memória (pode ser chamado no meio do frame) e move a pergunta
+    de faixa se a dificuldade mudou. Tudo é usado na thread principal; a thread de
+    gravação só lê o buffer pendente. counts substitui os contadores gravados no banco
+    (o replay de uma sessão parte do snapshot() feito na gravação).
+    """
+
+    def __init__(self, db_path, flush_interval=FLUSH_INTERVAL_S, counts=None):
+        self.db_path = db_path
+        self.flush_interval = flush_interval
+        self._counts = self._load()  # id -> (tentativas, acertos)
+        if counts is not None:
+            self._counts = {question_id: (attempts, hits) for question_id, attempts, hits in counts}
+        self._groups = {}  # (nível, matéria) -> (ids da origem, DifficultyBuckets)
+        self._lock = threading.Lock()
+        self._pending = {}  # id -> [tentativas, acertos] ainda não gravados
+        self._flush_requested = threading.Event()
+        self._closing = False
+        self._writer = threading.Thread(target=self._writer_loop, name="question-stats-writer", daemon=True)
+        self._writer.start()
+
+    def _load(self):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            conn.execute(CREATE_STATS_TABLE)
+            conn.commit()
+            return {row[0]: (row[1], row[2]) for row in conn.execute("SELECT question_id, attempts, correct FROM question_stats")}
+        finally:
+            conn.close()
+
+    def counts(self, question_id):
+        """(tentativas, acertos) da pergunta, incluindo as respostas ainda não gravadas."""
+        return self._counts.get(question_id, (0, 0))
+
+    def snapshot(self):
+        """Contadores atuais como [[id, tentativas, acertos], ...] (gravados no log da sessão)."""
+        return [[question_id, attempts, hits] for question_id, (attempts, hits) in sorted(self._counts.items())]
+
+    def difficulty(self, question_id):
+        return difficulty(*self.counts(question_id))
+
+    def record(self, question, correct):
+        """Conta uma resposta à pergunta (dicionário da GameScreen; perguntas sem id são ignoradas)."""
+        question_id = question.get("id")
+        if question_id is None:
+            return
+        attempts, hits = self.counts(question_id)
+        old_bucket = bucket_of(attempts, hits)
+        attempts, hits = attempts + 1, hits + bool(correct)
+        self._counts[question_id] = (attempts, hits)
+        new_bucket = bucket_of(attempts, hits)
+        group = self._groups.get((question.get("level"), question.get("subject")))
+        if new_bucket != old_bucket and group is not None and question_id in group[1]:
+            group[1].remove(question_id, old_bucket)
+            group[1].add(question_id, new_bucket)
+        with self._lock:
+            pending = self._pending.setdefault(question_id, [0, 0])
+            pending[0] += 1
+            pending[1] += bool(correct)
+
+    def _buckets_for(self, source, level, subject):
+        # As origens devolvem a mesma sequência de ids enquanto as perguntas não mudam
+        # (questions_version, recarga do banco ou um novo .qpack). Se a sequência trocou,
+        # as faixas existentes só recebem os ids novos e perdem os removidos: as demais
+        # perguntas não são reclassificadas
+        ids = source.group_ids(level, subject)
+        cached_ids, buckets = self._groups.get((level, subject), (None, None))
+        if cached_ids is ids:
+            return buckets
+        counts = self._counts
+        if buckets is None:
+            buckets = DifficultyBuckets()
+            for question_id in ids:
+                buckets.add(question_id, bucket_of(*counts.get(question_id, (0, 0))))
+        else:
+            current = set(ids)
+            for question_id in [question_id for question_id in buckets.positions if question_id not in current]:
+                buckets.remove(question_id, bucket_of(*counts.get(question_id, (0, 0))))
+            for question_id in ids:  # Na ordem da origem, como na primeira montagem
+                if question_id not in buckets.positions:
+                    buckets.add(question_id, bucket_of(*counts.get(question_id, (0, 0))))
+        self._groups[(level, subject)] = (ids, buckets)
+        return buckets
+
+    def sample(self, source, level, subjects, k, rng):
+        """Até k perguntas distintas do nível e das matérias, da mais fácil para a mais difícil.
+
+        O degrau i sorteia na faixa do quantil (i + 0.5) / k das perguntas disponíveis,
+        então a escada acompanha a distribuição real de dificuldade do grupo. Com o
+        mesmo gerador e os mesmos contadores, as três origens sorteiam as mesmas perguntas.
+        """
+        groups = [(subject, self._buckets_for(source, level, subject)) for subject in dict.fromkeys(subjects)]
+        groups = [(subject, buckets) for subject, buckets in groups if len(buckets)]
+        if not groups:
+            return []
+        sizes = [sum(column) for column in zip(*(buckets.sizes() for _, buckets in groups))]
+        cumulative = list(accumulate(sizes))
+        total = cumulative[-1]
+        k = min(k, total)
+
+        chosen = []  # (matéria, id, faixa), em ordem de degrau
+        try:
+            for step in range(k):
+                # Os quantis ficam a total / k >= 1 pergunta de distância: a faixa nunca se esgota
+                bucket = bisect_right(cumulative, (2 * step + 1) * total // (2 * k))
+                position = rng.randrange(sum(len(buckets.buckets[bucket]) for _, buckets in groups))
+                for subject, buckets in groups:
+                    items = buckets.buckets[bucket]
+                    if position < len(items):
+                        question_id = items[position]
+                        buckets.remove(question_id, bucket)  # Fora do sorteio até o fim da partida
+                        chosen.append((subject, question_id, bucket))
+                        break
+                    position -= len(items)
+        finally:
+            buckets_of = dict(groups)
+            for subject, question_id, bucket in chosen:
+                buckets_of[subject].add(question_id, bucket)
+
+        # Dentro da mesma faixa, a dificuldade exata desempata (sem respostas, fica a ordem sorteada)
+        chosen.sort(key=lambda item: (item[2], self.difficulty(item[1])))
+        by_id = {}
+        for subject, _buckets in groups:
+            ids = [question_id for chosen_subject, question_id, _bucket in chosen if chosen_subject == subject]
+            if ids:
+                by_id.update((question["id"], question) for question in source.questions_by_id(level, subject, ids))
+        return [by_id[question_id] for _subject, question_id, _bucket in chosen if question_id in by_id]
+
+    def flush(self):
+        # Pede a gravação imediata dos contadores pendentes (não espera terminar)
+        self._flush_requested.set()
+
+    def close(self):
+        """Grava o que estiver pendente e encerra a thread de gravação."""
+        self._closing = True
+        self._flush_requested.set()
+        self._writer.join()
+
+    def _writer_loop(self):
+        # A conexão é criada nesta thread (conexões do sqlite3 não são compartilhadas entre threads)
+        conn = sqlite3.connect(self.db_path)
+        try:
+            while True:
+                self._flush_requested.wait(self.flush_interval)
+                self._flush_requested.clear()
+                self._write_pending(conn)
+                if self._closing:
+                    break
+        finally:
+            conn.close()
+
+    def _write_pending(self, conn):
+        with self._lock:
+            batch, self._pending = self._pending, {}
+        if not batch:
+            return
+        try:
+            with conn:  # Uma transação por lote: ou grava tudo ou nada
+                conn.executemany(UPSERT_STATS, [(question_id, attempts, hits) for question_id, (attempts, hits) in batch.items()])
+        except sqlite3.Error as e:
+            # Banco ocupado/indisponível: devolve o lote ao buffer para a próxima tentativa
+            print(f"QuestionStats: erro ao gravar as estatísticas ({e}); nova tentativa em {self.flush_interval:.0f} s")
+            with self._lock:
+                for question_id, (attempts, hits) in batch.items():
+                    pending = self._pending.setdefault(question_id, [0, 0])
+                    pending[0] += attempts
+                    pending[1] += hits
+
+
+def main():
+    from jogo.question_bank import DEFAULT_DB_PATH, get_question_bank
+
+    parser = argparse.ArgumentParser(description="Mostra quantas perguntas há em cada faixa de dificuldade.")
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help="arquivo SQLite com as tabelas questions e question_stats")
+    parser.add_argument("--nivel", default=None)
+    args = parser.parse_args()
+    if not os.path.exists(args.db):
+        parser.error(f"banco '{args.db}' não encontrado")
+
+    bank = get_question_bank(args.db)
+    stats = QuestionStats(args.db)
+    print(f"{len(stats._counts)} perguntas com respostas registradas; faixas 0 (fácil) a {BUCKETS - 1} (difícil)")
+    for level, subject in sorted(bank.index, key=lambda key: tuple(map(str, key))):
+        if args.nivel is None or level == args.nivel:
+            sizes = stats._buckets_for(bank, level, subject).sizes()
+            print(f"{level}/{subject}: {' '.join(f'{size:>4}' for size in sizes)}")
+    stats.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,85 +1,201 @@
 import pygame
-import json
-import os
-
-class RankingScreen:
-    def __init__(self, screen, assets):
-        self.screen = screen
-        self.assets = assets
+from jogo.scene_manager import Scene
+from jogo.glyph_cache import format_money
+
+RANKING_TEXT_COLOR = (255, 50, 94)
+SCROLLBAR_COLOR = (1, 227, 197)
+ROW_HEIGHT = 40  # Distância vertical entre as linhas do ranking
+ROWS_PER_PAGE = 12  # Linhas visíveis de uma vez (o resto é alcançado rolando)
+WHEEL_ROWS = 3  # Linhas roladas por passo da roda do mouse
+
+# Nomes exibidos no subtítulo do placar
+LEVEL_LABELS = {"fundamental": "Fundamental", "medio": "Médio"}
+SUBJECT_LABELS = {
+    "matematica": "Matemática", "portugues": "Português", "ingles": "Inglês",
+    "naturais": "Ciências da Natureza", "humanas": "Ciências Humanas",
+}
+
+class RankingScreen(Scene):
+    """Lista do ranking, rolável e paginada.
+
+    Abre no placar geral; o nível e a matéria escolhidos no menu de matérias viram
+    placares alternativos (clique no subtítulo, Tab ou setas laterais trocam).
+    Os placares já ficam ordenados no RankingStore (ver leaderboard); só as linhas
+    visíveis são lidas e renderizadas, numa surface em cache que é refeita apenas
+    quando os dados ou a rolagem mudam. Assim o custo do frame não depende da
+    quantidade de jogadores.
+    """
+
+    def __init__(self, game):
+        super().__init__(game)
 
         # Fontes usadas na tela
-        self.small_font = assets.small_font
-        self.medium_font = assets.font
-        self.large_font = assets.large_font
-
-        # Caminho do arquivo JSON onde o ranking é salvo
-        self.file_path = "jogo/ranking_data.json"
-
-        self.running = True
-
-        # Carrega e redimensiona a imagem de fundo para preencher a tela
-        self.bg_image = pygame.image.load("images/background.png").convert()
-        self.bg_image = pygame.transform.scale(self.bg_image, self.screen.get_size())
+        self.small_font = self.assets.small_font
+        self.medium_font = self.assets.font
+        self.large_font = self.assets.large_font
+
+        # Ranking do jogo (banco + pontos ainda não gravados)
+        self.store = game.ranking
+        self.level = None  # Placar mostrado: nível e matéria (None = todos)
+        self.subject = None
+        self.board = self.store.board()
+        self.boards = [(None, None)]  # Placares que o jogador pode alternar: (nível, matéria)
+        self.board_index = 0
 
         # Configura o botão "Voltar" com sua imagem e posição fixa
         self.botao_voltar_img = self.assets.back_img
-        self.botao_voltar_rect = self.botao_voltar_img.get_rect(topleft=(10, self.screen.get_height() - 70))
-
-        # Carrega os dados do ranking do arquivo
-        self.load_ranking()
-
-    def load_ranking(self):
-        # Tenta carregar o ranking do arquivo JSON, caso não exista, inicializa com dado padrão
-        if os.path.exists(self.file_path):
-            with open(self.file_path, "r") as file:
-                self.ranking_data = json.load(file)
+        self.botao_voltar_rect = self.botao_voltar_img.get_rect(topleft=(10, game.SCREEN_HEIGHT - 70))
+        self.hit_index.add("voltar", self.botao_voltar_rect)
+
+        # Setas de página anterior/próxima (só clicáveis quando há para onde ir)
+        self.prev_page_img = self.assets.left_arrow_img
+        self.next_page_img = self.assets.right_arrow_img
+        self.prev_page_rect = self.prev_page_img.get_rect(topleft=(830, game.SCREEN_HEIGHT - 110))
+        self.next_page_rect = self.next_page_img.get_rect(topleft=(950, game.SCREEN_HEIGHT - 110))
+        self.hit_index.add("prev_page", self.prev_page_rect, lambda: self.scroll > 0)
+        self.hit_index.add("next_page", self.next_page_rect, lambda: self.scroll < self._max_scroll())
+
+        # Subtítulo com o nome do placar: clicar passa para o próximo placar
+        self.subtitle_area = pygame.Rect(290, 80, 500, 36)
+        self.hit_index.add("board", self.subtitle_area, lambda: len(self.boards) > 1)
+
+        # Área da lista na tela e surface em cache com as linhas visíveis
+        self.list_rect = pygame.Rect(100, 120, game.SCREEN_WIDTH - 200, ROWS_PER_PAGE * ROW_HEIGHT)
+        self.scroll = 0  # Índice (no ranking ordenado) da primeira linha visível
+        self._rows_surface = None
+        self._rows_key = None  # (placar, versão do ranking, scroll) da surface em cache
+
+    def on_enter(self, level=None, subjects=None, **kwargs):
+        # Abre no placar geral: os pontos importados do antigo ranking_data.json não têm
+        # nível nem matéria e não aparecem nos outros. O nível escolhido e, com uma única
+        # matéria marcada, a combinação nível/matéria ficam disponíveis para alternar
+        self.boards = [(None, None)]
+        if level is not None:
+            self.boards.append((level, None))
+            if subjects and len(subjects) == 1:
+                self.boards.append((level, subjects[0]))
+        self.show_board(0)
+
+    def show_board(self, index):
+        # Troca o placar mostrado (circular) e volta ao topo da lista
+        self.board_index = index % len(self.boards)
+        self.level, self.subject = self.boards[self.board_index]
+        self.board = self.store.board(self.level, self.subject)
+        self.scroll = 0
+
+    def _board_title(self):
+        if self.level is None:
+            title = "Geral"
         else:
-            self.ranking_data = {"teste": 0}  # Dado padrão caso o arquivo não exista
-
-    def save_ranking(self):
-        # Salva os dados do ranking no arquivo JSON (não usado aqui, mas útil para atualizações)
-        with open(self.file_path, "w") as file:
-            json.dump(self.ranking_data, file)
+            title = LEVEL_LABELS.get(self.level, self.level)
+            if self.subject is not None:
+                title += " - " + SUBJECT_LABELS.get(self.subject, self.subject)
+        # Com mais de um placar, as setas indicam que o subtítulo troca de placar
+        return f"< {title} >" if len(self.boards) > 1 else title
+
+    def _max_scroll(self):
+        return max(0, len(self.board) - ROWS_PER_PAGE)
+
+    def scroll_to(self, first_row):
+        # Rola a lista (limitada ao começo/fim); a surface em cache é refeita no próximo draw
+        self.scroll = max(0, min(first_row, self._max_scroll()))
+
+    def on_click(self, name, event):
+        if name == "voltar":
+            # Clique no botão "Voltar" retorna para a tela de seleção de matérias
+            self.assets.click_sound.play()  # Toca som do clique
+            self.game.scenes.pop()
+        elif name == "prev_page":
+            self.assets.click_sound.play()
+            self.scroll_to(self.scroll - ROWS_PER_PAGE)
+        elif name == "next_page":
+            self.assets.click_sound.play()
+            self.scroll_to(self.scroll + ROWS_PER_PAGE)
+        elif name == "board":
+            self.assets.click_sound.play()
+            self.show_board(self.board_index + 1)
+
+    def handle_event(self, event):
+        # Roda do mouse rola algumas linhas; teclado rola linha a linha, por página ou até as pontas
+        if event.type == pygame.MOUSEWHEEL:
+            self.scroll_to(self.scroll - event.y * WHEEL_ROWS)
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_UP:
+                self.scroll_to(self.scroll - 1)
+            elif event.key == pygame.K_DOWN:
+                self.scroll_to(self.scroll + 1)
+            elif event.key == pygame.K_PAGEUP:
+                self.scroll_to(self.scroll - ROWS_PER_PAGE)
+            elif event.key == pygame.K_PAGEDOWN:
+                self.scroll_to(self.scroll + ROWS_PER_PAGE)
+            elif event.key == pygame.K_HOME:
+                self.scroll_to(0)
+            elif event.key == pygame.K_END:
+                self.scroll_to(self._max_scroll())
+            elif event.key in (pygame.K_TAB, pygame.K_RIGHT):
+                self.show_board(self.board_index + 1)
+            elif event.key == pygame.K_LEFT:
+                self.show_board(self.board_index - 1)
+
+    def _build_rows_surface(self):
+        # Renderiza só as linhas visíveis sobre uma cópia do fundo (mesmo resultado de
+        # desenhar direto na tela). Linha "{posição}. {nome}: P$ {pontuação}": posição e
+        # pontuação são compostas com glifos em cache; só o nome vem do TextRenderer
+        surface = self.assets.background.subsurface(self.list_rect).copy()
+        glyphs = self.assets.glyph_cache
+        visible = self.board.slice(self.scroll, self.scroll + ROWS_PER_PAGE)
+        for row, (user, score) in enumerate(visible):
+            y = row * ROW_HEIGHT
+            row_rect = glyphs.blit(surface, f"{self.scroll + row + 1}. ", (0, y), self.small_font, RANKING_TEXT_COLOR)
+            name_surface = self.assets.text_renderer.render(f"{user}: ", self.small_font, RANKING_TEXT_COLOR)
+            name_rect = surface.blit(name_surface, row_rect.topright)
+            glyphs.blit(surface, format_money(score), name_rect.topright, self.small_font, RANKING_TEXT_COLOR)
+
+        # Barra de rolagem na borda direita (só se o ranking não cabe numa página)
+        total = len(self.board)
+        if total > ROWS_PER_PAGE:
+            track_height = self.list_rect.height
+            thumb_height = max(20, track_height * ROWS_PER_PAGE // total)
+            thumb_y = (track_height - thumb_height) * self.scroll // self._max_scroll()
+            pygame.draw.rect(surface, SCROLLBAR_COLOR, (self.list_rect.width - 6, thumb_y, 6, thumb_height))
+        return surface
 
     def draw(self):
-        # Desenha o fundo da tela
-        self.screen.blit(self.bg_image, (0, 0))
+        # Desenha o fundo da tela (já carregado no tamanho da janela pelos assets)
+        self.screen.blit(self.assets.background, (0, 0))
 
         # Renderiza o título centralizado no topo da tela
-        title_surface = self.medium_font.render("Ranking", True, (1, 227, 197))
-        title_rect = title_surface.get_rect(center=(self.screen.get_width() // 2, 50))
+        title_surface = self.assets.text_renderer.render("Ranking", self.medium_font, (1, 227, 197))
+        title_rect = title_surface.get_rect(center=(self.screen.get_width() // 2, 42))
         self.screen.blit(title_surface, title_rect)
-
-        # Ordena o ranking por pontuação decrescente para exibição
-        sorted_ranking = sorted(self.ranking_data.items(), key=lambda x: x[1], reverse=True)
-        for i, (user, score) in enumerate(sorted_ranking):
-            # Formata o texto do ranking, substituindo vírgulas por pontos para o padrão local
-            text = f"{i+1}. {user}: P$ {score:,.0f}".replace(",", ".")
-            score_surface = self.small_font.render(text, True, (255, 50, 94))
-            # Desenha cada linha do ranking na vertical, com espaçamento de 40 pixels
-            self.screen.blit(score_surface, (100, 120 + i * 40))
+        self.renderer.track("title", title_rect, title_surface)
+        subtitle_surface = self.assets.text_renderer.render(self._board_title(), self.small_font, (1, 227, 197))
+        subtitle_rect = subtitle_surface.get_rect(center=(self.screen.get_width() // 2, 98))
+        self.screen.blit(subtitle_surface, subtitle_rect)
+        self.renderer.track("subtitle", subtitle_rect, self._board_title())
+
+        # Linhas visíveis: a surface só é refeita quando os dados ou a rolagem mudam
+        rows_key = (self.level, self.subject, self.store.version, self.scroll)
+        if self._rows_key != rows_key:
+            self._rows_surface = self._build_rows_surface()
+            self._rows_key = rows_key
+        self.screen.blit(self._rows_surface, self.list_rect)
+        self.renderer.track("rows", self.list_rect, rows_key)
+
+        # Posição na lista ("13-24 / 100000") e setas de página
+        total = len(self.board)
+        last = min(total, self.scroll + ROWS_PER_PAGE)
+        page_text = f"{self.scroll + 1 if total else 0}-{last} / {total}"
+        page_pos = (self.list_rect.left + 260, self.game.SCREEN_HEIGHT - 60)
+        page_rect = self.assets.glyph_cache.blit(self.screen, page_text, page_pos, self.small_font, RANKING_TEXT_COLOR)
+        self.renderer.track("page", page_rect, page_text)
+        if self.scroll > 0:
+            self.screen.blit(self.prev_page_img, self.prev_page_rect)
+            self.renderer.track("prev_page", self.prev_page_rect, self.prev_page_img)
+        if self.scroll < self._max_scroll():
+            self.screen.blit(self.next_page_img, self.next_page_rect)
+            self.renderer.track("next_page", self.next_page_rect, self.next_page_img)
 
         # Desenha o botão "Voltar" na tela
         self.screen.blit(self.botao_voltar_img, self.botao_voltar_rect)
-
-        # Atualiza a tela com tudo que foi desenhado
-        pygame.display.update()
-
-    def run(self):
-        # Loop principal da tela de ranking
-        while self.running:
-            self.draw()
-
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    # Fecha o jogo ao clicar no X da janela
-                    self.running = False
-                    pygame.quit()
-                    exit()
-
-                elif event.type == pygame.MOUSEBUTTONUP:
-                    # Detecta clique no botão "Voltar"
-                    if self.botao_voltar_rect.collidepoint(event.pos):
-                        self.assets.click_sound.play()  # Toca som do clique
-                        self.running = False
-                        return "subjects_menu"  # Retorna para a tela de seleção de matérias
+        self.renderer.track("voltar", self.botao_voltar_rect, self.botao_voltar_img)
@@ -0,0 +1,184 @@
+# Ranking persistido na tabela "ranking" do quiz_banco.db.
+#
+# As pontuações somadas durante a partida ficam num buffer em memória; uma thread
+# de gravação as envia ao banco numa única transação a cada FLUSH_INTERVAL_S, ao
+# fim da partida (flush()) e ao fechar o jogo (close()). O loop de frames nunca
+# espera pelo disco, e uma queda no meio da gravação não corrompe o ranking
+# (a transação do SQLite é desfeita por inteiro).
+#
+# Em memória, as pontuações ficam num LeaderboardIndex (placar geral e por nível e
+# matéria), atualizado a cada ponto sem reordenar o ranking inteiro.
+import json
+import os
+import sqlite3
+import threading
+
+from jogo.leaderboard import LeaderboardIndex
+
+FLUSH_INTERVAL_S = 5.0  # Intervalo máximo entre gravações de pontuações pendentes
+
+# Mesmas tabelas do script perguntas/criar_banco_sqlite.py (um banco novo, como o do
+# benchmark, ainda não as tem)
+CREATE_USUARIOS_TABLE = """
+CREATE TABLE IF NOT EXISTS usuarios (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    username TEXT NOT NULL UNIQUE,
+    password TEXT NOT NULL
+)
+"""
+
+# Uma linha por jogador, com a pontuação acumulada (o script de criação do banco
+# já cria a coluna username; bancos antigos a recebem em ensure_schema)
+CREATE_RANKING_TABLE = """
+CREATE TABLE IF NOT EXISTS ranking (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER,
+    username TEXT NOT NULL,
+    score INTEGER,
+    FOREIGN KEY (user_id) REFERENCES usuarios (id)
+)
+"""
+
+# Pontos de cada jogador por nível e matéria das perguntas (placares por combinação)
+CREATE_BREAKDOWN_TABLE = """
+CREATE TABLE IF NOT EXISTS ranking_breakdown (
+    username TEXT NOT NULL,
+    level TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    PRIMARY KEY (username, level, subject)
+)
+"""
+
+# Soma os pontos à linha do jogador (ou cria a linha), ligando ao cadastro em "usuarios" se existir
+UPSERT_SCORE = """
+INSERT INTO ranking (user_id, username, score)
+VALUES ((SELECT id FROM usuarios WHERE username = ?), ?, ?)
+ON CONFLICT (username) DO UPDATE SET score = score + excluded.score
+"""
+
+UPSERT_BREAKDOWN = """
+INSERT INTO ranking_breakdown (username, level, subject, score) VALUES (?, ?, ?, ?)
+ON CONFLICT (username, level, subject) DO UPDATE SET score = score + excluded.score
+"""
+
+
+def ensure_schema(conn):
+    # Cria as tabelas, adiciona a coluna username em bancos antigos e o índice único por jogador
+    conn.execute(CREATE_USUARIOS_TABLE)
+    conn.execute(CREATE_RANKING_TABLE)
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(ranking)")]
+    if "username" not in columns:
+        conn.execute("ALTER TABLE ranking ADD COLUMN username TEXT")
+    conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_ranking_username ON ranking (username)")
+    conn.execute(CREATE_BREAKDOWN_TABLE)
+    conn.commit()
+
+
+class RankingStore:
+    """Pontuação acumulada por jogador, lida do banco uma vez e gravada em lotes.
+
+    add_score() só altera a memória (pode ser chamado no meio do frame); os
+    placares (board()) já incluem os pontos ainda não gravados. Os placares só são
+    usados na thread principal; a thread de gravação só lê o buffer pendente. Na
+    primeira abertura de um banco sem ranking, o antigo ranking_data.json é importado.
+    """
+
+    def __init__(self, db_path, legacy_json=None, flush_interval=FLUSH_INTERVAL_S):
+        self.db_path = db_path
+        self.flush_interval = flush_interval
+        self.version = 0  # Incrementado a cada mudança (as telas releem quando muda)
+        self._lock = threading.Lock()
+        self._pending = {}  # (jogador, nível, matéria) -> pontos ainda não gravados
+        self._flush_requested = threading.Event()
+        self._closing = False
+        self.leaderboards = self._load(legacy_json)  # Placares (gravado + pendente)
+        self._writer = threading.Thread(target=self._writer_loop, name="ranking-writer", daemon=True)
+        self._writer.start()
+
+    def _load(self, legacy_json):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            ensure_schema(conn)
+            totals = dict(conn.execute("SELECT username, score FROM ranking WHERE username IS NOT NULL"))
+            if not totals and legacy_json and os.path.exists(legacy_json):
+                with open(legacy_json, "r", encoding="utf-8") as f:
+                    totals = {str(name): int(score) for name, score in json.load(f).items()}
+                with conn:
+                    conn.executemany(UPSERT_SCORE, [(name, name, score) for name, score in totals.items()])
+                print(f"RankingStore: {len(totals)} jogadores importados de {legacy_json}")
+            breakdown = conn.execute("SELECT username, score, level, subject FROM ranking_breakdown").fetchall()
+        finally:
+            conn.close()
+
+        # O placar geral vem da tabela ranking (inclui pontos importados, sem nível/matéria);
+        # os placares por nível e matéria, da tabela ranking_breakdown
+        leaderboards = LeaderboardIndex()
+        overall = leaderboards.board()
+        for name, score in totals.items():
+            overall.set(name, score)
+        for name, score, level, subject in breakdown:
+            leaderboards.board(level).add(name, score)
+            leaderboards.board(level, subject).add(name, score)
+        return leaderboards
+
+    def add_score(self, username, points, level=None, subject=None):
+        """Soma pontos ao jogador (só em memória; a gravação acontece em segundo plano).
+
+        level e subject (da pergunta respondida) alimentam os placares por nível e matéria.
+        """
+        self.leaderboards.add(username, points, level, subject)
+        key = (username, level, subject)
+        with self._lock:
+            self._pending[key] = self._pending.get(key, 0) + points
+        self.version += 1
+
+    def board(self, level=None, subject=None):
+        """Placar geral, de um nível ou de uma combinação nível/matéria (ver LeaderboardIndex)."""
+        return self.leaderboards.board(level, subject)
+
+    def flush(self):
+        # Pede a gravação imediata das pontuações pendentes (não espera terminar)
+        self._flush_requested.set()
+
+    def close(self):
+        """Grava o que estiver pendente e encerra a thread de gravação."""
+        self._closing = True
+        self._flush_requested.set()
+        self._writer.join()
+
+    def _writer_loop(self):
+        # A conexão é criada nesta thread (conexões do sqlite3 não são compartilhadas entre threads)
+        conn = sqlite3.connect(self.db_path)
+        try:
+            while True:
+                self._flush_requested.wait(self.flush_interval)
+                self._flush_requested.clear()
+                self._write_pending(conn)
+                if self._closing:
+                    break
+        finally:
+            conn.close()
+
+    def _write_pending(self, conn):
+        with self._lock:
+            batch, self._pending = self._pending, {}
+        if not batch:
+            return
+        totals = {}
+        for (name, _level, _subject), points in batch.items():
+            totals[name] = totals.get(name, 0) + points
+        try:
+            with conn:  # Uma transação por lote: ou grava tudo ou nada
+                conn.executemany(UPSERT_SCORE, [(name, name, points) for name, points in totals.items()])
+                conn.executemany(UPSERT_BREAKDOWN, [
+                    (name, level, subject, points)
+                    for (name, level, subject), points in batch.items()
+                    if level is not None and subject is not None
+                ])
+        except sqlite3.Error as e:
+            # Banco ocupado/indisponível: devolve o lote ao buffer para a próxima tentativa
+            print(f"RankingStore: erro ao gravar o ranking ({e}); nova tentativa em {self.flush_interval:.0f} s")
+            with self._lock:
+                for key, points in batch.items():
+                    self._pending[key] = self._pending.get(key, 0) + points
@@ -0,0 +1,148 @@
+import pygame
+
+
+class DirtyRectRenderer:
+    """Decide quais regiões da janela precisam ser enviadas ao display a cada frame.
+
+    As telas continuam desenhando normalmente, mas informam cada widget (botão,
+    caixa da pergunta, popup, caixa de dica...) com um retângulo e um "estado"
+    visual. Só os retângulos cujo estado mudou, que apareceram ou que sumiram
+    desde o frame anterior são passados para pygame.display.update(rects).
+    """
+
+    name = "surface"
+
+    def __init__(self, enabled=True):
+        self.enabled = enabled  # Se False, sempre atualiza a janela inteira
+        self.fullscreen = False
+        self._scene = None  # Tela desenhada no frame anterior
+        self._previous = {}  # Widgets do frame anterior: chave -> (rect, estado)
+        self._current = {}  # Widgets informados no frame atual
+        self._dirty = []  # Regiões sujas acumuladas neste frame
+        self._full_redraw = True  # Força atualização completa no próximo present()
+
+    def open_window(self, size, title, fullscreen=False):
+        """Cria (ou recria) a janela; retorna a surface onde as telas desenham."""
+        self.fullscreen = fullscreen
+        screen = pygame.display.set_mode(size, pygame.FULLSCREEN if fullscreen else 0)
+        pygame.display.set_caption(title)
+        self.invalidate()
+        return screen
+
+    def begin_frame(self, scene):
+        # Troca de tela sempre exige redesenho completo
+        if scene is not self._scene:
+            self._scene = scene
+            self.invalidate()
+        self._current = {}
+
+    def invalidate(self):
+        # Descarta o histórico e atualiza a janela inteira no próximo present()
+        # (troca de tela, alternância de fullscreen, janela recriada...)
+        self._full_redraw = True
+        self._previous = {}
+
+    def track(self, key, rect, *state):
+        """Registra um widget desenhado neste frame; marca sua região se algo mudou."""
+        rect = pygame.Rect(rect)  # Cópia: alguns widgets reposicionam o próprio rect
+        self._current[key] = (rect, state)
+        previous = self._previous.get(key)
+        if previous is None:
+            self._dirty.append(rect)
+        elif previous != (rect, state):
+            self._dirty.append(previous[0])
+            self._dirty.append(rect)
+
+    def present(self):
+        """Envia ao display as regiões sujas (ou a janela toda, se necessário)."""
+        # Widgets que estavam na tela no frame anterior e não foram desenhados agora
+        for key, (rect, _state) in self._previous.items():
+            if key not in self._current:
+                self._dirty.append(rect)
+
+        if not self.enabled or self._full_redraw:
+            self._flush(None)
+        elif self._dirty:
+            self._flush(self._dirty)
+
+        self._previous = self._current
+        self._current = {}
+        self._dirty = []
+        self._full_redraw = False
+
+    def _flush(self, rects):
+        # Envia as regiões ao display (None = janela inteira)
+        if rects is None:
+            pygame.display.update()
+        else:
+            pygame.display.update(rects)
+
+
+class TextureRenderer(DirtyRectRenderer):
+    """Backend alternativo com pygame._sdl2.video (Renderer/Texture).
+
+    As telas continuam desenhando numa surface 1080x720 (a "tela lógica"); a cada
+    frame só as regiões sujas são copiadas para uma textura, que o Renderer
+    escala para o tamanho real da janela (redimensionável, com tarjas se a
+    proporção for diferente). Alternar o fullscreen não recria a surface.
+    Sem GPU disponível, usa o renderer por software do SDL.
+    """
+
+    name = "texture"
+
+    def __init__(self, enabled=True, software=False):
+        super().__init__(enabled)
+        self.software = software  # Força o renderer por software
+        self.window = None
+        self.sdl_renderer = None
+        self.canvas = None  # Surface da tela lógica, onde as telas desenham
+        self.texture = None  # Cópia da tela lógica na memória do renderer
+
+    def open_window(self, size, title, fullscreen=False):
+        from pygame._sdl2.video import Renderer, Texture, Window, error as sdl_error
+
+        if self.window is None:
+            self.window = Window(title, size, resizable=True)
+            self.sdl_renderer = None
+            if not self.software:
+                try:
+                    self.sdl_renderer = Renderer(self.window, accelerated=1)
+                except sdl_error as e:
+                    print(f"TextureRenderer: renderer acelerado indisponível ({e}), usando software")
+            if self.sdl_renderer is None:
+                self.sdl_renderer = Renderer(self.window, accelerated=0)
+            self.sdl_renderer.logical_size = size  # Escala a tela lógica para o tamanho da janela
+            self.canvas = pygame.Surface(size, 0, 32)
+            self.texture = Texture(self.sdl_renderer, size, streaming=True)
+
+        if fullscreen != self.fullscreen:
+            if fullscreen:
+                self.window.set_fullscreen(desktop=True)
+            else:
+                self.window.set_windowed()
+        self.fullscreen = fullscreen
+        self.invalidate()
+        return self.canvas
+
+    def _flush(self, rects):
+        # Copia para a textura só as regiões sujas e apresenta a textura inteira escalada
+        if rects is None:
+            self.texture.update(self.canvas)
+        else:
+            canvas_rect = self.canvas.get_rect()
+            for rect in rects:
+                rect = rect.clip(canvas_rect)
+                if rect.width and rect.height:
+                    self.texture.update(self.canvas.subsurface(rect), rect)
+        self.sdl_renderer.clear()
+        self.texture.draw()
+        self.sdl_renderer.present()
+
+
+def create_renderer(backend="surface", enabled=True, software=False):
+    """Cria o backend de apresentação escolhido na configuração ("surface" ou "texture")."""
+    if backend == "texture":
+        return TextureRenderer(enabled=enabled, software=software)
+    if backend != "surface":
+        print(f"Renderer: backend '{backend}' desconhecido, usando 'surface'")
+    return DirtyRectRenderer(enabled=enabled)
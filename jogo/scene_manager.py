@@ -0,0 +1,101 @@
+from jogo.input_dispatcher import HitTestIndex
+
+
+class Scene:
+    """Base das telas do jogo.
+
+    Cada tela é criada uma única vez pelo Game e reaproveitada. O loop principal
+    entrega os eventos para handle_event() e chama update() e draw() a cada frame
+    apenas na tela do topo da pilha. Cliques em widgets registrados em hit_index
+    chegam uma única vez por on_click(); os demais eventos, por handle_event().
+    """
+
+    animating = False  # True se a tela precisa de frames mesmo sem eventos (ver FrameScheduler)
+
+    def __init__(self, game):
+        self.game = game  # Controlador principal (pilha de telas, janela, relógio...)
+        self.assets = game.assets  # Recursos gráficos e fontes usados na tela
+        self.renderer = game.renderer  # Controla as regiões da janela atualizadas a cada frame
+        self.scheduler = game.scheduler  # Relógio compartilhado (limite de FPS e espera ociosa)
+        self.hit_index = HitTestIndex()  # Áreas clicáveis da tela (ver InputDispatcher)
+
+    @property
+    def screen(self):
+        # Sempre a janela atual (ela é recriada ao alternar o fullscreen)
+        return self.game.screen
+
+    def on_enter(self, **kwargs):
+        # Chamado quando a tela é empilhada; recebe os parâmetros passados no push()
+        pass
+
+    def on_resume(self):
+        # Chamado quando a tela volta ao topo depois que a de cima foi desempilhada
+        pass
+
+    def on_exit(self):
+        # Chamado quando a tela é desempilhada
+        pass
+
+    def on_click(self, name, event):
+        # Clique (botão esquerdo) no widget registrado como name no hit_index
+        pass
+
+    def handle_event(self, event):
+        # Eventos que não foram consumidos por nenhum widget
+        pass
+
+    def update(self):
+        pass
+
+    def draw(self):
+        pass
+
+    def idle_work(self):
+        # Trabalho adiantado no tempo que sobra do frame, depois de apresentá-lo
+        # (ex.: preparar a próxima pergunta). Faz uma parte pequena por chamada e
+        # retorna True enquanto houver mais a fazer
+        return False
+
+
+class SceneManager:
+    """Pilha de telas: a tela do topo recebe eventos e é desenhada.
+
+    on_change (opcional) é chamado a cada push/pop, depois que a pilha mudou.
+    """
+
+    def __init__(self, on_change=None):
+        self.stack = []
+        self.on_change = on_change
+
+    @property
+    def top(self):
+        return self.stack[-1] if self.stack else None
+
+    def push(self, scene, **kwargs):
+        # Empilha uma tela já construída (não recria nada nem lê arquivos)
+        self.stack.append(scene)
+        self._changed()
+        scene.on_enter(**kwargs)
+
+    def pop(self):
+        # Desempilha a tela atual e retoma a anterior
+        if not self.stack:
+            return None
+        scene = self.stack.pop()
+        self._changed()
+        scene.on_exit()
+        if self.stack:
+            self.stack[-1].on_resume()
+        return scene
+
+    def pop_to(self, scene):
+        # Desempilha até que a tela informada fique no topo
+        while self.stack and self.stack[-1] is not scene:
+            self.stack.pop().on_exit()
+            self._changed()
+        if self.stack:
+            self.stack[-1].on_resume()
+
+    def _changed(self):
+        if self.on_change is not None:
+            self.on_change()
@@ -0,0 +1,214 @@
+# Gravação e reprodução de sessões reais do jogo.
+#
+# O gravador salva, em JSON Lines, a semente dos sorteios da partida (Game.seed) e
+# cada lote de eventos entregue ao loop principal, com o instante, o relógio do
+# jogo (ticks) e a tela que estava no topo. O replay cria o Game com a mesma
+# semente e entrega os mesmos lotes, na velocidade original ou o mais rápido possível.
+#
+# Com a dificuldade adaptativa, a ordem das perguntas depende dos contadores da tabela
+# question_stats, que cada partida altera: o cabeçalho guarda os contadores do início
+# da sessão (e o modo de sorteio), e o replay parte deles em vez dos atuais do banco.
+# O replay grava o ranking e os contadores em bancos temporários (o ranking é copiado
+# do banco real): reproduzir uma sessão não altera os dados reais nem o próximo replay.
+#
+#     python -m jogo.main --record sessao.jsonl
+#     python -m jogo.main --replay sessao.jsonl [--fast]
+# Para gravar as aulas sem mudar o atalho do jogo: JOGO_RECORD_SESSION=sessao.jsonl
+import json
+import os
+import sqlite3
+import tempfile
+import time
+
+import pygame
+from jogo import config
+from jogo.frame_scheduler import FrameScheduler
+
+LOG_VERSION = 2  # 2: contadores de question_stats e jogador no cabeçalho
+SCENE_SYNC_MAX_FRAMES = 300  # Frames esperando a tela gravada aparecer (ex.: tela de carregamento)
+RANKING_TABLES = ("usuarios", "ranking", "ranking_breakdown")  # Copiadas para o banco temporário do replay
+
+
+def _serialize_event(event):
+    # Só os atributos representáveis em JSON (pygame 2 inclui objetos como "window")
+    attrs = {}
+    for key, value in event.dict.items():
+        if isinstance(value, (bool, int, float, str)) or value is None:
+            attrs[key] = value
+        elif isinstance(value, tuple) and all(isinstance(v, (int, float)) for v in value):
+            attrs[key] = list(value)
+    return [event.type, attrs]
+
+
+def _deserialize_event(data):
+    event_type, attrs = data
+    return pygame.event.Event(event_type, {key: tuple(v) if isinstance(v, list) else v for key, v in attrs.items()})
+
+
+def read_log(path):
+    """Lê um log de sessão. Retorna (cabeçalho, lista de lotes)."""
+    with open(path, "r", encoding="utf-8") as f:
+        header = json.loads(f.readline())
+        if header.get("version") != LOG_VERSION:
+            raise ValueError(f"Log de sessão '{path}' com versão não suportada: {header.get('version')}")
+        batches = [json.loads(line) for line in f if line.strip()]
+    return header, batches
+
+
+class RecordingScheduler(FrameScheduler):
+    """FrameScheduler que também grava cada lote de eventos recebido."""
+
+    def __init__(self, path, fps=30, idle_timeout_ms=500):
+        super().__init__(fps=fps, idle_timeout_ms=idle_timeout_ms)
+        self.path = path
+        self.game = None  # Definido pelo Game em attach()
+        self._file = None
+        self._frame = 0
+        self._started = None
+
+    def attach(self, game):
+        # Abre o log e grava o cabeçalho com a semente dos sorteios do jogo
+        self.game = game
+        self._file = open(self.path, "w", encoding="utf-8")
+        header = {
+            "version": LOG_VERSION,
+            "seed": game.seed,
+            "player": game.player_name,
+            "adaptive_difficulty": config.ADAPTIVE_DIFFICULTY,
+            "question_stats": game.question_stats.snapshot(),
+            "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "pygame": pygame.version.ver,
+        }
+        self._file.write(json.dumps(header) + "\n")
+        self._started = time.perf_counter()
+
+    def wait_events(self, animating=False):
+        events = super().wait_events(animating)
+        self._frame += 1
+        if events and self._file is not None:
+            batch = {
+                "frame": self._frame,
+                "t": time.perf_counter() - self._started,
+                "ticks": self.ticks(),
+                "scene": self.game.scene_name(self.game.scenes.top),
+                "events": [_serialize_event(event) for event in events],
+            }
+            # Uma linha por lote, gravada na hora: o log sobrevive a um fechamento abrupto
+            self._file.write(json.dumps(batch, ensure_ascii=False) + "\n")
+            self._file.flush()
+        return events
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class ReplayScheduler(FrameScheduler):
+    """FrameScheduler que entrega os lotes de um log gravado no lugar da entrada real.
+
+    Cada lote só é entregue quando a tela do topo é a mesma da gravação; se ela
+    não aparecer (sessão divergiu), o replay é interrompido com erro. O relógio
+    do jogo (ticks) segue o gravado, então temporizações como o intervalo entre
+    cliques nas setas se comportam igual mesmo no modo rápido.
+    """
+
+    def __init__(self, batches, fps=30, idle_timeout_ms=500, fast=False):
+        super().__init__(fps=fps, idle_timeout_ms=idle_timeout_ms)
+        self.game = None  # Definido pelo Game em attach()
+        self.fast = fast  # True: sem limite de FPS e sem esperar o instante gravado
+        self.frames = 0  # Frames executados no replay
+        self._batches = list(batches)
+        self.total_batches = len(self._batches)  # Lotes de eventos no log
+        self._next = 0
+        self._ticks = 0
+        self._waiting = 0
+        self._started = None
+
+    def attach(self, game):
+        self.game = game
+        self._started = time.perf_counter()
+
+    @property
+    def finished(self):
+        return self._next >= len(self._batches)
+
+    def wait_events(self, animating=False):
+        self.end_frame(0 if self.fast else None)
+        self.frames += 1
+
+        # A entrada real é ignorada (exceto fechar a janela, que interrompe o replay)
+        if any(event.type == pygame.QUIT for event in pygame.event.get()):
+            return [pygame.event.Event(pygame.QUIT)]
+
+        events = self._next_batch_events()
+        self.begin_frame()
+        self._frame_ticks = self._ticks  # Relógio do jogo segue o gravado
+        return events
+
+    def _next_batch_events(self):
+        if self.finished:
+            return [pygame.event.Event(pygame.QUIT)]
+        batch = self._batches[self._next]
+        if not self.fast and time.perf_counter() - self._started < batch["t"]:
+            return []  # Ainda não chegou o instante gravado
+
+        scene = self.game.scene_name(self.game.scenes.top)
+        if batch["scene"] != scene:
+            self._waiting += 1
+            if self._waiting > SCENE_SYNC_MAX_FRAMES:
+                raise RuntimeError(
+                    f"Replay divergiu no frame gravado {batch['frame']}: "
+                    f"esperava a tela '{batch['scene']}', está em '{scene}'"
+                )
+            return []
+
+        self._waiting = 0
+        self._next += 1
+        self._ticks = batch["ticks"]
+        return [_deserialize_event(data) for data in batch["events"]]
+
+
+def _copy_ranking(db_path, copy_path):
+    # Copia só as tabelas do ranking (o banco real pode ter milhares de perguntas)
+    conn = sqlite3.connect(copy_path)
+    try:
+        if os.path.exists(db_path):
+            conn.execute("ATTACH DATABASE ? AS original", (db_path,))
+            tables = conn.execute(
+                f"SELECT name, sql FROM original.sqlite_master WHERE type = 'table' AND name IN ({', '.join('?' * len(RANKING_TABLES))})",
+                RANKING_TABLES,
+            ).fetchall()
+            with conn:
+                for name, sql in tables:
+                    conn.execute(sql)
+                    conn.execute(f"INSERT INTO main.{name} SELECT * FROM original.{name}")
+            conn.execute("DETACH DATABASE original")
+    finally:
+        conn.close()
+    return copy_path
+
+
+def replay_session(path, fast=False):
+    """Reproduz a sessão gravada num Game novo. Retorna (Game, ReplayScheduler).
+
+    O ranking (copiado do banco real) e as estatísticas das perguntas (as do
+    cabeçalho do log) ficam em bancos temporários, apagados no fim do replay.
+    """
+    from jogo.game import Game  # jogo.game importa este módulo
+
+    header, batches = read_log(path)
+    saved = (config.RANKING_DB, config.QUESTION_STATS_DB, config.ADAPTIVE_DIFFICULTY)
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        try:
+            config.RANKING_DB = _copy_ranking(config.RANKING_DB, os.path.join(tmp_dir, "ranking.db"))
+            config.QUESTION_STATS_DB = os.path.join(tmp_dir, "question_stats.db")
+            # Mesmo modo de sorteio e mesmas estatísticas das perguntas do início da gravação
+            config.ADAPTIVE_DIFFICULTY = header["adaptive_difficulty"]
+            scheduler = ReplayScheduler(batches, fps=config.FPS, idle_timeout_ms=config.IDLE_TIMEOUT_MS, fast=fast)
+            game = Game(scheduler=scheduler, seed=header["seed"], player_name=header["player"],
+                        question_stats=header["question_stats"])
+            game.run()
+        finally:
+            config.RANKING_DB, config.QUESTION_STATS_DB, config.ADAPTIVE_DIFFICULTY = saved
+    return game, scheduler
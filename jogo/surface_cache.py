@@ -0,0 +1,122 @@
+# Cache em disco das imagens já decodificadas e redimensionadas.
+#
+# Cada entrada guarda os pixels crus (RGBA ou RGB) de uma imagem do manifesto já no
+# tamanho final. Num acerto, a surface é criada direto dos bytes com
+# pygame.image.frombuffer: sem decodificar o PNG e sem reamostrar.
+#
+# Para gerar o cache na instalação do laboratório (a partir da raiz do projeto):
+#     python -m jogo.surface_cache
+import argparse
+import hashlib
+import os
+import struct
+import time
+
+import pygame
+from jogo import config
+
+CACHE_VERSION = 1
+HEADER = struct.Struct("<4sHHII")  # magic, versão, formato, largura, altura
+MAGIC = b"JMSC"
+PIXEL_FORMATS = {1: "RGBA", 2: "RGB"}
+FORMAT_CODES = {name: code for code, name in PIXEL_FORMATS.items()}
+
+
+class SurfaceCache:
+    """Guarda e recupera surfaces redimensionadas como pixels crus em disco."""
+
+    def __init__(self, cache_dir=config.SURFACE_CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+
+    def _entry_paths(self, path, size_key, pixel_format):
+        # Nome do arquivo = hash(imagem, tamanho, formato) + hash(mtime): a parte fixa
+        # permite encontrar e apagar versões antigas da mesma entrada
+        source = os.path.abspath(path)
+        stem = hashlib.sha1(repr((CACHE_VERSION, source, size_key, pixel_format)).encode("utf-8")).hexdigest()[:20]
+        mtime = os.stat(source).st_mtime_ns
+        version = hashlib.sha1(str(mtime).encode("ascii")).hexdigest()[:12]
+        return stem, os.path.join(self.cache_dir, f"{stem}-{version}.raw")
+
+    def load(self, path, size_key, pixel_format):
+        """Retorna a surface em cache, ou None se não existir ou estiver desatualizada."""
+        try:
+            _stem, entry_path = self._entry_paths(path, size_key, pixel_format)
+            with open(entry_path, "rb") as f:
+                data = f.read()
+        except OSError:
+            self.misses += 1
+            return None
+
+        if len(data) < HEADER.size:
+            self.misses += 1
+            return None
+        magic, version, format_code, width, height = HEADER.unpack_from(data)
+        pixels = memoryview(data)[HEADER.size:]
+        fmt = PIXEL_FORMATS.get(format_code)
+        if magic != MAGIC or version != CACHE_VERSION or fmt != pixel_format or len(pixels) != width * height * len(fmt):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return pygame.image.frombuffer(pixels, (width, height), fmt)
+
+    def store(self, path, size_key, pixel_format, surface):
+        """Grava a surface no cache (escrita atômica) e remove versões antigas da entrada."""
+        try:
+            stem, entry_path = self._entry_paths(path, size_key, pixel_format)
+            os.makedirs(self.cache_dir, exist_ok=True)
+            width, height = surface.get_size()
+            header = HEADER.pack(MAGIC, CACHE_VERSION, FORMAT_CODES[pixel_format], width, height)
+            tmp_path = f"{entry_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(header)
+                f.write(pygame.image.tobytes(surface, pixel_format))
+            os.replace(tmp_path, entry_path)
+
+            # Entradas da mesma imagem geradas com um arquivo fonte anterior ficam obsoletas
+            for name in os.listdir(self.cache_dir):
+                if name.startswith(stem + "-") and name.endswith(".raw") and os.path.join(self.cache_dir, name) != entry_path:
+                    os.remove(os.path.join(self.cache_dir, name))
+        except OSError as e:
+            print(f"SurfaceCache: não foi possível gravar '{path}' no cache: {e}")
+
+    def clear(self):
+        # Apaga todas as entradas do cache
+        if not os.path.isdir(self.cache_dir):
+            return 0
+        removed = 0
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".raw") or name.endswith(".tmp"):
+                os.remove(os.path.join(self.cache_dir, name))
+                removed += 1
+        return removed
+
+
+def build_cache(cache):
+    """Decodifica todas as imagens do manifesto e grava no cache. Retorna (imagens, segundos)."""
+    from jogo.assets import Assets
+    from jogo.asset_manifest import IMAGES
+
+    start = time.perf_counter()
+    for spec in IMAGES.values():
+        Assets.decode_image(spec, cache)
+    return len(IMAGES), time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Gera o cache em disco das imagens redimensionadas do jogo.")
+    parser.add_argument("--cache-dir", default=config.SURFACE_CACHE_DIR, help="pasta do cache")
+    parser.add_argument("--clear", action="store_true", help="apaga o cache antes de gerar")
+    args = parser.parse_args()
+
+    cache = SurfaceCache(args.cache_dir)
+    if args.clear:
+        print(f"{cache.clear()} entradas removidas de {args.cache_dir}")
+    count, elapsed = build_cache(cache)
+    print(f"{count} imagens verificadas em {elapsed:.2f}s ({cache.misses} geradas, {cache.hits} já estavam no cache)")
+
+
+if __name__ == "__main__":
+    main()
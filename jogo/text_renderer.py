@@ -0,0 +1,91 @@
+from collections import OrderedDict
+
+# Cor padrão dos textos do jogo (branco)
+DEFAULT_TEXT_COLOR = (255, 255, 255)
+
+
+class TextRenderer:
+    """Serviço compartilhado de layout e renderização de texto com cache LRU.
+
+    Guarda as linhas quebradas e as surfaces renderizadas, de modo que um texto
+    que não muda (pergunta, respostas, dica, títulos) é medido e renderizado uma
+    única vez em vez de a cada frame.
+    """
+
+    def __init__(self, max_entries=256):
+        self.max_entries = max_entries  # Quantidade máxima de entradas no cache
+        self._cache = OrderedDict()  # Chave -> resultado, na ordem de uso (LRU)
+        self.hits = 0  # Consultas atendidas pelo cache
+        self.misses = 0  # Consultas que precisaram medir/renderizar
+        self.profiler = None  # FrameProfiler (o Game define): mede a fase "text"
+
+    def _cached(self, key, build):
+        # Retorna o valor do cache (marcando como usado recentemente) ou constrói e guarda
+        try:
+            value = self._cache[key]
+        except KeyError:
+            self.misses += 1
+            if self.profiler is not None:
+                with self.profiler.phase("text"):
+                    value = build()
+            else:
+                value = build()
+            self._cache[key] = value
+            if len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)  # Descarta a entrada usada há mais tempo
+            return value
+        self.hits += 1
+        self._cache.move_to_end(key)
+        return value
+
+    def render(self, text, font, color=DEFAULT_TEXT_COLOR):
+        """Renderiza uma linha de texto, reaproveitando a surface se já existir."""
+        return self._cached(("render", text, font, None, color), lambda: font.render(text, True, color))
+
+    def wrap_lines(self, text, font, max_width):
+        """Quebra o texto em linhas (strings) que cabem em max_width, medindo com font.size."""
+        return self._cached(("lines", text, font, max_width, None), lambda: self._break_lines(text, font, max_width))
+
+    def wrap(self, text, font, max_width, color=DEFAULT_TEXT_COLOR):
+        """Retorna as surfaces das linhas do texto quebrado para caber em max_width."""
+        def build():
+            return tuple(font.render(line, True, color) for line in self.wrap_lines(text, font, max_width))
+        return self._cached(("wrap", text, font, max_width, color), build)
+
+    def stats(self):
+        """Contadores do cache, úteis para medir a eficiência em cada máquina."""
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._cache),
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def clear(self):
+        # Esvazia o cache (ex.: após trocar fontes) sem zerar os contadores
+        self._cache.clear()
+
+    @staticmethod
+    def _break_lines(text, font, max_width):
+        # Mesmo algoritmo de quebra usado antes em GameScreen._wrap_text, mas medindo
+        # a largura com font.size (sem criar surfaces descartáveis)
+        lines = []
+        for paragraph in text.split('\n'):
+            current_line_str = ""
+            for word in paragraph.split(' '):
+                line_candidate_str = current_line_str + (" " if current_line_str else "") + word
+                if font.size(line_candidate_str)[0] <= max_width:
+                    current_line_str = line_candidate_str
+                    continue
+                # Se não cabe, salva a linha atual e começa uma nova
+                if current_line_str:
+                    lines.append(current_line_str)
+                current_line_str = word
+                # Se a palavra sozinha não cabe, vira uma linha independente para evitar loop
+                if font.size(word)[0] > max_width:
+                    lines.append(word)
+                    current_line_str = ""
+            if current_line_str:
+                lines.append(current_line_str)
+        return tuple(lines)
@@ -1,6 +1,16 @@
 import sqlite3
+import argparse
+import hashlib
 import json
 import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from duplicatas import LIMIAR, IndiceDeDuplicatas, RelatorioDeDuplicatas, assinatura
+from leitura_perguntas import ArquivoDeRejeitados, ErroDeLeitura, detectar_formato, ler_perguntas
 
 # Caminho para o diretório onde este script está
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__)) # Assume que o script está em 'gerenciamento_perguntas/'
@@ -14,14 +24,375 @@ PROJECT_ROOT_DIR = os.path.dirname(SCRIPT_DIR)
 JOGO_DIR = os.path.join(PROJECT_ROOT_DIR, "jogo")
 SQLITE_DB_FILENAME = os.path.join(JOGO_DIR, "quiz_banco.db")
 
-def criar_ou_atualizar_banco():
+# O índice de busca textual é definido no pacote do jogo (também usado pela API)
+sys.path.insert(0, PROJECT_ROOT_DIR)
+from jogo.question_search import ensure_search_index, suspend_search_index
+from jogo.question_sampler import bump_questions_version, ensure_questions_version, suspend_questions_version
+
+# Arquivo JSON Lines com as perguntas rejeitadas (linha, offset e motivo de cada uma)
+REJEITADOS_FILENAME = os.path.join(SCRIPT_DIR, "rejeitados.jsonl")
+
+# Relatório das perguntas quase iguais (ver duplicatas.py). Modos: "relatorio" só lista,
+# "mesclar" importa só a primeira de cada grupo, "desligado" não procura
+DUPLICATAS_FILENAME = os.path.join(SCRIPT_DIR, "quase_duplicatas.jsonl")
+MODOS_DUPLICATAS = ("relatorio", "mesclar", "desligado")
+
+# Colunas gravadas para cada pergunta (a mesma ordem é usada no hash do conteúdo)
+COLUNAS_PERGUNTA = ("text", "answer_a", "answer_b", "answer_c", "answer_d", "correct_answer", "tip", "subject", "level")
+
+# Ajustes só durante a importação: cache maior e temporários em memória; synchronous NORMAL
+# ainda garante que cada transação é gravada inteira ou desfeita
+PRAGMAS_IMPORTACAO = ("PRAGMA synchronous = NORMAL", "PRAGMA cache_size = -65536", "PRAGMA temp_store = MEMORY")
+
+PERGUNTAS_POR_TAREFA = 2000  # Perguntas enviadas de uma vez a cada processo de validação
+LINHAS_POR_TRANSACAO = 10000  # Inserções/atualizações acumuladas antes de gravar uma transação
+ARQUIVO_GRANDE = 4 << 20  # Acima disso (bytes) a validação usa um processo por CPU
+
+CHAVES_PERGUNTA = frozenset(['text', 'answers', 'correct_answer', 'tip', 'subject', 'level'])
+CHAVES_RESPOSTAS = frozenset(['A', 'B', 'C', 'D'])
+
+
+def validar_pergunta(p):
+    # Retorna o motivo da rejeição ou None se a pergunta tem todos os campos esperados
+    if not isinstance(p, dict) or not p.keys() >= CHAVES_PERGUNTA:
+        return "estrutura inválida ou faltando chaves"
+    if not isinstance(p['answers'], dict) or not p['answers'].keys() >= CHAVES_RESPOSTAS:
+        return "respostas A, B, C e D incompletas"
+    if not isinstance(p['text'], str) or not p['text'].strip():
+        return "enunciado vazio"
+    if not isinstance(p['correct_answer'], str) or p['correct_answer'].strip().upper() not in CHAVES_RESPOSTAS:
+        return "resposta correta deve ser A, B, C ou D"
+    return None
+
+
+def _texto(valor):
+    # Campos de texto sem espaços nas pontas (números viram texto, como o jogo os exibe)
+    return None if valor is None else str(valor).strip()
+
+
+def linha_da_pergunta(p):
+    # Pergunta do JSON (já validada) -> valores normalizados na ordem de COLUNAS_PERGUNTA
+    respostas = p['answers']
+    return (
+        _texto(p['text']), _texto(respostas.get('A')), _texto(respostas.get('B')),
+        _texto(respostas.get('C')), _texto(respostas.get('D')),
+        p['correct_answer'].strip().upper(), _texto(p['tip']),
+        _texto(p['subject']).lower(), _texto(p['level']).lower()
+    )
+
+
+def chave_da_linha(linha):
+    # Identidade da pergunta entre importações (nível, matéria e enunciado), resumida num digest
+    return hashlib.sha1(repr((linha[8], linha[7], linha[0])).encode('utf-8')).digest()
+
+
+def hash_da_linha(linha):
+    # Hash de todos os campos: muda quando qualquer resposta, dica ou gabarito é editado
+    # (repr da tupla distingue None de "None" e é bem mais rápido que json.dumps)
+    return hashlib.sha1(repr(tuple(linha)).encode('utf-8')).hexdigest()
+
+
+def normalizar_lote(itens, com_assinatura=True):
+    """Valida e normaliza um lote de perguntas lidas (roda nos processos de validação).
+
+    Cada item vira (linha, offset, motivo, trecho, pergunta): motivo e trecho para
+    as rejeitadas, pergunta = (valores, hash, chave, assinatura MinHash ou None) para as válidas.
+    """
+    resultados = []
+    for linha, offset, texto, p in itens:
+        if texto is not None:
+            try:
+                p = json.loads(texto)
+            except ValueError as e:
+                resultados.append((linha, offset, f"JSON inválido: {e}", texto.strip()[:200], None))
+                continue
+        motivo = validar_pergunta(p)
+        if motivo:
+            trecho = texto.strip() if texto is not None else json.dumps(p, ensure_ascii=False)
+            resultados.append((linha, offset, motivo, trecho[:200], None))
+            continue
+        valores = linha_da_pergunta(p)
+        assinatura_minhash = assinatura(valores[0], valores[1:5]) if com_assinatura else None
+        pergunta = (valores, hash_da_linha(valores), chave_da_linha(valores), assinatura_minhash)
+        resultados.append((linha, offset, None, None, pergunta))
+    return resultados
+
+
+def em_lotes(itens, tamanho):
+    itens = iter(itens)
+    while True:
+        lote = list(islice(itens, tamanho))
+        if not lote:
+            return
+        yield lote
+
+
+def normalizar_em_paralelo(lotes, processos, com_assinatura=True):
+    # Resultados na ordem dos lotes; no máximo dois lotes por processo ficam em andamento,
+    # então a memória não depende do tamanho do arquivo
+    if processos <= 1:
+        for lote in lotes:
+            yield normalizar_lote(lote, com_assinatura)
+        return
+    with ProcessPoolExecutor(max_workers=processos) as pool:
+        pendentes = deque()
+        for lote in lotes:
+            pendentes.append(pool.submit(normalizar_lote, lote, com_assinatura))
+            if len(pendentes) >= 2 * processos:
+                yield pendentes.popleft().result()
+        while pendentes:
+            yield pendentes.popleft().result()
+
+
+def _ate_erro_de_leitura(itens, estado):
+    # Encerra a leitura num erro de sintaxe do array (as perguntas anteriores ainda são importadas)
+    try:
+        yield from itens
+    except ErroDeLeitura as e:
+        estado["erro"] = e
+
+
+def garantir_coluna_hash(conn):
+    # Bancos criados antes do importador incremental não têm a coluna content_hash
+    colunas = [row[1] for row in conn.execute("PRAGMA table_info(questions)")]
+    if "content_hash" not in colunas:
+        conn.execute("ALTER TABLE questions ADD COLUMN content_hash TEXT")
+        conn.commit()
+
+
+def carregar_existentes(conn):
+    # chave -> (id, hash) das perguntas do banco, ids repetidos (mesma chave) e hashes a preencher
+    existentes = {}
+    repetidas = []
+    preencher_hash = []
+    # Uma consulta só: as colunas do hash vêm junto, para as linhas que ainda não o têm
+    for row_id, content_hash, *linha in conn.execute(
+        f"SELECT id, content_hash, {', '.join(COLUNAS_PERGUNTA)} FROM questions ORDER BY id"
+    ):
+        chave = chave_da_linha(linha)
+        if chave in existentes:
+            repetidas.append((row_id,))
+            continue
+        if content_hash is None:
+            # Linha de antes do importador incremental: hash calculado a partir das colunas
+            content_hash = hash_da_linha(linha)
+            preencher_hash.append((content_hash, row_id))
+        existentes[chave] = (row_id, content_hash)
+    return existentes, repetidas, preencher_hash
+
+
+def tem_tabela(conn, nome):
+    return conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (nome,)).fetchone() is not None
+
+
+def pares_de_edicao(conn, remover, primeiro_id_novo, limiar=LIMIAR):
+    """Pares (id novo, id removido) de perguntas cujo enunciado foi editado.
+
+    A identidade de uma pergunta é (nível, matéria, enunciado): editar o enunciado
+    insere uma pergunta nova (outro id) e remove a antiga. Uma removida que tem
+    estatísticas (question_stats) forma par com uma das inseridas nesta importação
+    (ids a partir de primeiro_id_novo) com o mesmo nível, matéria, alternativas e
+    gabarito (só o enunciado mudou) ou, se as alternativas também mudaram, quase
+    igual a ela (MinHash, mesmo nível).
+    """
+    colunas = "id, level, subject, correct_answer, text, answer_a, answer_b, answer_c, answer_d"
+    mesmas_respostas = {}  # (nível, matéria, gabarito, alternativas) -> ids removidos
+    indice = IndiceDeDuplicatas(limiar)
+    ids = [row_id for (row_id,) in remover]
+    for inicio in range(0, len(ids), 500):
+        lote = ids[inicio:inicio + 500]
+        for row_id, level, subject, correta, text, *respostas in conn.execute(
+            f"SELECT {colunas} FROM questions JOIN question_stats ON question_stats.question_id = questions.id "
+            f"WHERE questions.id IN ({', '.join('?' * len(lote))})", lote
+        ):
+            mesmas_respostas.setdefault((level, subject, correta, *respostas), []).append(row_id)
+            indice.adicionar(level, assinatura(text, respostas), row_id)
+    if not len(indice):
+        return []
+    pares, usados = [], set()
+    for row_id, level, subject, correta, text, *respostas in conn.execute(
+        f"SELECT {colunas} FROM questions WHERE id >= ?", (primeiro_id_novo,)
+    ):
+        candidatos = [antigo for antigo in mesmas_respostas.get((level, subject, correta, *respostas), ()) if antigo not in usados]
+        antigo = candidatos[0] if candidatos else indice.procurar(level, assinatura(text, respostas))[0]
+        if antigo is not None and antigo not in usados:
+            usados.add(antigo)
+            pares.append((row_id, antigo))
+    return pares
+
+
+def gravar_transacao(conn, resumo, inserir=(), atualizar=(), remover=(), preencher_hash=(), migrar=()):
+    inicio = time.perf_counter()
+    with conn:  # Ou a transação inteira é aplicada, ou nada muda
+        conn.executemany("UPDATE questions SET content_hash = ? WHERE id = ?", preencher_hash)
+        if migrar:
+            # Estatísticas das perguntas editadas passam para o novo id antes da remoção
+            conn.executemany("UPDATE OR REPLACE question_stats SET question_id = ? WHERE question_id = ?", migrar)
+        conn.executemany("DELETE FROM questions WHERE id = ?", remover)
+        if remover and tem_tabela(conn, "question_stats"):
+            # Tentativas e acertos das perguntas removidas (ver jogo/question_stats.py) não valem mais
+            conn.executemany("DELETE FROM question_stats WHERE question_id = ?", remover)
+        conn.executemany(
+            f"UPDATE questions SET {', '.join(c + ' = ?' for c in COLUNAS_PERGUNTA)}, content_hash = ? WHERE id = ?",
+            atualizar
+        )
+        conn.executemany(
+            f"INSERT INTO questions ({', '.join(COLUNAS_PERGUNTA)}, content_hash) VALUES ({', '.join('?' * (len(COLUNAS_PERGUNTA) + 1))})",
+            inserir
+        )
+        if inserir or atualizar or remover:
+            # Avisa o jogo (cache de ids do sorteio, banco em memória) mesmo com os gatilhos desligados
+            bump_questions_version(conn)
+    resumo["transacoes"] += 1
+    resumo["tempo_gravacao"] += time.perf_counter() - inicio
+
+
+def importar_perguntas(conn, itens, rejeitados, processos=1, linhas_por_transacao=LINHAS_POR_TRANSACAO,
+                       relatorio_duplicatas=None, mesclar_duplicatas=False, limiar=LIMIAR):
+    """Aplica no banco só a diferença entre as perguntas lidas e a tabela questions.
+
+    itens vem de leitura_perguntas.ler_perguntas (uma pergunta por vez). Perguntas
+    novas são inseridas, as que mudaram são atualizadas mantendo o id e, se o
+    arquivo foi lido inteiro, as que sumiram dele são removidas. As gravações saem
+    em transações de até linhas_por_transacao linhas; bancos pequenos são
+    atualizados numa única transação. usuarios e ranking não são tocados.
+
+    A identidade de uma pergunta é (nível, matéria, enunciado): editar o enunciado
+    vira inserção + remoção, com outro id. As tentativas e acertos do jogo
+    (question_stats) passam para o novo id quando só o enunciado mudou ou as duas
+    versões são quase iguais (ver pares_de_edicao); as das removidas são apagadas.
+
+    Com relatorio_duplicatas, perguntas quase iguais a uma anterior do mesmo nível
+    são listadas no relatório; com mesclar_duplicatas também deixam de ser
+    importadas (como as repetidas). Retorna um dicionário com as contagens e os tempos.
+    """
+    inicio = time.perf_counter()
+    resumo = {"recebidas": 0, "adicionadas": 0, "atualizadas": 0, "removidas": 0, "inalteradas": 0,
+              "rejeitadas": 0, "duplicadas": 0, "quase_duplicadas": 0, "transacoes": 0, "tempo_gravacao": 0.0, "arquivo_completo": True, "estatisticas_migradas": 0}
+
+    garantir_coluna_hash(conn)
+    # Índice de busca textual (FTS5): criado com as perguntas existentes se faltar; depois,
+    # os gatilhos o atualizam junto com cada alteração gravada abaixo
+    resumo["indice_busca_criado"] = ensure_search_index(conn)
+    resumo["indice_busca_suspenso"] = False
+    ensure_questions_version(conn)
+    existentes, repetidas, preencher_hash = carregar_existentes(conn)
+    primeiro_id_novo = (conn.execute("SELECT max(id) FROM questions").fetchone()[0] or 0) + 1  # AUTOINCREMENT não reusa ids
+    resumo["tempo_banco"] = time.perf_counter() - inicio
+    for pragma in PRAGMAS_IMPORTACAO:
+        conn.execute(pragma)
+
+    # Se a gravação falhar depois de suspender os gatilhos, o finally os recria mesmo assim:
+    # sem ele o banco ficaria com o índice de busca e a versão das perguntas desatualizados
+    try:
+        vistas = set()
+        indice = IndiceDeDuplicatas(limiar) if relatorio_duplicatas is not None else None
+        inserir, atualizar = [], []
+        leitura = {}
+        lotes = em_lotes(_ate_erro_de_leitura(itens, leitura), PERGUNTAS_POR_TAREFA)
+        for resultados in normalizar_em_paralelo(lotes, processos, com_assinatura=indice is not None):
+            for linha, offset, motivo, trecho, pergunta in resultados:
+                resumo["recebidas"] += 1
+                if motivo:
+                    rejeitados.registrar(linha, offset, motivo, trecho)
+                    resumo["rejeitadas"] += 1
+                    continue
+                valores, content_hash, chave, assinatura_pergunta = pergunta
+                if chave in vistas:
+                    rejeitados.registrar(linha, offset, "enunciado repetido no mesmo nível e matéria, mantida a primeira", valores[0][:200])
+                    resumo["duplicadas"] += 1
+                    continue
+                vistas.add(chave)
+                if indice is not None:
+                    parecida, valor = indice.procurar_ou_adicionar(valores[8], assinatura_pergunta, (linha, valores[0][:120]))
+                    if parecida is not None:
+                        resumo["quase_duplicadas"] += 1
+                        acao = "descartada" if mesclar_duplicatas else "mantida"
+                        relatorio_duplicatas.registrar(linha, offset, valores[0], parecida, valor, acao)
+                        if mesclar_duplicatas:
+                            continue  # Se já estava no banco, sobra em existentes e é removida no fim
+                atual = existentes.pop(chave, None)  # O que sobrar em existentes saiu do arquivo
+                if atual is None:
+                    inserir.append((*valores, content_hash))
+                elif atual[1] != content_hash:
+                    atualizar.append((*valores, content_hash, atual[0]))
+                else:
+                    resumo["inalteradas"] += 1
+            if len(inserir) + len(atualizar) >= linhas_por_transacao:
+                if not resumo["indice_busca_suspenso"]:
+                    # Importação grande: reconstruir o índice no fim é mais rápido que os gatilhos
+                    # (os da versão das perguntas também saem: gravar_transacao incrementa uma vez)
+                    suspend_search_index(conn)
+                    suspend_questions_version(conn)
+                    resumo["indice_busca_suspenso"] = True
+                resumo["adicionadas"] += len(inserir)
+                resumo["atualizadas"] += len(atualizar)
+                gravar_transacao(conn, resumo, inserir, atualizar)
+                inserir, atualizar = [], []
+
+        erro = leitura.get("erro")
+        if erro is not None:
+            rejeitados.registrar(erro.linha, erro.offset, erro.motivo, erro.trecho)
+            resumo["arquivo_completo"] = False
+        # Remove as perguntas fora do arquivo só se ele foi lido inteiro e tinha perguntas
+        # (um arquivo cortado ou vazio apagaria perguntas que continuam valendo)
+        remover = []
+        if erro is None and resumo["recebidas"] > 0:
+            remover = repetidas + [(row_id,) for row_id, _hash in existentes.values()]
+        resumo["adicionadas"] += len(inserir)
+        resumo["atualizadas"] += len(atualizar)
+        resumo["removidas"] = len(remover)
+        migrar = []
+        if remover and tem_tabela(conn, "question_stats"):
+            # As inserções precisam estar no banco (com id) para casar com as removidas
+            gravar_transacao(conn, resumo, inserir, atualizar, preencher_hash=preencher_hash)
+            inserir, atualizar, preencher_hash = [], [], []
+            migrar = pares_de_edicao(conn, remover, primeiro_id_novo, limiar)
+            resumo["estatisticas_migradas"] = len(migrar)
+        gravar_transacao(conn, resumo, inserir, atualizar, remover, preencher_hash, migrar)
+    finally:
+        if resumo["indice_busca_suspenso"]:
+            inicio_indice = time.perf_counter()
+            ensure_search_index(conn)
+            ensure_questions_version(conn)
+            resumo["tempo_gravacao"] += time.perf_counter() - inicio_indice
+    resumo["tempo_total"] = time.perf_counter() - inicio
+    return resumo
+
+
+def imprimir_resumo(resumo, rejeitados, relatorio_duplicatas=None):
+    print(
+        f"Importação concluída: {resumo['adicionadas']} adicionadas, {resumo['atualizadas']} atualizadas, "
+        f"{resumo['removidas']} removidas, {resumo['inalteradas']} inalteradas "
+        f"({resumo['rejeitadas']} rejeitadas, {resumo['duplicadas']} duplicadas e {resumo['quase_duplicadas']} quase iguais no arquivo)."
+    )
+    processamento = resumo['tempo_total'] - resumo['tempo_banco'] - resumo['tempo_gravacao']
+    print(
+        f"Tempo: leitura do banco {resumo['tempo_banco'] * 1000:.1f} ms, leitura/validação/comparação {processamento * 1000:.1f} ms, "
+        f"gravação {resumo['tempo_gravacao'] * 1000:.1f} ms em {resumo['transacoes']} transação(ões), "
+        f"total {resumo['tempo_total'] * 1000:.1f} ms ({resumo['recebidas']} perguntas no arquivo)."
+    )
+    if resumo["indice_busca_criado"]:
+        print("Índice de busca 'questions_fts' criado com as perguntas que já estavam no banco.")
+    if resumo["estatisticas_migradas"]:
+        print(f"{resumo['estatisticas_migradas']} pergunta(s) com enunciado editado mantiveram as estatísticas do jogo.")
+    if rejeitados.quantidade:
+        print(f"{rejeitados.quantidade} registro(s) com problema em '{rejeitados.caminho}'.")
+    if relatorio_duplicatas is not None and relatorio_duplicatas.quantidade:
+        print(f"{relatorio_duplicatas.quantidade} pergunta(s) quase iguais a outra em '{relatorio_duplicatas.caminho}'.")
+    if not resumo["arquivo_completo"]:
+        print("AVISO: o arquivo tem um erro de sintaxe; as perguntas depois dele não foram lidas e nenhuma pergunta foi removida.")
+
+
+def criar_ou_atualizar_banco(arquivo=JSON_FILENAME, banco=SQLITE_DB_FILENAME, rejeitados=REJEITADOS_FILENAME, processos=None,
+                             duplicatas="relatorio", relatorio=DUPLICATAS_FILENAME, limiar=LIMIAR):
     conn = None
     try:
         # Garante que a pasta 'jogo' existe para salvar o .db (caso não tenha rodado o jogo ainda)
         os.makedirs(JOGO_DIR, exist_ok=True)
 
-        print(f"Conectando/Criando banco de dados em: {SQLITE_DB_FILENAME}")
-        conn = sqlite3.connect(SQLITE_DB_FILENAME)
+        print(f"Conectando/Criando banco de dados em: {banco}")
+        conn = sqlite3.connect(banco)
         cursor = conn.cursor()
 
 
@@ -38,9 +409,12 @@ def criar_ou_atualizar_banco():
             correct_answer TEXT NOT NULL,
             tip TEXT,
             subject TEXT,
-            level TEXT
+            level TEXT,
+            content_hash TEXT
         )
         """)
+        # Índice usado pelo jogo para sortear perguntas por nível e matéria sem ler a tabela toda
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_questions_level_subject ON questions (level, subject)")
         conn.commit()
         print("Tabela 'questions' verificada/criada.")
 
@@ -73,69 +447,28 @@ def criar_ou_atualizar_banco():
         print("Tabela 'ranking' verificada/criada.")
 
 
-        # >>>>> MODIFICAÇÃO AQUI: Limpa as tabelas antes de inserir <<<<<
-        print("Limpando perguntas existentes da tabela 'questions' para atualização...")
-        cursor.execute("DELETE FROM questions")
-        conn.commit()
-        print("Tabela 'questions' limpa.")
+        if not os.path.exists(arquivo):
+            print(f"ERRO: Arquivo '{arquivo}' não encontrado. Nenhuma pergunta será adicionada.")
+            return # Sai se o arquivo de perguntas não for encontrado
+        if processos is None:
+            # Arquivos pequenos (como o perguntas.json) não compensam abrir os processos
+            processos = (os.cpu_count() or 1) if os.path.getsize(arquivo) > ARQUIVO_GRANDE else 1
 
-        print("Limpando usuários existentes da tabela 'usuarios' para atualização...")
-        cursor.execute("DELETE FROM usuarios")
-        conn.commit()
-        print("Tabela 'usuarios' limpa.")
-
-        print("Limpando ranking existente da tabela 'ranking' para atualização...")
-        cursor.execute("DELETE FROM ranking")
-        conn.commit()
-        print("Tabela 'ranking' limpa.")
-        # >>>>> FIM DA MODIFICAÇÃO <<<<<
-
-        print(f"Carregando perguntas do arquivo: {JSON_FILENAME}")
+        print(f"Importando perguntas de '{arquivo}' ({detectar_formato(arquivo)}, {processos} processo(s) de validação)...")
+        arquivo_rejeitados = ArquivoDeRejeitados(rejeitados)
+        relatorio_duplicatas = RelatorioDeDuplicatas(relatorio) if duplicatas != "desligado" else None
         try:
-            with open(JSON_FILENAME, 'r', encoding='utf-8') as f:
-                perguntas_data = json.load(f)
-        except FileNotFoundError:
-            print(f"ERRO: Arquivo '{JSON_FILENAME}' não encontrado. Nenhuma pergunta será adicionada.")
-            return # Sai se o JSON não for encontrado
-        except json.JSONDecodeError:
-            print(f"ERRO: Falha ao decodificar JSON do arquivo '{JSON_FILENAME}'. Verifique o formato.")
-            return
-        except Exception as e:
-            print(f"ERRO ao ler {JSON_FILENAME}: {e}")
-            return
-
-        if not perguntas_data:
-            print(f"Nenhum dado encontrado em '{JSON_FILENAME}'. O banco de dados não será populado.")
-            return
-
-        print(f"{len(perguntas_data)} perguntas carregadas do JSON. Iniciando inserção no SQLite...")
-        perguntas_inseridas_count = 0
-        for p_idx, p in enumerate(perguntas_data):
-            try:
-                if not isinstance(p, dict) or \
-                   not all(k in p for k in ['text', 'answers', 'correct_answer', 'tip', 'subject', 'level']) or \
-                   not isinstance(p['answers'], dict) or \
-                   not all(ak in p['answers'] for ak in ['A', 'B', 'C', 'D']):
-                    print(f"AVISO (Pergunta {p_idx+1}): Estrutura inválida ou faltando chaves. Não será inserida: {p.get('text', 'Texto desconhecido')[:50]}...")
-                    continue
-
-                cursor.execute("""
-                    INSERT INTO questions (text, answer_a, answer_b, answer_c, answer_d, correct_answer, tip, subject, level)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    p['text'], p['answers'].get('A'), p['answers'].get('B'),
-                    p['answers'].get('C'), p['answers'].get('D'),
-                    p['correct_answer'], p['tip'], p['subject'], p['level']
-                ))
-                perguntas_inseridas_count += 1
-            except Exception as e:
-                print(f"Erro ao inserir pergunta {p_idx+1} ('{p.get('text', 'Texto desconhecido')[:50]}...'): {e}")
-
-        conn.commit()
-        if perguntas_inseridas_count > 0:
-            print(f"{perguntas_inseridas_count} perguntas foram inseridas/atualizadas no banco '{SQLITE_DB_FILENAME}'.")
-        else:
-            print("Nenhuma pergunta nova foi inserida no banco de dados (verifique avisos ou o arquivo JSON).")
+            resumo = importar_perguntas(
+                conn, ler_perguntas(arquivo), arquivo_rejeitados, processos,
+                relatorio_duplicatas=relatorio_duplicatas, mesclar_duplicatas=duplicatas == "mesclar", limiar=limiar
+            )
+        finally:
+            arquivo_rejeitados.fechar()
+            if relatorio_duplicatas is not None:
+                relatorio_duplicatas.fechar()
+        if resumo["recebidas"] == 0:
+            print(f"Nenhum dado encontrado em '{arquivo}'. Nenhuma pergunta foi removida do banco.")
+        imprimir_resumo(resumo, arquivo_rejeitados, relatorio_duplicatas)
 
     except sqlite3.Error as e:
         print(f"Erro geral com SQLite: {e}")
@@ -146,7 +479,17 @@ def criar_ou_atualizar_banco():
     finally:
         if conn:
             conn.close()
-            print(f"Conexão com '{SQLITE_DB_FILENAME}' fechada.")
+            print(f"Conexão com '{banco}' fechada.")
 
 if __name__ == "__main__":
-    criar_ou_atualizar_banco()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Importa as perguntas (array JSON ou JSON Lines) para o banco do jogo.")
+    parser.add_argument("arquivo", nargs="?", default=JSON_FILENAME, help="arquivo de perguntas (padrão: perguntas.json)")
+    parser.add_argument("--banco", default=SQLITE_DB_FILENAME, help="banco SQLite (padrão: jogo/quiz_banco.db)")
+    parser.add_argument("--rejeitados", default=REJEITADOS_FILENAME, help="arquivo JSON Lines com as perguntas rejeitadas")
+    parser.add_argument("--processos", type=int, default=None, help="processos de validação (padrão: 1 por CPU em arquivos grandes)")
+    parser.add_argument("--duplicatas", choices=MODOS_DUPLICATAS, default="relatorio",
+                        help="perguntas quase iguais: só listar (padrão), mesclar (importa a primeira) ou desligado")
+    parser.add_argument("--relatorio", default=DUPLICATAS_FILENAME, help="arquivo JSON Lines com as perguntas quase iguais")
+    parser.add_argument("--limiar", type=float, default=LIMIAR, help=f"similaridade mínima para quase iguais (padrão: {LIMIAR})")
+    args = parser.parse_args()
+    criar_ou_atualizar_banco(args.arquivo, args.banco, args.rejeitados, args.processos, args.duplicatas, args.relatorio, args.limiar)
\ No newline at end of file
@@ -0,0 +1,155 @@
+# Detecção de perguntas quase iguais na importação (MinHash + LSH).
+#
+# Cada pergunta vira um conjunto de shingles (trechos de 5 caracteres do enunciado e
+# das alternativas, sem acentos nem pontuação). A assinatura MinHash tem BINS valores
+# e é calculada com um único hash por shingle (one permutation hashing: o hash escolhe
+# o bin e cada bin guarda o menor valor; bins vazios copiam o vizinho, deslocado pela
+# distância). A fração de bins iguais entre duas assinaturas estima a similaridade de
+# Jaccard dos conjuntos.
+#
+# Para não comparar todos os pares, o índice LSH divide a assinatura em BANDAS faixas
+# e só compara perguntas do mesmo nível que coincidem numa faixa inteira: o custo por
+# pergunta é constante e a importação continua linear.
+import json
+import os
+import re
+import unicodedata
+import zlib
+from array import array
+from operator import eq
+
+BINS = 64  # Valores por assinatura (potência de 2)
+BANDAS = 8  # Faixas do LSH (BINS / BANDAS valores por faixa)
+LIMIAR = 0.85  # Similaridade estimada a partir da qual duas perguntas são quase iguais
+TAMANHO_SHINGLE = 5
+VAZIO = 1 << 32  # Bin sem shingle (acima de qualquer crc32); preenchido com vizinho + distância * VAZIO
+
+_NAO_ALFANUMERICO = re.compile(rb"[^0-9a-z]+")
+_BYTES_POR_BANDA = BINS // BANDAS * 8
+_FATIAS = []
+
+
+def _fatias(tamanho):
+    # slice() de cada shingle de um documento com esse tamanho (reaproveitados entre documentos)
+    while len(_FATIAS) < tamanho - TAMANHO_SHINGLE + 1:
+        inicio = len(_FATIAS)
+        _FATIAS.append(slice(inicio, inicio + TAMANHO_SHINGLE))
+    return _FATIAS[:tamanho - TAMANHO_SHINGLE + 1]
+
+
+def _normalizar(texto):
+    # Minúsculas, sem acentos e com pontuação/espaços colapsados num espaço (resultado em bytes ASCII)
+    texto = unicodedata.normalize("NFKD", str(texto).lower()).encode("ascii", "ignore")
+    return _NAO_ALFANUMERICO.sub(b" ", texto).strip()
+
+
+def assinatura(enunciado, respostas):
+    """Assinatura MinHash (bytes) do enunciado com o conjunto de alternativas (a ordem não importa)."""
+    documento = b" | ".join([_normalizar(enunciado)] + sorted(_normalizar(r) for r in respostas if r is not None))
+    documento = documento.ljust(TAMANHO_SHINGLE)
+
+    # Um crc32 por shingle: os bits baixos escolhem o bin, os altos são o valor. Com os
+    # hashes em ordem decrescente, o dicionário bin -> hash fica com o menor de cada bin
+    # (os laços rodam em C: map/zip em vez de um for por shingle)
+    hashes = sorted(map(zlib.crc32, map(documento.__getitem__, _fatias(len(documento)))), reverse=True)
+    por_bin = dict(zip(map((BINS - 1).__and__, hashes), hashes))
+    minimos = [por_bin.get(b, VAZIO) for b in range(BINS)]
+
+    # Densificação por rotação: o bin vazio usa o próximo bin preenchido à direita
+    if VAZIO in minimos:
+        preenchido = next(b for b in range(BINS) if minimos[b] != VAZIO) + BINS  # Depois do último, volta ao início
+        for b in range(BINS - 1, -1, -1):
+            if minimos[b] != VAZIO:
+                preenchido = b
+            else:
+                minimos[b] = minimos[preenchido % BINS] + (preenchido - b) * VAZIO
+    return array("Q", minimos).tobytes()
+
+
+def similaridade(a, b):
+    # Fração de bins iguais entre duas assinaturas (estimativa de Jaccard), comparando sem copiar
+    return sum(map(eq, memoryview(a).cast("Q"), memoryview(b).cast("Q"))) / BINS
+
+
+class IndiceDeDuplicatas:
+    """Índice LSH das perguntas já vistas, por grupo (nível).
+
+    procurar_ou_adicionar() devolve a pergunta parecida já vista (e a similaridade)
+    ou guarda a nova; procurar() e adicionar() fazem cada parte separadamente.
+    Cada faixa guarda só a primeira pergunta com aquele valor: a memória fica em
+    BANDAS entradas por pergunta distinta.
+    """
+
+    def __init__(self, limiar=LIMIAR):
+        self.limiar = limiar
+        self._faixas = [{} for _ in range(BANDAS)]  # hash (grupo, faixa) -> posição
+        self._assinaturas = []  # Posição -> assinatura
+        self._referencias = []  # Posição -> (linha, enunciado) para o relatório
+
+    def __len__(self):
+        return len(self._assinaturas)
+
+    @staticmethod
+    def _chaves(grupo, assinatura_pergunta):
+        return [hash((grupo, assinatura_pergunta[i * _BYTES_POR_BANDA:(i + 1) * _BYTES_POR_BANDA])) for i in range(BANDAS)]
+
+    def _procurar(self, chaves, assinatura_pergunta):
+        melhor, melhor_similaridade = None, 0.0
+        for faixa, chave in zip(self._faixas, chaves):
+            posicao = faixa.get(chave)
+            if posicao is not None and posicao != melhor:
+                valor = similaridade(assinatura_pergunta, self._assinaturas[posicao])
+                if valor >= self.limiar and valor > melhor_similaridade:
+                    melhor, melhor_similaridade = posicao, valor
+        if melhor is None:
+            return None, 0.0
+        return self._referencias[melhor], melhor_similaridade
+
+    def _adicionar(self, chaves, assinatura_pergunta, referencia):
+        posicao = len(self._assinaturas)
+        self._assinaturas.append(assinatura_pergunta)
+        self._referencias.append(referencia)
+        for faixa, chave in zip(self._faixas, chaves):
+            faixa.setdefault(chave, posicao)
+
+    def procurar(self, grupo, assinatura_pergunta):
+        """(referência, similaridade) da pergunta parecida já guardada, ou (None, 0.0); não guarda nada."""
+        return self._procurar(self._chaves(grupo, assinatura_pergunta), assinatura_pergunta)
+
+    def adicionar(self, grupo, assinatura_pergunta, referencia):
+        self._adicionar(self._chaves(grupo, assinatura_pergunta), assinatura_pergunta, referencia)
+
+    def procurar_ou_adicionar(self, grupo, assinatura_nova, referencia):
+        chaves = self._chaves(grupo, assinatura_nova)
+        parecida = self._procurar(chaves, assinatura_nova)
+        if parecida[0] is None:
+            self._adicionar(chaves, assinatura_nova, referencia)
+        return parecida
+
+
+class RelatorioDeDuplicatas:
+    """Arquivo JSON Lines com os pares de perguntas quase iguais (criado só se houver algum)."""
+
+    def __init__(self, caminho):
+        self.caminho = caminho
+        self.quantidade = 0
+        self._arquivo = None
+        if os.path.exists(caminho):
+            os.remove(caminho)  # Relatório de uma importação anterior
+
+    def registrar(self, linha, offset, enunciado, parecida, similaridade_estimada, acao):
+        if self._arquivo is None:
+            self._arquivo = open(self.caminho, "w", encoding="utf-8")
+        linha_parecida, enunciado_parecido = parecida
+        registro = {
+            "linha": linha, "offset": offset, "texto": enunciado[:200],
+            "parecida_com": {"linha": linha_parecida, "texto": enunciado_parecido},
+            "similaridade": round(similaridade_estimada, 3), "acao": acao,
+        }
+        self._arquivo.write(json.dumps(registro, ensure_ascii=False) + "\n")
+        self.quantidade += 1
+
+    def fechar(self):
+        if self._arquivo is not None:
+            self._arquivo.close()
+            self._arquivo = None
@@ -0,0 +1,143 @@
+# Leitura em fluxo dos arquivos de perguntas, com memória limitada.
+#
+# Aceita um array JSON (como o perguntas.json) ou JSON Lines (uma pergunta por linha).
+# Os leitores devolvem uma pergunta por vez como (linha, offset, texto, objeto):
+# linha e offset (posição do caractere no arquivo, a partir de 0) apontam o início
+# da pergunta para o arquivo de rejeitados; no JSON Lines vem o texto da linha (o
+# json.loads fica para os processos de validação), no array vem o objeto já lido.
+import json
+import os
+import re
+
+TAMANHO_BLOCO = 1 << 20  # Caracteres lidos por vez do array JSON
+MAXIMO_PERGUNTA = 16 << 20  # Uma pergunta maior que isso no array é considerada JSON inválido
+ESPACOS = re.compile(r"[ \t\n\r]*")
+
+
+class ErroDeLeitura(Exception):
+    """Erro de sintaxe no array JSON: o resto do arquivo não pode ser lido."""
+
+    def __init__(self, motivo, linha, offset, trecho):
+        super().__init__(f"{motivo} (linha {linha}, offset {offset})")
+        self.motivo = motivo
+        self.linha = linha
+        self.offset = offset
+        self.trecho = trecho
+
+
+def detectar_formato(caminho):
+    # "jsonl" pela extensão ou se o primeiro caractere não for "["; senão "array"
+    if caminho.endswith((".jsonl", ".ndjson")):
+        return "jsonl"
+    with open(caminho, "r", encoding="utf-8") as f:
+        inicio = f.read(4096).lstrip("\ufeff \t\r\n")
+    return "array" if inicio.startswith("[") else "jsonl"
+
+
+def ler_json_lines(caminho):
+    offset = 0
+    with open(caminho, "r", encoding="utf-8", newline="") as f:
+        for numero, texto in enumerate(f, start=1):
+            if numero == 1:
+                texto = texto.lstrip("\ufeff")
+            if texto.strip():
+                yield numero, offset, texto, None
+            offset += len(texto)
+
+
+def ler_array_json(caminho):
+    decoder = json.JSONDecoder()
+    with open(caminho, "r", encoding="utf-8", newline="") as f:
+        buffer = f.read(TAMANHO_BLOCO).lstrip("\ufeff")
+        fim_do_arquivo = not buffer
+        inicio_buffer = 0  # Offset no arquivo de buffer[0]
+        pos = 0  # Posição atual dentro do buffer
+        linha = 1  # Linha de buffer[pos_linha]
+        pos_linha = 0
+
+        def erro(motivo):
+            nonlocal linha, pos_linha
+            linha += buffer.count("\n", pos_linha, pos)
+            pos_linha = pos
+            return ErroDeLeitura(motivo, linha, inicio_buffer + pos, buffer[pos:pos + 200])
+
+        def ler_mais():
+            # Descarta o que já foi lido e acrescenta o próximo bloco
+            nonlocal buffer, pos, pos_linha, linha, inicio_buffer, fim_do_arquivo
+            linha += buffer.count("\n", pos_linha, pos)
+            inicio_buffer += pos
+            bloco = f.read(TAMANHO_BLOCO)
+            fim_do_arquivo = not bloco
+            buffer = buffer[pos:] + bloco
+            pos = pos_linha = 0
+
+        def pular_espacos():
+            nonlocal pos
+            while True:
+                pos = ESPACOS.match(buffer, pos).end()
+                if pos < len(buffer) or fim_do_arquivo:
+                    return
+                ler_mais()
+
+        pular_espacos()
+        if buffer[pos:pos + 1] != "[":
+            raise erro("o arquivo não começa com '['")
+        pos += 1
+        pular_espacos()
+        if buffer[pos:pos + 1] == "]":
+            return
+        while True:
+            while True:
+                try:
+                    objeto, fim = decoder.raw_decode(buffer, pos)
+                    if fim < len(buffer) or fim_do_arquivo:
+                        break
+                    # Terminou exatamente no fim do bloco (ex.: um número cortado): confere com mais texto
+                except json.JSONDecodeError as e:
+                    # Pergunta cortada no fim do bloco: lê mais e tenta de novo
+                    if fim_do_arquivo or len(buffer) - pos > MAXIMO_PERGUNTA:
+                        raise erro(f"JSON inválido: {e.msg}")
+                ler_mais()
+            linha += buffer.count("\n", pos_linha, pos)
+            pos_linha = pos
+            yield linha, inicio_buffer + pos, None, objeto
+            pos = fim
+            pular_espacos()
+            separador = buffer[pos:pos + 1]
+            pos += 1
+            if separador == "]":
+                return
+            if separador != ",":
+                pos -= 1
+                raise erro("esperado ',' ou ']' entre as perguntas")
+            pular_espacos()
+
+
+def ler_perguntas(caminho):
+    """Perguntas do arquivo, uma por vez, como (linha, offset, texto, objeto)."""
+    if detectar_formato(caminho) == "jsonl":
+        return ler_json_lines(caminho)
+    return ler_array_json(caminho)
+
+
+class ArquivoDeRejeitados:
+    """Arquivo JSON Lines com as perguntas não importadas (criado só se houver alguma)."""
+
+    def __init__(self, caminho):
+        self.caminho = caminho
+        self.quantidade = 0
+        self._arquivo = None
+        if os.path.exists(caminho):
+            os.remove(caminho)  # Rejeitados de uma importação anterior
+
+    def registrar(self, linha, offset, motivo, trecho):
+        if self._arquivo is None:
+            self._arquivo = open(self.caminho, "w", encoding="utf-8")
+        registro = {"linha": linha, "offset": offset, "motivo": motivo, "trecho": trecho}
+        self._arquivo.write(json.dumps(registro, ensure_ascii=False) + "\n")
+        self.quantidade += 1
+
+    def fechar(self):
+        if self._arquivo is not None:
+            self._arquivo.close()
+            self._arquivo = None
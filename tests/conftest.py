@@ -0,0 +1,62 @@
+import os
+import sqlite3
+import sys
+
+import pytest
+
+# Os scripts de perguntas/ importam os módulos vizinhos pelo nome (rodam como python perguntas/...)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "perguntas"))
+
+CREATE_QUESTIONS = """
+CREATE TABLE questions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    text TEXT NOT NULL,
+    answer_a TEXT, answer_b TEXT, answer_c TEXT, answer_d TEXT,
+    correct_answer TEXT NOT NULL,
+    tip TEXT, subject TEXT, level TEXT, content_hash TEXT
+)
+"""
+
+LEVELS = ("facil", "medio")
+SUBJECTS = ("exatas", "naturais", "linguagens")
+PER_GROUP = 30
+
+
+def make_questions_db(path, per_group=PER_GROUP):
+    """Banco com a tabela questions: per_group perguntas em cada (nível, matéria), intercaladas por id."""
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.execute(CREATE_QUESTIONS)
+        conn.executemany(
+            "INSERT INTO questions (text, answer_a, answer_b, answer_c, answer_d, correct_answer, tip, subject, level) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (f"Pergunta {i} de {subject} ({level})?", f"a{i}", f"b{i}", f"c{i}", f"d{i}", "ABCD"[i % 4], None, subject, level)
+                for i in range(per_group) for level in LEVELS for subject in SUBJECTS
+            ],
+        )
+    conn.close()
+    return str(path)
+
+
+@pytest.fixture
+def questions_db(tmp_path):
+    return make_questions_db(tmp_path / "quiz.db")
+
+
+@pytest.fixture
+def game_env(tmp_path, monkeypatch):
+    """Jogo sem janela nem som, com ranking e estatísticas em bancos temporários."""
+    from jogo import config
+
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    monkeypatch.setattr(config, "MUSIC", False)
+    monkeypatch.setattr(config, "FPS", 200)
+    monkeypatch.setattr(config, "RECORD_SESSION", None)
+    monkeypatch.setattr(config, "RANKING_DB", str(tmp_path / "ranking.db"))
+    monkeypatch.setattr(config, "RANKING_FILE", str(tmp_path / "sem_ranking.json"))
+    monkeypatch.setattr(config, "QUESTION_STATS_DB", str(tmp_path / "question_stats.db"))
+    yield tmp_path
+    import pygame
+    pygame.quit()
@@ -0,0 +1,47 @@
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from jogo import asset_manifest, config
+from jogo.assets import Assets
+from jogo.game import SCENE_CLASSES
+
+
+@pytest.fixture
+def assets(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    monkeypatch.setattr(config, "SURFACE_CACHE", False)  # Não grava no cache real
+    pygame.display.init()
+    pygame.font.init()
+    pygame.display.set_mode((10, 10))
+    yield Assets()
+    pygame.display.quit()
+
+
+def test_manifest_names_are_known():
+    loadable = set(asset_manifest.IMAGES) | set(asset_manifest.FONTS) | set(asset_manifest.SOUNDS)
+    assert set(asset_manifest.SCENE_ASSETS) == set(SCENE_CLASSES) == set(asset_manifest.SCENE_PREFETCH)
+    for names in asset_manifest.SCENE_ASSETS.values():
+        assert set(names) <= loadable
+    for atlas in asset_manifest.ATLASES.values():
+        assert set(atlas["images"]) <= set(asset_manifest.IMAGES)
+    for images in asset_manifest.HELP_BUTTON_IMAGES.values():
+        assert set(images) <= set(asset_manifest.IMAGES)
+
+
+def test_images_load_on_first_access(assets):
+    assert not assets.is_loaded("logo_img")
+    logo = assets.logo_img
+    assert assets.is_loaded("logo_img") and assets.logo_img is logo
+    assert assets.help_button_images["dica"][3] is assets.botao_dica3_img
+    with pytest.raises(AttributeError):
+        assets.imagem_que_nao_existe
+
+
+def test_prefetch_decodes_a_scene_in_background(assets):
+    assets.prefetch("ranking_screen")
+    assets.load_scene("ranking_screen")  # Espera o que ainda estiver sendo decodificado
+    assert assets.is_ready("ranking_screen")
+    images = [name for name in asset_manifest.SCENE_ASSETS["ranking_screen"] if name in asset_manifest.IMAGES]
+    assert all(assets.is_loaded(name) for name in images)
+    assert not assets.is_loaded("parabens_img")  # Imagens de outras telas continuam sem carregar
@@ -0,0 +1,50 @@
+import pygame
+import pytest
+
+from jogo import asset_manifest, atlas
+
+
+@pytest.fixture
+def small_atlas(tmp_path, monkeypatch):
+    # Atlas de teste com duas imagens em tmp_path (o manifesto real não é tocado)
+    images = {}
+    for name, color, size in (("red_img", (255, 0, 0), (30, 20)), ("blue_img", (0, 0, 255), (10, 40))):
+        surface = pygame.Surface(size)
+        surface.fill(color)
+        path = tmp_path / f"{name}.png"
+        pygame.image.save(surface, str(path))
+        images[name] = {"path": str(path), "raw": True}
+    monkeypatch.setattr(asset_manifest, "IMAGES", images)
+    monkeypatch.setattr(asset_manifest, "ATLASES", {"test_atlas": {
+        "path": str(tmp_path / "atlas" / "test.png"),
+        "layout": str(tmp_path / "atlas" / "test.json"),
+        "images": list(images),
+    }})
+    return images
+
+
+def test_pack_keeps_rects_apart():
+    sizes = {f"img{i}": (100 + i * 37, 20 + i * 11) for i in range(12)}
+    rects, (width, height) = atlas.pack(sizes, sheet_width=400, padding=2)
+    assert all(rects[name].size == size for name, size in sizes.items())
+    assert all(0 <= r.left and r.right <= width and r.bottom <= height for r in rects.values())
+    padded = [r.inflate(2, 2) for r in rects.values()]
+    assert not any(a.colliderect(b) for i, a in enumerate(padded) for b in padded[i + 1:])
+
+
+def test_layout_is_rebuilt_when_a_source_changes(small_atlas):
+    atlas.build_atlas("test_atlas")
+    entries = atlas.load_layouts(rebuild=False)
+    assert set(entries) == {"red_img", "blue_img"}
+
+    # Mesma especificação, arquivo original diferente: a imagem não vale mais no atlas
+    surface = pygame.Surface((30, 20))
+    surface.fill((0, 255, 0))
+    pygame.image.save(surface, small_atlas["red_img"]["path"])
+    assert set(atlas.load_layouts(rebuild=False)) == {"blue_img"}
+
+    # Com rebuild, a folha é gerada de novo e passa a ter a imagem nova
+    entries = atlas.load_layouts()
+    assert set(entries) == {"red_img", "blue_img"}
+    sheet = pygame.image.load(asset_manifest.ATLASES["test_atlas"]["path"])
+    assert sheet.get_at(entries["red_img"][1].topleft)[:3] == (0, 255, 0)
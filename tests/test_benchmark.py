@@ -0,0 +1,36 @@
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from jogo.benchmark import OPCOES, VOLTAR, _scene_stats, print_comparison, run_benchmark
+
+SHORT_SCRIPT = [
+    ("wait_scene", "main_menu"), ("idle", 3),
+    ("click", OPCOES), ("wait_scene", "options_menu"), ("idle", 3),
+    ("click", VOLTAR), ("wait_scene", "main_menu"), ("idle", 2),
+]
+
+
+def test_scene_stats():
+    stats = _scene_stats([0.004, 0.001, 0.002, 0.003])
+    assert stats["frames"] == 4
+    assert stats["mean_ms"] == pytest.approx(2.5)
+    assert stats["max_ms"] == pytest.approx(4.0)
+    assert stats["p50_ms"] <= stats["p95_ms"] <= stats["p99_ms"] <= stats["max_ms"]
+
+
+def test_script_drives_the_real_scenes(game_env, capsys):
+    report = run_benchmark(script=SHORT_SCRIPT)
+    assert set(report["scenes"]) == {"main_menu", "options_menu"}
+    assert report["scenes"]["options_menu"]["frames"] >= 3
+    assert report["all"]["frames"] == sum(stats["frames"] for stats in report["scenes"].values())
+
+    print_comparison(report, {"scenes": {"main_menu": report["scenes"]["main_menu"]}})
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[1].startswith("main_menu") and "->" in lines[1]
+    assert lines[2].startswith("options_menu") and "->" not in lines[2]  # Sem linha de base
+
+
+def test_scene_that_never_appears_stops_the_run(game_env):
+    with pytest.raises(RuntimeError, match="ranking_screen"):
+        run_benchmark(script=[("wait_scene", "ranking_screen")])
@@ -0,0 +1,84 @@
+import random
+
+import pytest
+
+from duplicatas import LIMIAR, TAMANHO_SHINGLE, IndiceDeDuplicatas, _normalizar, assinatura, similaridade
+
+WORDS = ("água energia célula planeta número fração verbo sujeito governo império guerra região clima "
+         "força massa átomo reação ângulo triângulo soma produto divisão texto autor poema século").split()
+
+
+def random_question(rng, words=18):
+    text = " ".join(rng.choice(WORDS) for _ in range(words)) + "?"
+    answers = [" ".join(rng.choice(WORDS) for _ in range(3)) for _ in range(4)]
+    return text, answers
+
+
+def jaccard(a, b):
+    # Similaridade exata dos conjuntos de shingles que a assinatura estima
+    def shingles(question):
+        text, answers = question
+        document = b" | ".join([_normalizar(text)] + sorted(_normalizar(r) for r in answers))
+        return {document[i:i + TAMANHO_SHINGLE] for i in range(len(document) - TAMANHO_SHINGLE + 1)}
+    sa, sb = shingles(a), shingles(b)
+    return len(sa & sb) / len(sa | sb)
+
+
+def test_normalization_and_answer_order_do_not_matter():
+    a = assinatura("Qual é a fórmula da ÁGUA?", ["H2O", "CO2", "O2", "NaCl"])
+    b = assinatura("qual e a formula da agua", ["NaCl", "O2", "h2o", "CO2"])
+    assert a == b
+    assert similaridade(a, b) == 1.0
+
+
+def test_estimate_tracks_exact_jaccard():
+    rng = random.Random(1)
+    errors = []
+    for _ in range(200):
+        original = random_question(rng)
+        text = original[0].split()
+        text[rng.randrange(len(text))] = rng.choice(WORDS)  # Troca uma palavra
+        edited = (" ".join(text), original[1])
+        errors.append(abs(similaridade(assinatura(*original), assinatura(*edited)) - jaccard(original, edited)))
+    assert sum(errors) / len(errors) < 0.06
+
+
+def test_lsh_recall_and_precision():
+    rng = random.Random(2)
+    originals = [random_question(rng, words=25) for _ in range(400)]
+    index = IndiceDeDuplicatas()
+    for i, question in enumerate(originals):
+        assert index.procurar_ou_adicionar("medio", assinatura(*question), i) == (None, 0.0)
+
+    # Cópias com pequenas edições (pontuação, maiúsculas, uma palavra a mais no fim)
+    copies = [(text.upper().rstrip("?") + " " + rng.choice(WORDS) + "!", answers) for text, answers in originals]
+    near = [i for i, copy in enumerate(copies) if jaccard(originals[i], copy) >= 0.9]
+    assert len(near) > 300
+    found = sum(index.procurar("medio", assinatura(*copies[i]))[0] == i for i in near)
+    assert found / len(near) >= 0.95
+
+    unrelated = [random_question(rng, words=25) for _ in range(400)]
+    false_positives = sum(index.procurar("medio", assinatura(*question))[0] is not None for question in unrelated)
+    assert false_positives <= 2
+    assert len(index) == len(originals)  # procurar() não guarda nada
+
+
+def test_groups_are_separate():
+    index = IndiceDeDuplicatas()
+    signature = assinatura("Quem escreveu Os Lusíadas?", ["Camões", "Pessoa", "Bilac", "Assis"])
+    index.adicionar("facil", signature, "original")
+    assert index.procurar("medio", signature) == (None, 0.0)
+    assert index.procurar("facil", signature) == ("original", 1.0)
+
+
+@pytest.mark.parametrize("limiar, expected", [(LIMIAR, "original"), (0.99, None)])
+def test_threshold(limiar, expected):
+    # Uma palavra a menos: similaridade estimada ~0.91
+    original = ("Em que ano o Brasil declarou a sua independência de Portugal?", ["1822", "1889", "1500", "1808"])
+    edited = ("Em que ano o Brasil declarou a independência de Portugal?", ["1822", "1889", "1500", "1808"])
+    index = IndiceDeDuplicatas(limiar)
+    index.adicionar("medio", assinatura(*original), "original")
+    match, value = index.procurar("medio", assinatura(*edited))
+    assert match == expected
+    if match is not None:
+        assert limiar <= value < 1.0
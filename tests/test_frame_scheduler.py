@@ -0,0 +1,61 @@
+import time
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from jogo.frame_scheduler import FrameScheduler, percentile
+
+
+@pytest.fixture
+def display(monkeypatch):
+    # pygame.event.wait precisa do subsistema de vídeo (driver sem janela)
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    pygame.display.set_mode((10, 10))
+    yield
+    pygame.display.quit()
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 0) == 1
+    assert percentile(values, 50) == 51
+    assert percentile(values, 95) == 95
+    assert percentile(values, 100) == 100
+    assert percentile([7.5], 99) == 7.5
+
+
+def test_stats_report_frame_times():
+    scheduler = FrameScheduler(fps=1000, history=10)
+    assert scheduler.stats()["frames"] == 0
+    for _ in range(12):
+        scheduler.begin_frame()
+        time.sleep(0.002)
+        scheduler.end_frame()
+    stats = scheduler.stats()
+    assert stats["frames"] == 10  # Só os últimos frames do histórico
+    assert 2.0 <= stats["frame_ms_p50"] <= stats["frame_ms_p95"] <= stats["frame_ms_p99"]
+    assert stats["fps"] > 0
+
+
+def test_idle_wait_blocks_until_timeout(display):
+    scheduler = FrameScheduler(fps=1000, idle_timeout_ms=200)
+    scheduler.wait_events()  # Primeiro frame nunca bloqueia
+    pygame.event.clear()
+    started = time.perf_counter()
+    assert scheduler.wait_events() == []
+    assert time.perf_counter() - started >= 0.15
+
+
+def test_request_frame_skips_the_idle_wait(display):
+    scheduler = FrameScheduler(fps=1000, idle_timeout_ms=2000)
+    scheduler.wait_events()
+    pygame.event.clear()
+    scheduler.request_frame()
+    started = time.perf_counter()
+    scheduler.wait_events()
+    assert time.perf_counter() - started < 1.0
+    # O pedido vale para um frame só
+    pygame.event.post(pygame.event.Event(pygame.USEREVENT))
+    assert [event.type for event in scheduler.wait_events()] == [pygame.USEREVENT]
@@ -0,0 +1,42 @@
+import pygame
+import pytest
+
+from jogo.glyph_cache import NUMERIC_GLYPHS, GlyphCache, format_money
+
+WHITE = (255, 255, 255)
+
+
+@pytest.fixture
+def font():
+    pygame.font.init()
+    return pygame.font.Font(None, 30)
+
+
+def test_format_money():
+    assert format_money(0) == "P$ 0"
+    assert format_money(1000000) == "P$ 1.000.000"
+    assert format_money(2500.4) == "P$ 2.500"
+
+
+def test_numbers_are_composed_without_new_renders(font):
+    cache = GlyphCache()
+    target = pygame.Surface((300, 50))
+    rect = cache.blit(target, "P$ 1.250", (10, 5), font, WHITE)
+    assert cache.renders == len(NUMERIC_GLYPHS)  # Só a tabela inicial
+    assert rect.topleft == (10, 5) and rect.size == cache.size("P$ 1.250", font, WHITE)
+
+    cache.blit(target, "98.765.432", (10, 5), font, WHITE)
+    assert cache.renders == len(NUMERIC_GLYPHS)
+    cache.blit(target, "10º", (10, 5), font, WHITE)  # Caractere novo: renderizado uma única vez
+    cache.blit(target, "20º", (10, 5), font, WHITE)
+    assert cache.renders == len(NUMERIC_GLYPHS) + 1
+    cache.glyphs(font, (255, 0, 0))  # Outra cor, outra tabela
+    assert cache.renders == 2 * len(NUMERIC_GLYPHS) + 1
+
+
+def test_composed_text_matches_the_glyph_widths(font):
+    cache = GlyphCache()
+    glyphs = cache.glyphs(font, WHITE)
+    width, height = cache.size("1:05", font, WHITE)
+    assert width == sum(glyphs[char].get_width() for char in "1:05")
+    assert height == glyphs["0"].get_height()
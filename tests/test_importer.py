@@ -0,0 +1,160 @@
+import json
+import sqlite3
+
+import pytest
+
+from criar_banco_sqlite import importar_perguntas
+from jogo.question_sampler import questions_version
+from leitura_perguntas import ArquivoDeRejeitados, ler_perguntas
+from tests.conftest import CREATE_QUESTIONS
+
+SUBJECTS = ("exatas", "naturais", "linguagens")
+
+
+def question(i, **changes):
+    base = {
+        "text": f"Pergunta número {i} sobre o tema {i * 7}?",
+        "answers": {"A": f"resposta {i}", "B": f"outra {i}", "C": f"mais uma {i}", "D": f"última {i}"},
+        "correct_answer": "ABCD"[i % 4], "tip": f"dica {i}", "subject": SUBJECTS[i % 3], "level": "medio",
+    }
+    base.update(changes)
+    return base
+
+
+@pytest.fixture
+def conn(tmp_path):
+    conn = sqlite3.connect(tmp_path / "quiz.db")
+    conn.execute(CREATE_QUESTIONS)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def importar(conn, tmp_path):
+    def importar(perguntas, texto=None):
+        arquivo = tmp_path / "perguntas.json"
+        arquivo.write_text(texto if texto is not None else json.dumps(perguntas, ensure_ascii=False), encoding="utf-8")
+        rejeitados = ArquivoDeRejeitados(str(tmp_path / "rejeitados.jsonl"))
+        try:
+            return importar_perguntas(conn, ler_perguntas(str(arquivo)), rejeitados)
+        finally:
+            rejeitados.fechar()
+    return importar
+
+
+def ids_by_text(conn):
+    return dict(conn.execute("SELECT text, id FROM questions"))
+
+
+def test_first_import_and_unchanged_reimport(conn, importar):
+    perguntas = [question(i) for i in range(20)]
+    resumo = importar(perguntas)
+    assert (resumo["adicionadas"], resumo["atualizadas"], resumo["removidas"]) == (20, 0, 0)
+    version = questions_version(conn)
+
+    resumo = importar(perguntas)
+    assert (resumo["adicionadas"], resumo["atualizadas"], resumo["removidas"], resumo["inalteradas"]) == (0, 0, 0, 20)
+    assert questions_version(conn) == version  # Nada gravado: o cache do jogo continua válido
+
+
+def test_diff_updates_in_place_inserts_and_removes(conn, importar):
+    importar([question(i) for i in range(20)])
+    before = ids_by_text(conn)
+
+    perguntas = [question(i) for i in range(1, 20)] + [question(99)]
+    perguntas[4] = question(5, tip="dica nova")  # Mesma identidade, outro conteúdo
+    version = questions_version(conn)
+    resumo = importar(perguntas)
+
+    assert (resumo["adicionadas"], resumo["atualizadas"], resumo["removidas"], resumo["inalteradas"]) == (1, 1, 1, 18)
+    after = ids_by_text(conn)
+    assert question(0)["text"] not in after
+    assert after[question(5)["text"]] == before[question(5)["text"]]  # Atualizada mantendo o id
+    assert conn.execute("SELECT tip FROM questions WHERE id = ?", (after[question(5)["text"]],)).fetchone()[0] == "dica nova"
+    assert after[question(99)["text"]] > max(before.values())
+    assert questions_version(conn) > version
+
+
+def test_repeated_and_invalid_questions_are_rejected(conn, importar):
+    perguntas = [question(1), question(1, tip="repetida"), {"text": "sem respostas"}, question(2, correct_answer="E")]
+    resumo = importar(perguntas)
+    assert (resumo["adicionadas"], resumo["duplicadas"], resumo["rejeitadas"]) == (1, 1, 2)
+
+
+def test_truncated_file_removes_nothing(conn, importar):
+    importar([question(i) for i in range(10)])
+    texto = json.dumps([question(i) for i in range(3)] + [question(50)], ensure_ascii=False)
+    resumo = importar(None, texto=texto[:-40])  # Cortado no meio da última pergunta
+
+    assert not resumo["arquivo_completo"]
+    assert (resumo["adicionadas"], resumo["removidas"], resumo["inalteradas"]) == (0, 0, 3)
+    assert conn.execute("SELECT count(*) FROM questions").fetchone()[0] == 10
+
+
+def test_edited_text_keeps_game_stats(conn, importar):
+    importar([question(i) for i in range(10)])
+    ids = ids_by_text(conn)
+    with conn:
+        conn.execute("CREATE TABLE question_stats (question_id INTEGER PRIMARY KEY, attempts INTEGER NOT NULL, correct INTEGER NOT NULL)")
+        conn.executemany("INSERT INTO question_stats VALUES (?, ?, ?)", [(row_id, 10 + row_id, 1) for row_id in ids.values()])
+
+    edited = question(3, text=question(3)["text"] + " Responda exatamente.")
+    perguntas = [question(i) for i in range(10) if i not in (3, 7)] + [edited]  # 3 editada, 7 removida
+    resumo = importar(perguntas)
+
+    assert (resumo["adicionadas"], resumo["removidas"], resumo["estatisticas_migradas"]) == (1, 2, 1)
+    new_id = ids_by_text(conn)[edited["text"]]
+    assert new_id != ids[question(3)["text"]]
+    stats = dict(conn.execute("SELECT question_id, attempts FROM question_stats"))
+    assert stats[new_id] == 10 + ids[question(3)["text"]]  # Contadores da versão antiga
+    assert ids[question(7)["text"]] not in stats and ids[question(3)["text"]] not in stats
+    assert len(stats) == 9
+
+
+def test_failed_batched_import_restores_triggers(conn, tmp_path, monkeypatch):
+    import criar_banco_sqlite
+
+    gravar = criar_banco_sqlite.gravar_transacao
+    chamadas = []
+
+    def gravar_e_falhar(*args, **kwargs):
+        chamadas.append(1)
+        if len(chamadas) == 2:
+            raise sqlite3.OperationalError("disco cheio")
+        gravar(*args, **kwargs)
+
+    monkeypatch.setattr(criar_banco_sqlite, "gravar_transacao", gravar_e_falhar)
+    arquivo = tmp_path / "perguntas.json"
+    arquivo.write_text(json.dumps([question(i) for i in range(30)], ensure_ascii=False), encoding="utf-8")
+    rejeitados = ArquivoDeRejeitados(str(tmp_path / "rejeitados.jsonl"))
+    with pytest.raises(sqlite3.OperationalError):
+        importar_perguntas(conn, ler_perguntas(str(arquivo)), rejeitados, linhas_por_transacao=5)
+    rejeitados.fechar()
+
+    # Os gatilhos suspensos foram recriados e o índice reflete o que foi gravado antes da falha
+    triggers = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'trigger'")}
+    assert {"questions_fts_insert", "questions_version_insert"} <= triggers
+    count = conn.execute("SELECT count(*) FROM questions").fetchone()[0]
+    assert count > 0
+    assert conn.execute("SELECT count(*) FROM questions_fts").fetchone()[0] == count
+
+
+def test_legacy_rows_get_their_hash_in_one_query(conn, importar):
+    # Banco de antes do importador incremental: linhas sem content_hash
+    from criar_banco_sqlite import COLUNAS_PERGUNTA, carregar_existentes, linha_da_pergunta
+
+    perguntas = [question(i) for i in range(15)]
+    with conn:
+        conn.executemany(
+            f"INSERT INTO questions ({', '.join(COLUNAS_PERGUNTA)}) VALUES ({', '.join('?' * len(COLUNAS_PERGUNTA))})",
+            [linha_da_pergunta(p) for p in perguntas],
+        )
+    consultas = []
+    conn.set_trace_callback(consultas.append)
+    existentes, _repetidas, preencher_hash = carregar_existentes(conn)
+    conn.set_trace_callback(None)
+    assert len(consultas) == 1 and len(existentes) == len(preencher_hash) == 15
+
+    resumo = importar(perguntas)
+    assert (resumo["adicionadas"], resumo["atualizadas"], resumo["inalteradas"]) == (0, 0, 15)
+    assert conn.execute("SELECT count(*) FROM questions WHERE content_hash IS NULL").fetchone()[0] == 0
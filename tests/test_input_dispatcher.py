@@ -0,0 +1,71 @@
+import pygame
+
+from jogo.input_dispatcher import HitTestIndex, InputDispatcher
+
+
+class FakeScene:
+    def __init__(self):
+        self.hit_index = HitTestIndex()
+        self.clicks = []
+
+    def on_click(self, name, event):
+        self.clicks.append((name, event.pos))
+
+
+def down(pos, button=1):
+    return pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=pos, button=button)
+
+
+def up(pos, button=1):
+    return pygame.event.Event(pygame.MOUSEBUTTONUP, pos=pos, button=button)
+
+
+def test_topmost_enabled_area_wins():
+    index = HitTestIndex()
+    popup_open = [True]
+    button = pygame.Rect(0, 0, 100, 50)
+    index.add("button", button)
+    index.add("popup", pygame.Rect(50, 0, 100, 100), lambda: popup_open[0])
+
+    assert index.hit((60, 10)) == "popup"
+    assert index.hit((10, 10)) == "button"
+    popup_open[0] = False
+    assert index.hit((60, 10)) == "button"
+    assert index.hit((60, 80)) is None
+    button.x = 200  # A área acompanha o Rect do botão
+    assert index.hit((210, 10)) == "button" and index.hit((10, 10)) is None
+
+
+def test_click_is_delivered_once_and_its_release_is_consumed():
+    scene = FakeScene()
+    scene.hit_index.add("jogar", pygame.Rect(0, 0, 100, 50))
+    dispatcher = InputDispatcher()
+
+    assert dispatcher.dispatch(scene, down((10, 10)))
+    assert dispatcher.dispatch(scene, up((10, 10)))
+    assert not dispatcher.dispatch(scene, up((10, 10)))  # Soltura sem clique pendente segue para a tela
+    assert scene.clicks == [("jogar", (10, 10))]
+
+    # Fora das áreas, botão direito e outros eventos seguem para handle_event
+    assert not dispatcher.dispatch(scene, down((500, 500)))
+    assert not dispatcher.dispatch(scene, down((10, 10), button=3))
+    assert not dispatcher.dispatch(scene, pygame.event.Event(pygame.KEYDOWN, key=pygame.K_a))
+    assert scene.clicks == [("jogar", (10, 10))]
+
+
+def test_reset_forgets_the_pressed_widget():
+    first, second = FakeScene(), FakeScene()
+    first.hit_index.add("abrir", pygame.Rect(0, 0, 100, 50))
+    dispatcher = InputDispatcher()
+    dispatcher.dispatch(first, down((10, 10)))
+    dispatcher.reset()  # O clique trocou de tela
+    assert not dispatcher.dispatch(second, up((10, 10)))
+
+
+def test_options_menu_areas_do_not_overlap(game_env):
+    from jogo.frame_scheduler import FrameScheduler
+    from jogo.game import Game
+
+    game = Game(scheduler=FrameScheduler())
+    rects = [rect for _name, rect, _enabled in game.scene("options_menu").hit_index._targets]
+    assert not any(a.colliderect(b) for i, a in enumerate(rects) for b in rects[i + 1:])
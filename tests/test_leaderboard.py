@@ -0,0 +1,98 @@
+import random
+
+import pytest
+
+from jogo.leaderboard import BUCKET_SIZE, Leaderboard, LeaderboardIndex
+
+
+def expected_order(scores):
+    # Referência: ordenação completa (maior pontuação primeiro, empate pelo nome)
+    return sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+
+
+def check(board, scores):
+    order = expected_order(scores)
+    assert list(board.items()) == order
+    assert len(board) == len(scores)
+    assert all(len(bucket) <= 2 * BUCKET_SIZE for bucket in board._buckets)
+    assert board._maxes == [bucket[-1] for bucket in board._buckets]
+    for position, (name, _score) in enumerate(order, start=1):
+        assert board.rank(name) == position
+
+
+def test_bucket_splits_only_above_twice_bucket_size():
+    board = Leaderboard()
+    scores = {}
+    for i in range(2 * BUCKET_SIZE):
+        board.set(f"p{i:04}", i)
+        scores[f"p{i:04}"] = i
+    assert [len(bucket) for bucket in board._buckets] == [2 * BUCKET_SIZE]
+
+    board.set("extra", -1)
+    scores["extra"] = -1
+    assert [len(bucket) for bucket in board._buckets] == [BUCKET_SIZE, BUCKET_SIZE + 1]
+    check(board, scores)
+
+
+def test_rank_at_bucket_boundary():
+    board = Leaderboard()
+    scores = {f"p{i:04}": 10 * i for i in range(2 * BUCKET_SIZE + 1)}
+    for name, score in scores.items():
+        board.set(name, score)
+    assert len(board._buckets[0]) == BUCKET_SIZE
+    # Última chave do primeiro bloco (igual ao seu máximo) e primeira do segundo
+    last_of_first, first_of_second = expected_order(scores)[BUCKET_SIZE - 1:BUCKET_SIZE + 1]
+    assert board.rank(last_of_first[0]) == BUCKET_SIZE
+    assert board.rank(first_of_second[0]) == BUCKET_SIZE + 1
+    assert board.slice(BUCKET_SIZE - 1, BUCKET_SIZE + 1) == [last_of_first, first_of_second]
+
+
+def test_emptied_bucket_is_dropped():
+    board = Leaderboard()
+    scores = {f"p{i:04}": i for i in range(2 * BUCKET_SIZE + 1)}
+    for name, score in scores.items():
+        board.set(name, score)
+    # Move todos os jogadores do primeiro bloco para o fim do placar: o bloco esvazia
+    for _neg_score, name in list(board._buckets[0]):
+        board.set(name, -1000 - scores[name])
+        scores[name] = -1000 - scores[name]
+    check(board, scores)
+
+
+def test_random_updates_match_full_sort():
+    rng = random.Random(7)
+    board = Leaderboard()
+    scores = {}
+    for _ in range(5000):
+        name = f"p{rng.randrange(1500)}"
+        if rng.random() < 0.7:
+            points = rng.randrange(-50, 200)
+            board.add(name, points)
+            scores[name] = scores.get(name, 0) + points
+        else:
+            score = rng.randrange(1000)
+            board.set(name, score)
+            scores[name] = score
+    check(board, scores)
+    assert board.top(10) == expected_order(scores)[:10]
+    assert board.slice(700, 760) == expected_order(scores)[700:760]
+
+
+def test_rank_of_unknown_player():
+    board = Leaderboard()
+    assert board.rank("ninguém") is None
+    board.add("ana", 5)
+    assert board.rank("ana") == 1
+    assert board.score("ninguém") == 0
+
+
+@pytest.mark.parametrize("level, subject", [(None, None), ("medio", None), ("medio", "naturais")])
+def test_index_boards(level, subject):
+    rows = [("ana", 10, "medio", "naturais"), ("bia", 30, "medio", "exatas"), ("ana", 5, "facil", "naturais"),
+            ("caio", 20, "medio", "naturais")]
+    index = LeaderboardIndex.from_rows(rows)
+    scores = {}
+    for name, points, row_level, row_subject in rows:
+        if (level is None or row_level == level) and (subject is None or row_subject == subject):
+            scores[name] = scores.get(name, 0) + points
+    assert index.top(10, level, subject) == expected_order(scores)
@@ -0,0 +1,99 @@
+import json
+
+import pytest
+
+import leitura_perguntas
+from criar_banco_sqlite import em_lotes, normalizar_em_paralelo
+from leitura_perguntas import ErroDeLeitura, detectar_formato, ler_array_json, ler_perguntas
+
+ITEMS = [{"text": f"Pergunta {i}?", "n": i, "lista": [1.5, "x" * (i % 7)]} for i in range(50)]
+
+
+def write(tmp_path, text, name="perguntas.json"):
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8", newline="")
+    return str(path)
+
+
+def read_all(path):
+    return list(ler_perguntas(path))
+
+
+def test_array_positions(tmp_path):
+    text = '﻿[\n  {"a": 1},\n\n  {"b": "á\\n"} ,{"c": 3}\n]\n'
+    path = write(tmp_path, text)
+    assert detectar_formato(path) == "array"
+    items = read_all(path)
+    assert [item[3] for item in items] == [{"a": 1}, {"b": "á\n"}, {"c": 3}]
+    # Linha e offset (sem o BOM) apontam o início de cada pergunta
+    body = text.lstrip("﻿")
+    for line, offset, raw, obj in items:
+        assert raw is None
+        assert json.loads(body[offset:].split("}", 1)[0] + "}") == obj
+        assert body.count("\n", 0, offset) + 1 == line
+
+
+@pytest.mark.parametrize("block", [1, 3, 17, 1 << 20])
+def test_array_across_block_boundaries(tmp_path, monkeypatch, block):
+    monkeypatch.setattr(leitura_perguntas, "TAMANHO_BLOCO", block)
+    path = write(tmp_path, json.dumps(ITEMS, indent=1, ensure_ascii=False))
+    assert [item[3] for item in read_all(path)] == ITEMS
+
+
+def test_empty_array(tmp_path):
+    assert read_all(write(tmp_path, "  [ \n ] ")) == []
+
+
+@pytest.mark.parametrize("text, reason", [
+    ('{"a": 1}', "não começa com '['"),
+    ("", "não começa com '['"),
+    ('[{"a": 1} {"b": 2}]', "esperado ',' ou ']'"),
+    ('[{"a": 1}, {"b": }]', "JSON inválido"),
+])
+def test_array_syntax_errors(tmp_path, text, reason):
+    # Sem "[" no início, ler_perguntas trataria o arquivo como JSON Lines
+    with pytest.raises(ErroDeLeitura) as error:
+        list(ler_array_json(write(tmp_path, text)))
+    assert reason in error.value.motivo
+
+
+@pytest.mark.parametrize("block", [5, 1 << 20])
+def test_truncated_array_yields_complete_items_then_fails(tmp_path, monkeypatch, block):
+    monkeypatch.setattr(leitura_perguntas, "TAMANHO_BLOCO", block)
+    text = json.dumps(ITEMS[:5], ensure_ascii=False)
+    cut = text.index('{"text": "Pergunta 4?"') + 10
+    read = []
+    with pytest.raises(ErroDeLeitura) as error:
+        for item in ler_perguntas(write(tmp_path, text[:cut])):
+            read.append(item[3])
+    assert read == ITEMS[:4]
+    assert error.value.offset == text.index('{"text": "Pergunta 4?"')
+    assert error.value.trecho == text[error.value.offset:cut]
+
+
+@pytest.mark.parametrize("text", ['[{"a": 1},', '[{"a": 1}', "["])
+def test_array_without_closing_bracket(tmp_path, text):
+    with pytest.raises(ErroDeLeitura):
+        read_all(write(tmp_path, text))
+
+
+def test_json_lines(tmp_path):
+    lines = ['{"a": 1}\n', "\n", "não é json\n", '{"c": 3}']
+    path = write(tmp_path, "".join(lines), name="perguntas.jsonl")
+    assert detectar_formato(path) == "jsonl"
+    items = read_all(path)
+    assert [(line, raw) for line, _offset, raw, _obj in items] == [(1, lines[0]), (3, lines[2]), (4, lines[3])]
+    assert [offset for _line, offset, _raw, _obj in items] == [0, 10, 21]
+
+
+def test_validation_pool_keeps_order(tmp_path):
+    lines = [json.dumps({"text": f"Pergunta {i}?", "answers": {k: k for k in "ABCD"}, "correct_answer": "a",
+                         "tip": None, "subject": "Exatas", "level": "Medio"}) for i in range(30)]
+    lines[7] = "{quebrada"
+    path = write(tmp_path, "\n".join(lines), name="perguntas.jsonl")
+    serial = [item for lote in normalizar_em_paralelo(em_lotes(ler_perguntas(path), 4), 1) for item in lote]
+    parallel = [item for lote in normalizar_em_paralelo(em_lotes(ler_perguntas(path), 4), 2) for item in lote]
+    assert parallel == serial
+    assert [item[0] for item in serial] == list(range(1, 31))
+    assert serial[7][2].startswith("JSON inválido")
+    assert serial[0][4][0][5:] == ("A", None, "exatas", "medio")
@@ -0,0 +1,52 @@
+import json
+
+import pygame
+import pytest
+
+from jogo.profiler import FrameProfiler
+
+
+@pytest.fixture
+def profiler():
+    pygame.font.init()
+    profiler = FrameProfiler(enabled=True)
+    yield profiler
+    profiler.toggle()  # Garante que o hook de sys.setprofile foi removido
+
+
+def counted(profiler, work):
+    profiler.begin_frame("teste")
+    try:
+        work()
+    finally:
+        profiler.end_frame()
+    return profiler.frames[-1]["counts"]
+
+
+def test_counts_pygame_calls(profiler):
+    font = pygame.font.Font(None, 18)
+    screen = pygame.Surface((100, 100))
+
+    def work():
+        text = font.render("placar", True, (255, 255, 255))
+        screen.fill((0, 0, 0))
+        screen.blit(text, (0, 0))
+        screen.blits([(text, (0, 10)), (text, (0, 20))])
+        pygame.transform.scale(screen.copy(), (50, 50))
+
+    counts = counted(profiler, work)
+    assert counts == {"font_render": 1, "fill": 1, "blit": 2, "surface_alloc": 3}
+
+
+def test_ignores_methods_with_the_same_name(profiler):
+    # copy, load e render de outros tipos não são chamadas do pygame
+    data = {"a": 1}
+    text = json.dumps(data)
+
+    def work():
+        data.copy()
+        json.loads(text)
+        [3, 1, 2].copy()
+        "x".join(["fill", "blit"])
+
+    assert counted(profiler, work) == {}
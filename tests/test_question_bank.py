@@ -0,0 +1,62 @@
+import random
+import sqlite3
+
+from jogo.question_bank import QuestionBank, get_question_bank
+from jogo.question_sampler import QuestionSampler, question_from_row
+from tests.conftest import LEVELS, PER_GROUP, SUBJECTS
+
+
+def write(db_path, sql, params=()):
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.execute(sql, params)
+    conn.close()
+
+
+def test_columns_return_the_stored_rows(questions_db):
+    write(questions_db, "INSERT INTO questions (text, answer_a, correct_answer, tip, subject, level) "
+                        "VALUES ('Ação e reação — ñ?', NULL, 'B', NULL, 'naturais', 'medio')")
+    bank = QuestionBank(questions_db)
+    assert len(bank) == PER_GROUP * len(LEVELS) * len(SUBJECTS) + 1
+    assert set(bank.index) == {(level, subject) for level in LEVELS for subject in SUBJECTS}
+
+    last = bank.question(len(bank) - 1)
+    assert last["text"] == "Ação e reação — ñ?" and last["answers"]["A"] is None and last["tip"] is None
+    conn = sqlite3.connect(questions_db)
+    conn.row_factory = sqlite3.Row
+    try:
+        row = conn.execute("SELECT * FROM questions WHERE id = ?", (bank.ids[3],)).fetchone()
+        assert bank.question(3) == question_from_row(row)
+    finally:
+        conn.close()
+
+
+def test_sample_and_lookup_match_the_sql_sampler(questions_db):
+    bank = QuestionBank(questions_db)
+    sampler = QuestionSampler(questions_db)
+    try:
+        for subjects in (["exatas"], ["linguagens", "exatas", "linguagens"], ["inexistente"]):
+            assert bank.count("facil", subjects) == sampler.count("facil", subjects)
+            assert bank.sample("facil", subjects, 12, random.Random(3)) == sampler.sample("facil", subjects, 12, random.Random(3))
+        ids = bank.group_ids("facil", "exatas")
+        assert list(ids) == list(sampler.group_ids("facil", "exatas"))
+        wanted = [ids[4], ids[1], 10 ** 9]
+        assert [q["id"] for q in bank.questions_by_id("facil", "exatas", wanted)] == wanted[:2]
+    finally:
+        sampler.close()
+
+
+def test_reloaded_only_when_questions_change(questions_db):
+    bank = get_question_bank(questions_db)
+    assert get_question_bank(questions_db) is bank
+    write(questions_db, "CREATE TABLE ranking (username TEXT, score INTEGER)")
+    write(questions_db, "INSERT INTO ranking VALUES ('ana', 10)")
+    assert not bank.is_stale()  # Gravações do ranking não contam
+
+    rows = len(bank)
+    write(questions_db, "DELETE FROM questions WHERE id = ?", (bank.ids[0],))
+    assert bank.is_stale()
+    assert get_question_bank(questions_db) is bank and len(bank) == rows - 1
+    assert not bank.is_stale()
+    report = bank.memory_report()
+    assert report["rows"] == rows - 1 and report["total_bytes"] > 0
@@ -0,0 +1,94 @@
+import os
+import random
+import sqlite3
+
+import pytest
+
+from jogo.question_bank import QuestionBank
+from jogo.question_pack import QuestionPack, compile_pack, open_question_pack
+from jogo.question_sampler import QUESTION_COLUMNS, QuestionSampler, question_from_row
+
+
+@pytest.fixture
+def pack_path(questions_db, tmp_path):
+    conn = sqlite3.connect(questions_db)
+    with conn:
+        # Textos não ASCII, repetidos e NULL também precisam voltar iguais
+        conn.execute(
+            "INSERT INTO questions (text, answer_a, answer_b, answer_c, answer_d, correct_answer, tip, subject, level) "
+            "VALUES ('Qual é a fórmula da água? “H₂O” 💧', 'H₂O', 'CO₂', NULL, '', 'A', NULL, 'naturais', 'medio')"
+        )
+    conn.close()
+    path = str(tmp_path / "quiz.qpack")
+    compile_pack(questions_db, path)
+    return path
+
+
+def db_questions(db_path):
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    try:
+        return {row["id"]: question_from_row(row) for row in conn.execute(f"SELECT {QUESTION_COLUMNS} FROM questions")}
+    finally:
+        conn.close()
+
+
+def test_round_trip(questions_db, pack_path):
+    expected = db_questions(questions_db)
+    pack = QuestionPack(pack_path)
+    try:
+        assert len(pack) == len(expected)
+        decoded = {}
+        for (level, subject), positions in pack.index.items():
+            group = [pack.question(position) for position in positions]
+            assert all(q["level"] == level and q["subject"] == subject for q in group)
+            assert [q["id"] for q in group] == list(pack.group_ids(level, subject))
+            decoded.update((q["id"], q) for q in group)
+        assert decoded == expected
+    finally:
+        pack.close()
+
+
+def test_questions_by_id(questions_db, pack_path):
+    pack = QuestionPack(pack_path)
+    try:
+        ids = list(pack.group_ids("medio", "naturais"))
+        wanted = [ids[5], ids[0], ids[-1], -1]  # -1 não existe e é ignorado
+        assert [q["id"] for q in pack.questions_by_id("medio", "naturais", wanted)] == wanted[:3]
+        assert pack.questions_by_id("medio", "inexistente", ids) == []
+    finally:
+        pack.close()
+
+
+def test_same_sample_as_other_sources(questions_db, pack_path):
+    pack = QuestionPack(pack_path)
+    sampler = QuestionSampler(questions_db)
+    bank = QuestionBank(questions_db)
+    bank.load()
+    try:
+        subjects = ["exatas", "naturais"]
+        from_pack = pack.sample("medio", subjects, 15, random.Random(9))
+        assert from_pack == sampler.sample("medio", subjects, 15, random.Random(9))
+        assert from_pack == bank.sample("medio", subjects, 15, random.Random(9))
+    finally:
+        pack.close()
+        sampler.close()
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "not_a.qpack"
+    path.write_bytes(b"\0" * 256)
+    with pytest.raises(ValueError):
+        QuestionPack(str(path))
+
+
+def test_replaced_pack_is_reopened(questions_db, pack_path):
+    first = open_question_pack(pack_path)
+    assert open_question_pack(pack_path) is first
+    compile_pack(questions_db, pack_path)
+    stat = os.stat(pack_path)
+    os.utime(pack_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))  # Garante outra assinatura
+    second = open_question_pack(pack_path)
+    assert second is not first
+    assert first._mmap.closed  # O mapa antigo foi fechado
+    assert len(second) == sum(len(positions) for positions in second.index.values())
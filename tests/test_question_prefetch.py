@@ -0,0 +1,58 @@
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from jogo.frame_scheduler import FrameScheduler
+from jogo.game import Game
+
+
+@pytest.fixture
+def game_screen(game_env):
+    game = Game(scheduler=FrameScheduler(), seed=7)
+    screen = game.scene("game_screen")
+    game.scenes.push(screen, level="fundamental", subjects=["matematica", "portugues"])
+    assert len(screen.all_loaded_questions) > 2
+    return screen
+
+
+def placed(layout):
+    # Layout comparável: tamanho e posição de cada linha renderizada
+    def sizes(lines):
+        return [(surface.get_size(), pos) for surface, pos in lines]
+    return sizes(layout["question"]), {key: sizes(lines) for key, lines in layout["answers"].items()}, sizes(layout["hint"])
+
+
+def test_next_question_layout_is_built_in_idle_steps(game_screen):
+    game_screen.draw()  # Layout da pergunta atual
+    steps = 0
+    while game_screen.idle_work():
+        steps += 1
+    assert steps == 5  # Pergunta, quatro respostas (a dica termina o gerador)
+    assert not game_screen.idle_work()  # Nada mais a preparar
+
+    # Ao avançar, o layout preparado é usado sem novas renderizações de texto
+    prepared = game_screen._next_layout[1]
+    text = game_screen.assets.text_renderer
+    misses = text.misses
+    game_screen.question_index += 1
+    game_screen._setup_for_new_question()
+    assert game_screen._layout_for(game_screen.current_question_data) is prepared
+    assert text.misses == misses
+
+
+def test_prefetched_layout_matches_a_fresh_one(game_screen):
+    next_question = game_screen.all_loaded_questions[1]
+    game_screen.idle_work()  # Só a primeira parte; o resto é terminado sob demanda
+    game_screen.question_index += 1
+    game_screen._setup_for_new_question()
+    prefetched = game_screen._layout_for(next_question)
+
+    game_screen.assets.text_renderer.clear()
+    game_screen._layout = None
+    assert placed(game_screen._layout_for(next_question)) == placed(prefetched)
+
+
+def test_no_prefetch_after_the_last_question(game_screen):
+    game_screen.question_index = len(game_screen.all_loaded_questions) - 1
+    game_screen._setup_for_new_question()
+    assert not game_screen.idle_work()
@@ -0,0 +1,66 @@
+import random
+import sqlite3
+
+from jogo.question_sampler import QuestionSampler, questions_version, sample_from_groups
+from tests.conftest import PER_GROUP
+
+
+def write(db_path, sql, params=()):
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.execute(sql, params)
+    conn.close()
+
+
+def test_id_cache_survives_unrelated_writes(questions_db):
+    sampler = QuestionSampler(questions_db)
+    try:
+        ids = sampler.group_ids("medio", "exatas")
+        assert len(ids) == PER_GROUP and list(ids) == sorted(ids)
+        # Gravações fora da tabela questions (ranking, estatísticas) não descartam o cache
+        write(questions_db, "CREATE TABLE ranking (username TEXT, score INTEGER)")
+        write(questions_db, "INSERT INTO ranking VALUES ('ana', 10)")
+        assert sampler.group_ids("medio", "exatas") is ids
+    finally:
+        sampler.close()
+
+
+def test_id_cache_is_dropped_when_questions_change(questions_db):
+    sampler = QuestionSampler(questions_db)
+    try:
+        ids = sampler.group_ids("medio", "exatas")
+        version = questions_version(sampler._connect())
+
+        write(questions_db, "INSERT INTO questions (text, correct_answer, subject, level) VALUES ('Nova?', 'A', 'exatas', 'medio')")
+        inserted = sampler.group_ids("medio", "exatas")
+        assert len(inserted) == PER_GROUP + 1
+
+        # Um UPDATE que troca a pergunta de grupo também é percebido (count(*) não mudaria)
+        write(questions_db, "UPDATE questions SET subject = 'naturais' WHERE id = ?", (ids[0],))
+        updated = sampler.group_ids("medio", "exatas")
+        assert ids[0] not in updated and len(updated) == PER_GROUP
+        assert ids[0] in sampler.group_ids("medio", "naturais")
+        assert questions_version(sampler._connect()) == version + 2
+    finally:
+        sampler.close()
+
+
+def test_sample_is_distinct_and_reproducible(questions_db):
+    sampler = QuestionSampler(questions_db)
+    try:
+        first = sampler.sample("facil", ["exatas", "naturais", "exatas"], 12, random.Random(3))
+        again = sampler.sample("facil", ["exatas", "naturais"], 12, random.Random(3))
+        assert [q["id"] for q in first] == [q["id"] for q in again]
+        assert len({q["id"] for q in first}) == 12
+        assert all(q["level"] == "facil" and q["subject"] in ("exatas", "naturais") for q in first)
+        # Mais perguntas pedidas que existentes: devolve todas
+        assert len(sampler.sample("facil", ["exatas"], 10 * PER_GROUP, random.Random(1))) == PER_GROUP
+        assert sampler.sample("facil", ["inexistente"], 5, random.Random(1)) == []
+    finally:
+        sampler.close()
+
+
+def test_sample_from_groups_spans_all_groups():
+    groups = [range(0, 3), (), range(10, 12)]
+    assert sorted(sample_from_groups(groups, 10, random.Random(0))) == [0, 1, 2, 10, 11]
+    assert sample_from_groups(groups, 0, random.Random(0)) == []
@@ -0,0 +1,118 @@
+import hashlib
+import sqlite3
+
+import pytest
+
+from jogo.question_search import QuestionSearch, SearchIndexError, ensure_search_index, excerpt, match_expression
+from tests.conftest import PER_GROUP
+
+OPERATOR_QUERIES = [
+    'AND', 'OR NOT', 'NEAR(a b)', '"', '""', "'", '(', ')', '*', '^pergunta', 'texto:pergunta', '-pergunta',
+    'pergunta AND', 'a OR b', '{text}', '+', 'pergunta" OR "1', "água' --", "%_", ":", "NEAR/3",
+]
+
+
+@pytest.fixture
+def indexed_db(questions_db):
+    conn = sqlite3.connect(questions_db)
+    with conn:
+        conn.execute(
+            "INSERT INTO questions (text, answer_a, answer_b, answer_c, answer_d, correct_answer, tip, subject, level) "
+            "VALUES ('Como ocorre a fotossíntese nas plantas?', 'Luz', 'Som', 'Calor', 'Frio', 'A', 'Cloroplastos', 'naturais', 'medio')"
+        )
+    assert ensure_search_index(conn)
+    conn.close()
+    return questions_db
+
+
+def digest(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+@pytest.mark.parametrize("query", OPERATOR_QUERIES)
+def test_operators_are_quoted(indexed_db, query):
+    search = QuestionSearch(indexed_db)
+    try:
+        results, _has_next = search.search(query)  # Não pode levantar erro de sintaxe do FTS5
+        assert isinstance(results, list)
+    finally:
+        search.close()
+
+
+def test_match_expression():
+    assert match_expression("  ?! ") is None
+    assert match_expression('a"b') == '{text answer_a answer_b answer_c answer_d tip} : ("a" "b"*)'
+    expression = match_expression("NOT água", level='me"dio', subject="naturais")
+    assert expression.endswith(' : ("NOT" "água"*) AND level : "me""dio" AND subject : "naturais"')
+
+
+def test_search_ignores_accents_and_matches_prefix(indexed_db):
+    search = QuestionSearch(indexed_db)
+    try:
+        for query in ("fotossintese", "FOTOSSÍNTESE", "fotoss", "plantas fotos"):
+            results, _ = search.search(query)
+            assert [r["text"] for r in results] == ["Como ocorre a fotossíntese nas plantas?"]
+        assert search.search("cloroplastos")[0][0]["excerpt"] == "[Cloroplastos]"
+        assert search.search("fotossintese", level="facil")[0] == []
+    finally:
+        search.close()
+
+
+def test_pagination_and_filters(indexed_db):
+    search = QuestionSearch(indexed_db)
+    try:
+        seen = []
+        page = 1
+        while True:
+            results, has_next = search.search("pergunta", level="medio", subject="exatas", page=page, page_size=7)
+            assert all(r["level"] == "medio" and r["subject"] == "exatas" for r in results)
+            seen += [r["id"] for r in results]
+            if not has_next:
+                break
+            page += 1
+        assert len(seen) == len(set(seen)) == PER_GROUP
+    finally:
+        search.close()
+
+
+def test_reader_never_writes(indexed_db):
+    before = digest(indexed_db)
+    search = QuestionSearch(indexed_db)
+    try:
+        search.search("pergunta")
+        with pytest.raises(sqlite3.OperationalError):
+            search._connect().execute("DELETE FROM questions")  # Conexão somente leitura
+    finally:
+        search.close()
+    assert digest(indexed_db) == before
+
+
+def test_missing_index_is_an_error(questions_db, tmp_path):
+    before = digest(questions_db)
+    with pytest.raises(SearchIndexError, match="questions_fts"):
+        QuestionSearch(questions_db).search("pergunta")
+    assert digest(questions_db) == before  # O índice não é criado pela busca
+    with pytest.raises(SearchIndexError, match="não encontrado"):
+        QuestionSearch(str(tmp_path / "inexistente.db")).search("pergunta")
+
+
+def test_triggers_keep_index_in_sync(indexed_db):
+    conn = sqlite3.connect(indexed_db)
+    with conn:
+        conn.execute("UPDATE questions SET text = 'Onde fica a mitocôndria?' WHERE text LIKE '%fotossíntese%'")
+        conn.execute("DELETE FROM questions WHERE level = 'facil'")
+    conn.close()
+    search = QuestionSearch(indexed_db)
+    try:
+        assert search.search("fotossintese")[0] == []
+        assert [r["text"] for r in search.search("mitocondria")[0]] == ["Onde fica a mitocôndria?"]
+        assert all(r["level"] == "medio" for r in search.search("pergunta", page_size=100)[0])
+    finally:
+        search.close()
+
+
+def test_excerpt_marks_whole_words_and_last_prefix():
+    text = "um dois três quatro cinco seis sete oito nove dez onze doze treze catorze quinze dezesseis"
+    assert excerpt([None, text], ["tres", "quinz"]) == "um dois [três] quatro cinco seis sete oito nove dez onze doze…"
+    assert excerpt(["curto"], ["nada"]) == "curto"
@@ -0,0 +1,138 @@
+import random
+import sqlite3
+
+import pytest
+
+from jogo.question_bank import QuestionBank
+from jogo.question_sampler import QuestionSampler
+from jogo.question_stats import BUCKETS, CREATE_STATS_TABLE, DifficultyBuckets, QuestionStats, bucket_of, difficulty
+from tests.conftest import PER_GROUP
+
+
+@pytest.fixture
+def sampler(questions_db):
+    sampler = QuestionSampler(questions_db)
+    yield sampler
+    sampler.close()
+
+
+def open_stats(db_path, rows=()):
+    # rows: (id, tentativas, acertos) gravados antes da abertura
+    conn = sqlite3.connect(db_path)
+    with conn:
+        conn.execute(CREATE_STATS_TABLE)
+        conn.executemany("INSERT INTO question_stats VALUES (?, ?, ?)", rows)
+    conn.close()
+    return QuestionStats(db_path, flush_interval=60)
+
+
+def test_difficulty_and_buckets():
+    assert difficulty(0, 0) == 0.5 and bucket_of(0, 0) == BUCKETS // 2
+    assert bucket_of(8, 8) == 1 and bucket_of(8, 0) == 9
+    assert bucket_of(10 ** 6, 0) == BUCKETS - 1  # Nunca passa da última faixa
+
+
+def test_difficulty_buckets_swap_remove():
+    buckets = DifficultyBuckets()
+    for question_id in range(6):
+        buckets.add(question_id, question_id % 2)
+    buckets.remove(0, 0)
+    buckets.remove(5, 1)
+    assert sorted(buckets.buckets[0]) == [2, 4] and sorted(buckets.buckets[1]) == [1, 3]
+    assert all(buckets.buckets[i % 2][p] == i for i, p in buckets.positions.items())
+    assert len(buckets) == 4 and 0 not in buckets
+
+
+def test_empty_group(questions_db, sampler):
+    stats = open_stats(questions_db)
+    try:
+        assert stats.sample(sampler, "medio", ["inexistente"], 5, random.Random(1)) == []
+        assert stats.sample(sampler, "inexistente", ["exatas"], 5, random.Random(1)) == []
+        assert stats.sample(sampler, "medio", [], 5, random.Random(1)) == []
+    finally:
+        stats.close()
+
+
+def test_k_larger_than_group(questions_db, sampler):
+    ids = sampler.group_ids("medio", "exatas")
+    rows = [(question_id, 8, 8 if i % 3 == 0 else 0) for i, question_id in enumerate(ids[:PER_GROUP // 2])]
+    stats = open_stats(questions_db, rows)
+    try:
+        sizes = stats._buckets_for(sampler, "medio", "exatas").sizes()
+        chosen = stats.sample(sampler, "medio", ["exatas"], 10 * PER_GROUP, random.Random(2))
+        assert sorted(q["id"] for q in chosen) == sorted(ids)
+        levels = [stats.difficulty(q["id"]) for q in chosen]
+        assert levels == sorted(levels)  # Da mais fácil para a mais difícil
+        assert stats._buckets_for(sampler, "medio", "exatas").sizes() == sizes  # Sorteadas voltam às faixas
+    finally:
+        stats.close()
+
+
+def test_ladder_follows_difficulty_quantiles(questions_db, sampler):
+    ids = sampler.group_ids("facil", "naturais") + sampler.group_ids("facil", "linguagens")
+    # 3/4 das perguntas fáceis (faixa 1), 1/4 difíceis (faixa 9)
+    rows = [(question_id, 8, 8 if i % 4 else 0) for i, question_id in enumerate(ids)]
+    stats = open_stats(questions_db, rows)
+    try:
+        for seed in range(20):
+            chosen = stats.sample(sampler, "facil", ["naturais", "linguagens"], 8, random.Random(seed))
+            assert [bucket_of(*stats.counts(q["id"])) for q in chosen] == [1] * 6 + [9] * 2
+            assert len({q["id"] for q in chosen}) == 8
+    finally:
+        stats.close()
+
+
+def test_same_ladder_from_every_source(questions_db, sampler):
+    ids = sampler.group_ids("medio", "naturais")
+    rows = [(question_id, i % 9, min(i % 5, i % 9)) for i, question_id in enumerate(ids)]
+    bank = QuestionBank(questions_db)
+    bank.load()
+    ladders = []
+    for source in (sampler, bank):
+        stats = open_stats(questions_db, rows if not ladders else ())  # Os contadores já estão no banco
+        try:
+            ladders.append(stats.sample(source, "medio", ["naturais", "exatas"], 12, random.Random(7)))
+        finally:
+            stats.close()
+    assert ladders[0] == ladders[1]
+
+
+def test_record_moves_bucket_and_persists(questions_db, sampler):
+    stats = open_stats(questions_db)
+    question = stats.sample(sampler, "medio", ["naturais"], 1, random.Random(3))[0]
+    buckets = stats._buckets_for(sampler, "medio", "naturais")
+    for _ in range(8):
+        stats.record(question, correct=True)
+    stats.record({"text": "sem id"}, correct=True)  # Ignorada
+    assert question["id"] in buckets.buckets[1]
+    assert sum(buckets.sizes()) == PER_GROUP
+    stats.close()
+
+    reopened = open_stats(questions_db)
+    try:
+        assert reopened.counts(question["id"]) == (8, 8)
+    finally:
+        reopened.close()
+
+
+def test_buckets_follow_question_changes(questions_db, sampler):
+    stats = open_stats(questions_db, [(question_id, 8, 8) for question_id in sampler.group_ids("medio", "exatas")[:5]])
+    try:
+        buckets = stats._buckets_for(sampler, "medio", "exatas")
+        removed = sampler.group_ids("medio", "exatas")[:3]
+        conn = sqlite3.connect(questions_db)
+        with conn:
+            conn.executemany("DELETE FROM questions WHERE id = ?", [(question_id,) for question_id in removed])
+            conn.execute("INSERT INTO questions (text, correct_answer, subject, level) VALUES ('Nova?', 'A', 'exatas', 'medio')")
+        conn.close()
+
+        updated = stats._buckets_for(sampler, "medio", "exatas")
+        assert updated is buckets  # Atualizadas no lugar, sem remontar o grupo
+        fresh = DifficultyBuckets()
+        for question_id in sampler.group_ids("medio", "exatas"):
+            fresh.add(question_id, bucket_of(*stats.counts(question_id)))
+        assert [sorted(items) for items in updated.buckets] == [sorted(items) for items in fresh.buckets]
+        assert all(updated.positions[i] == p for items in updated.buckets for p, i in enumerate(items))
+        assert len(updated) == PER_GROUP - 2
+    finally:
+        stats.close()
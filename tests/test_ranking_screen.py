@@ -0,0 +1,74 @@
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from jogo.frame_scheduler import FrameScheduler
+from jogo.game import Game
+from jogo.ranking_screen import ROWS_PER_PAGE
+
+
+@pytest.fixture
+def game(game_env):
+    game = Game(scheduler=FrameScheduler())
+    for i in range(50):
+        game.ranking.add_score(f"jogador{i:02d}", 1000 * (i + 1))  # Sem nível, como os pontos antigos
+    game.ranking.add_score("ana", 500, level="medio", subject="humanas")
+    return game
+
+
+def open_ranking(game, **kwargs):
+    screen = game.scene("ranking_screen")
+    game.scenes.push(screen, **kwargs)
+    return screen
+
+
+def key(screen, code):
+    screen.handle_event(pygame.event.Event(pygame.KEYDOWN, key=code, mod=0, unicode=""))
+
+
+def test_scrolling_is_clamped_to_the_list(game):
+    screen = open_ranking(game)
+    assert screen.scroll == 0 and len(screen.board) == 51
+    key(screen, pygame.K_END)
+    assert screen.scroll == 51 - ROWS_PER_PAGE
+    screen.scroll_to(1000)
+    assert screen.scroll == 51 - ROWS_PER_PAGE
+    screen.handle_event(pygame.event.Event(pygame.MOUSEWHEEL, x=0, y=1, flipped=False))
+    assert screen.scroll == 51 - ROWS_PER_PAGE - 3
+    key(screen, pygame.K_HOME)
+    key(screen, pygame.K_UP)
+    assert screen.scroll == 0
+
+
+def test_rows_are_rendered_only_when_they_change(game):
+    screen = open_ranking(game)
+    text = game.assets.text_renderer
+    misses = text.misses
+    screen.draw()
+    rows = screen._rows_surface
+    assert text.misses - misses <= ROWS_PER_PAGE + 2  # Só as linhas visíveis (e título/subtítulo)
+
+    screen.draw()
+    assert screen._rows_surface is rows
+    key(screen, pygame.K_DOWN)
+    screen.draw()
+    assert screen._rows_surface is not rows
+    rows = screen._rows_surface
+    game.ranking.add_score("jogador00", 1)
+    screen.draw()
+    assert screen._rows_surface is not rows
+
+
+def test_opens_on_the_overall_board_and_cycles_breakdowns(game):
+    screen = open_ranking(game, level="medio", subjects=["humanas"])
+    assert (screen.level, screen.subject) == (None, None) and len(screen.board) == 51
+    screen.on_click("board", None)
+    assert (screen.level, screen.subject) == ("medio", None)
+    screen.on_click("board", None)
+    assert (screen.level, screen.subject) == ("medio", "humanas") and len(screen.board) == 1
+    key(screen, pygame.K_RIGHT)
+    assert screen.level is None and screen.scroll == 0
+
+    # Sem nível escolhido, só há o placar geral e o subtítulo não é clicável
+    screen = open_ranking(game)
+    assert screen.hit_index.hit(screen.subtitle_area.center) is None
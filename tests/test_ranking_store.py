@@ -0,0 +1,49 @@
+import json
+
+from jogo.ranking_store import RankingStore
+
+
+def test_pending_scores_are_written_on_close(tmp_path):
+    db = tmp_path / "ranking.db"
+    store = RankingStore(str(db), flush_interval=60)
+    store.add_score("ana", 10, "medio", "naturais")
+    store.add_score("ana", 5, "medio", "exatas")
+    store.add_score("bia", 7)
+    assert store.board().top(2) == [("ana", 15), ("bia", 7)]  # Já visível antes da gravação
+    store.close()
+
+    reopened = RankingStore(str(db), flush_interval=60)
+    try:
+        assert reopened.board().top(2) == [("ana", 15), ("bia", 7)]
+        assert reopened.board("medio").top(5) == [("ana", 15)]
+        assert reopened.board("medio", "naturais").top(5) == [("ana", 10)]
+    finally:
+        reopened.close()
+
+
+def test_scores_accumulate_across_sessions(tmp_path):
+    db = str(tmp_path / "ranking.db")
+    for _ in range(3):
+        store = RankingStore(db, flush_interval=60)
+        store.add_score("ana", 4, "facil", "exatas")
+        store.close()
+    store = RankingStore(db, flush_interval=60)
+    try:
+        assert store.board().score("ana") == 12
+        assert store.board("facil", "exatas").score("ana") == 12
+    finally:
+        store.close()
+
+
+def test_legacy_json_is_imported_once(tmp_path):
+    legacy = tmp_path / "ranking_data.json"
+    legacy.write_text(json.dumps({"ana": 30, "bia": 20}), encoding="utf-8")
+    db = str(tmp_path / "ranking.db")
+    RankingStore(db, legacy_json=str(legacy), flush_interval=60).close()
+
+    legacy.write_text(json.dumps({"caio": 99}), encoding="utf-8")  # Não é lido de novo: o banco já tem ranking
+    store = RankingStore(db, legacy_json=str(legacy), flush_interval=60)
+    try:
+        assert store.board().top(5) == [("ana", 30), ("bia", 20)]
+    finally:
+        store.close()
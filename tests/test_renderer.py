@@ -0,0 +1,57 @@
+import pygame
+
+from jogo.renderer import DirtyRectRenderer
+
+
+class RecordingRenderer(DirtyRectRenderer):
+    """Renderer que guarda as regiões enviadas em vez de atualizar o display."""
+
+    def __init__(self, enabled=True):
+        super().__init__(enabled)
+        self.flushed = []
+
+    def _flush(self, rects):
+        self.flushed.append(None if rects is None else [tuple(rect) for rect in rects])
+
+
+def frame(renderer, scene, widgets):
+    renderer.begin_frame(scene)
+    for key, rect, state in widgets:
+        renderer.track(key, rect, state)
+    renderer.present()
+    return renderer.flushed[-1] if renderer.flushed else []
+
+
+def test_only_changed_widgets_are_sent():
+    renderer = RecordingRenderer()
+    scene = object()
+    button = ("button", (10, 10, 50, 20), "normal")
+    label = ("label", (100, 10, 80, 20), "Olá")
+    assert frame(renderer, scene, [button, label]) is None  # Primeiro frame da tela: janela inteira
+
+    renderer.flushed.clear()
+    assert frame(renderer, scene, [button, label]) == []  # Nada mudou: nada é enviado
+    assert not renderer.flushed
+
+    # Estado novo na mesma posição: só a região do widget
+    assert frame(renderer, scene, [button, ("label", (100, 10, 80, 20), "Tchau")]) == [(100, 10, 80, 20)] * 2
+
+
+def test_moved_and_removed_widgets_send_old_and_new_regions():
+    renderer = RecordingRenderer()
+    scene = object()
+    frame(renderer, scene, [("popup", (0, 0, 40, 40), 1), ("hint", (50, 50, 10, 10), 1)])
+    flushed = frame(renderer, scene, [("popup", (5, 0, 40, 40), 1)])
+    assert sorted(flushed) == [(0, 0, 40, 40), (5, 0, 40, 40), (50, 50, 10, 10)]
+
+
+def test_scene_change_and_invalidate_send_the_whole_window():
+    renderer = RecordingRenderer()
+    first, second = object(), object()
+    widgets = [("button", pygame.Rect(0, 0, 10, 10), "normal")]
+    frame(renderer, first, widgets)
+    assert frame(renderer, second, widgets) is None
+    frame(renderer, second, widgets)
+    renderer.invalidate()
+    assert frame(renderer, second, widgets) is None
+    assert frame(RecordingRenderer(enabled=False), first, []) is None
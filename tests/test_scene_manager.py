@@ -0,0 +1,48 @@
+from jogo.scene_manager import SceneManager
+
+
+class FakeScene:
+    """Tela mínima que registra as chamadas do ciclo de vida."""
+
+    def __init__(self, name, log):
+        self.name = name
+        self.log = log
+
+    def on_enter(self, **kwargs):
+        self.log.append((self.name, "enter", kwargs))
+
+    def on_resume(self):
+        self.log.append((self.name, "resume"))
+
+    def on_exit(self):
+        self.log.append((self.name, "exit"))
+
+
+def test_push_and_pop_call_the_lifecycle_hooks():
+    log, changes = [], []
+    manager = SceneManager(on_change=lambda: changes.append(manager.top.name if manager.top else None))
+    menu, ranking = FakeScene("menu", log), FakeScene("ranking", log)
+
+    manager.push(menu)
+    manager.push(ranking, level="medio")
+    assert manager.top is ranking
+    assert manager.pop() is ranking
+    assert manager.top is menu
+    assert log == [("menu", "enter", {}), ("ranking", "enter", {"level": "medio"}), ("ranking", "exit"), ("menu", "resume")]
+    assert changes == ["menu", "ranking", "menu"]  # on_change já vê a pilha nova
+
+
+def test_pop_to_unwinds_until_the_scene():
+    log = []
+    manager = SceneManager()
+    scenes = [FakeScene(name, log) for name in ("menu", "materias", "jogo", "popup")]
+    for scene in scenes:
+        manager.push(scene)
+    log.clear()
+
+    manager.pop_to(scenes[1])
+    assert manager.stack == scenes[:2]
+    assert log == [("popup", "exit"), ("jogo", "exit"), ("materias", "resume")]
+    manager.pop()
+    manager.pop()
+    assert manager.pop() is None and manager.top is None
@@ -0,0 +1,98 @@
+import hashlib
+import json
+import os
+
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from jogo import config
+from jogo.benchmark import FUNDAMENTAL, INICIAR, JOGAR, MATEMATICA, PORTUGUES, SETA_POPUP, ScriptedScheduler
+from jogo.game import Game
+from jogo.session_recorder import LOG_VERSION, RecordingScheduler, _deserialize_event, _serialize_event, read_log, replay_session
+
+# Uma partida: escolhe nível e matérias, acerta duas perguntas (a seta do popup só
+# aceita cliques após 500 ms) e fecha o jogo no meio da terceira
+SESSION = [
+    ("wait_scene", "main_menu"), ("click", JOGAR), ("wait_scene", "subjects_menu"), ("idle", 3),
+    ("click", FUNDAMENTAL), ("idle", 2), ("click", MATEMATICA), ("click", PORTUGUES), ("click", INICIAR),
+    ("wait_scene", "game_screen"), ("idle", 3),
+] + [step for _ in range(2) for step in (("answer", None), ("idle", 130), ("click", SETA_POPUP), ("idle", 3))]
+
+
+class ScriptedRecording(RecordingScheduler):
+    """Gravador alimentado pelo roteiro do benchmark em vez da entrada real."""
+
+    def __init__(self, path, steps):
+        super().__init__(path, fps=config.FPS, idle_timeout_ms=config.IDLE_TIMEOUT_MS)
+        self.script = ScriptedScheduler(steps, config.FPS, config.IDLE_TIMEOUT_MS)
+
+    def attach(self, game):
+        super().attach(game)
+        self.script.game = game
+
+    def wait_events(self, animating=False):
+        for event in self.script._next_frame_events(self.game.scene_name(self.game.scenes.top)):
+            pygame.event.post(event)
+        return super().wait_events(animating=True)
+
+
+def digest(path):
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def played_ids(game):
+    return [question.get("id") for question in game._built_scenes["game_screen"].all_loaded_questions]
+
+
+@pytest.fixture
+def game_env(game_env, monkeypatch):
+    # A dificuldade adaptativa usa as estatísticas gravadas no cabeçalho do log
+    monkeypatch.setattr(config, "ADAPTIVE_DIFFICULTY", True)
+    return game_env
+
+
+def record(path, seed):
+    game = Game(scheduler=ScriptedRecording(str(path), SESSION), seed=seed, player_name="ana")
+    game.run()
+    return played_ids(game)
+
+
+def test_record_replay_round_trip(game_env):
+    record(game_env / "a.jsonl", seed=3)  # Deixa contadores em question_stats antes da gravação
+    recorded = record(game_env / "b.jsonl", seed=7)
+    assert record(game_env / "c.jsonl", seed=7) != recorded  # Os contadores mudaram a ordem das perguntas
+    real_dbs = {path: digest(path) for path in (config.RANKING_DB, config.QUESTION_STATS_DB)}
+
+    for _ in range(2):  # Um replay não pode afetar o seguinte
+        game, scheduler = replay_session(str(game_env / "b.jsonl"), fast=True)
+        assert scheduler.finished
+        assert played_ids(game) == recorded
+    assert {path: digest(path) for path in real_dbs} == real_dbs
+    assert config.RANKING_DB == str(game_env / "ranking.db")  # Configuração restaurada
+
+
+def test_log_format(game_env):
+    record(game_env / "sessao.jsonl", seed=1)
+    header, batches = read_log(str(game_env / "sessao.jsonl"))
+    assert header["version"] == LOG_VERSION and header["seed"] == 1 and header["player"] == "ana"
+    assert header["adaptive_difficulty"] is True and header["question_stats"] == []
+    assert [batch["frame"] for batch in batches] == sorted(batch["frame"] for batch in batches)
+    assert batches[0]["scene"] == "main_menu"
+    assert all(batch["events"] for batch in batches)
+
+    lines = (game_env / "sessao.jsonl").read_text(encoding="utf-8").splitlines()
+    lines[0] = json.dumps({**header, "version": LOG_VERSION - 1})
+    (game_env / "antigo.jsonl").write_text("\n".join(lines), encoding="utf-8")
+    with pytest.raises(ValueError, match="versão não suportada"):
+        read_log(str(game_env / "antigo.jsonl"))
+
+
+def test_event_serialization():
+    event = pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(10, 20), button=1, window=object())
+    data = json.loads(json.dumps(_serialize_event(event)))
+    restored = _deserialize_event(data)
+    assert restored.type == pygame.MOUSEBUTTONDOWN
+    assert restored.pos == (10, 20) and restored.button == 1
+    assert not hasattr(restored, "window")  # Atributos não representáveis em JSON ficam de fora
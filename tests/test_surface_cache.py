@@ -0,0 +1,50 @@
+import os
+
+import pygame
+import pytest
+
+from jogo.surface_cache import SurfaceCache
+
+
+@pytest.fixture
+def source(tmp_path):
+    surface = pygame.Surface((8, 6), pygame.SRCALPHA, 32)
+    surface.fill((10, 20, 30, 200))
+    path = tmp_path / "botao.png"
+    pygame.image.save(surface, str(path))
+    return str(path), surface
+
+
+def test_round_trip_keeps_pixels(tmp_path, source):
+    path, surface = source
+    cache = SurfaceCache(str(tmp_path / "cache"))
+    assert cache.load(path, ("scale", 0.5), "RGBA") is None
+    cache.store(path, ("scale", 0.5), "RGBA", surface)
+
+    loaded = cache.load(path, ("scale", 0.5), "RGBA")
+    assert loaded.get_size() == (8, 6)
+    assert pygame.image.tobytes(loaded, "RGBA") == pygame.image.tobytes(surface, "RGBA")
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_key_includes_size_and_pixel_format(tmp_path, source):
+    path, surface = source
+    cache = SurfaceCache(str(tmp_path / "cache"))
+    cache.store(path, ("size", 8, 6), "RGBA", surface)
+    assert cache.load(path, ("size", 16, 12), "RGBA") is None
+    assert cache.load(path, ("size", 8, 6), "RGB") is None
+    assert cache.load(path, ("size", 8, 6), "RGBA") is not None
+
+
+def test_changed_source_invalidates_and_replaces_the_entry(tmp_path, source):
+    path, surface = source
+    cache_dir = tmp_path / "cache"
+    cache = SurfaceCache(str(cache_dir))
+    cache.store(path, ("raw",), "RGBA", surface)
+
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))  # Arquivo fonte editado
+    assert cache.load(path, ("raw",), "RGBA") is None
+    cache.store(path, ("raw",), "RGBA", surface)
+    assert len(os.listdir(cache_dir)) == 1  # A versão antiga foi removida
+    assert cache.clear() == 1
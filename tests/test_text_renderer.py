@@ -0,0 +1,45 @@
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from jogo.text_renderer import TextRenderer
+
+QUESTION = "Qual é o resultado da soma de todos os números inteiros entre um e dez, incluindo os extremos?"
+
+
+@pytest.fixture
+def font():
+    pygame.font.init()
+    return pygame.font.Font(None, 24)
+
+
+def test_lines_fit_and_keep_every_word(font):
+    renderer = TextRenderer()
+    lines = renderer.wrap_lines(QUESTION + "\nDica: some os pares.", font, 200)
+    assert len(lines) > 2
+    assert all(font.size(line)[0] <= 200 for line in lines)
+    assert " ".join(lines).split() == (QUESTION + " Dica: some os pares.").split()
+    # Palavra maior que a largura vira uma linha sozinha (sem laço infinito)
+    assert renderer.wrap_lines("a " + "x" * 80 + " b", font, 50) == ("a", "x" * 80, "b")
+
+
+def test_repeated_text_is_served_from_the_cache(font):
+    renderer = TextRenderer()
+    surfaces = renderer.wrap(QUESTION, font, 300)
+    assert renderer.wrap(QUESTION, font, 300) is surfaces
+    assert renderer.render("Geral", font) is renderer.render("Geral", font)
+    assert renderer.render("Geral", font, (255, 0, 0)) is not renderer.render("Geral", font)
+    stats = renderer.stats()
+    assert stats["hits"] == 3 and stats["misses"] == 4  # wrap + suas linhas + 2 renders
+
+
+def test_least_recently_used_entry_is_evicted(font):
+    renderer = TextRenderer(max_entries=2)
+    first = renderer.render("um", font)
+    renderer.render("dois", font)
+    renderer.render("um", font)  # "dois" passa a ser a menos usada
+    renderer.render("três", font)
+    assert renderer.render("um", font) is first
+    misses = renderer.misses
+    renderer.render("dois", font)
+    assert renderer.misses == misses + 1
@@ -0,0 +1,41 @@
+import pytest
+
+pygame = pytest.importorskip("pygame")
+
+from jogo.renderer import DirtyRectRenderer, TextureRenderer, create_renderer
+
+
+@pytest.fixture
+def display(monkeypatch):
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    pygame.display.init()
+    yield
+    pygame.display.quit()
+
+
+def test_create_renderer_picks_the_backend(capsys):
+    assert type(create_renderer("surface")) is DirtyRectRenderer
+    texture = create_renderer("texture", enabled=False, software=True)
+    assert isinstance(texture, TextureRenderer) and texture.software and not texture.enabled
+    assert type(create_renderer("opengl")) is DirtyRectRenderer  # Desconhecido: volta ao padrão
+    assert "desconhecido" in capsys.readouterr().out
+
+
+def test_software_texture_backend_presents_the_logical_screen(display):
+    renderer = TextureRenderer(software=True)
+    canvas = renderer.open_window((64, 48), "teste")
+    assert canvas.get_size() == (64, 48) and renderer.sdl_renderer.logical_size == (64, 48)
+
+    scene = object()
+    for color in ((255, 0, 0), (0, 255, 0)):
+        renderer.begin_frame(scene)
+        canvas.fill((0, 0, 0))
+        canvas.fill(color, (8, 8, 16, 16))
+        renderer.track("box", (8, 8, 16, 16), color)
+        renderer.present()  # Primeiro frame inteiro, depois só a região do widget
+        shown = renderer.sdl_renderer.to_surface()
+        assert shown.get_at((10, 10))[:3] == color and shown.get_at((40, 40))[:3] == (0, 0, 0)
+
+    # Alternar o fullscreen mantém a mesma tela lógica
+    assert renderer.open_window((64, 48), "teste", fullscreen=True) is canvas
+    assert renderer.fullscreen